@@ -1,10 +1,11 @@
 """Data analysis for dashboard recommendations."""
 
+import asyncio
 import os
-from typing import Any
-
-from pydantic_ai import Agent
-from pydantic_ai.settings import ModelSettings
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from ..model_utils import parse_model_string, get_model_settings
 from .fingerprint import analyze_field, compute_schema_fingerprint
@@ -17,6 +18,14 @@ from .models import (
 )
 from .repository import ConfigRepository
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
+# Max characters of sample values shown per field in the LLM prompt
+SAMPLE_CHAR_BUDGET = 120
+
+# Max distribution patterns emitted; keeps prompt size bounded on wide schemas
+MAX_DISTRIBUTION_PATTERNS = 5
 
 ANALYSIS_INSTRUCTIONS = """You are a data visualization expert analyzing datasets to recommend dashboard designs.
 
@@ -43,31 +52,91 @@ Guidelines for questions:
 Provide practical, actionable recommendations for business dashboards."""
 
 
+@dataclass
+class FieldAnalysisSet:
+    """Analyzed fields, kept both in input order and bucketed by type."""
+
+    all: list[FieldAnalysis] = field(default_factory=list)
+    by_type: defaultdict[str, list[FieldAnalysis]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+    def add(self, analysis: FieldAnalysis) -> None:
+        """Append a field to both views."""
+        self.all.append(analysis)
+        self.by_type[analysis.type].append(analysis)
+
+
+@lru_cache(maxsize=8)
+def _build_agent(model_string: str) -> "Agent[None, AnalysisResult]":
+    """Build the analysis agent for a model string.
+
+    Cached so analyzers using the same model share one agent. pydantic_ai is
+    imported here so rule-based analysis never loads the LLM SDKs.
+    """
+    from pydantic_ai import Agent
+
+    model, _ = parse_model_string(model_string)
+    return Agent(
+        model,
+        output_type=AnalysisResult,
+        instructions=ANALYSIS_INSTRUCTIONS,
+        # Instructions and the output schema are identical on every call
+        model_settings=get_model_settings(model_string, cache_prompt=True),
+    )
+
+
+# Static questions are frozen models, so one instance is shared across calls
+_PURPOSE_QUESTION = AnalysisQuestion(
+    id="purpose",
+    question="What is the primary purpose of this dashboard?",
+    options=[
+        "Executive summary (high-level KPIs)",
+        "Operational monitoring (real-time status)",
+        "Detailed analysis (exploration)",
+    ],
+    required=True,
+)
+
+_TIME_RANGE_QUESTION = AnalysisQuestion(
+    id="time_range",
+    question="What time range should the dashboard focus on?",
+    options=[
+        "All available data",
+        "Most recent period",
+        "Specific comparison periods",
+    ],
+)
+
+
 class DataAnalyzer:
     """Analyzes data to generate dashboard recommendations."""
 
-    def __init__(self, model: str | None = None, use_llm: bool = True):
+    def __init__(
+        self,
+        model: str | None = None,
+        use_llm: bool = True,
+        max_concurrent_llm: int = 5,
+    ):
         """Initialize the analyzer.
 
         Args:
             model: LLM model identifier (e.g., "openai:gpt-4o")
             use_llm: Whether to use LLM for analysis (False = rule-based only)
+            max_concurrent_llm: Maximum in-flight LLM requests in analyze_batch
         """
         self.use_llm = use_llm
-        model_string = model or os.environ.get("AECH_LLM_WORKER_MODEL", "anthropic:claude-sonnet-4-20250514")
-        self.model, _ = parse_model_string(model_string)
-        self._model_settings = get_model_settings(model_string)
-
-        if use_llm:
-            self.agent: Agent[None, AnalysisResult] = Agent(
-                self.model,
-                output_type=AnalysisResult,
-                instructions=ANALYSIS_INSTRUCTIONS,
-                model_settings=self._model_settings,
-            )
+        self.max_concurrent_llm = max_concurrent_llm
+        self._model_string = model or os.environ.get("AECH_LLM_WORKER_MODEL", "anthropic:claude-sonnet-4-20250514")
+        self.model, _ = parse_model_string(self._model_string)
 
         self.repository = ConfigRepository()
 
+    @property
+    def agent(self) -> "Agent[None, AnalysisResult]":
+        """LLM agent, built on first use and shared across analyzers."""
+        return _build_agent(self._model_string)
+
     def analyze(
         self, data: dict[str, Any], include_questions: bool = True
     ) -> AnalysisResult:
@@ -81,24 +150,21 @@ class DataAnalyzer:
             AnalysisResult with field analysis, patterns, suggestions, and questions
         """
         # First, do rule-based analysis
-        fields = self._analyze_fields(data)
-        patterns = self._detect_patterns(fields, data)
-        suggestions = self._suggest_widgets(fields, patterns)
-        fingerprint = compute_schema_fingerprint(data)
-
-        # Find matching configs
-        matching = self.repository.find_by_fingerprint(fingerprint)
-        matching_names = [c.name for c in matching]
+        field_set, patterns, suggestions, fingerprint, matching_names = (
+            self._rule_based_analysis(data)
+        )
 
         if self.use_llm and include_questions:
             # Use LLM to enhance analysis and generate questions
-            return self._llm_analyze(fields, patterns, suggestions, fingerprint, matching_names, data)
+            return self._llm_analyze(
+                field_set, patterns, suggestions, fingerprint, matching_names, data
+            )
 
         # Rule-based questions
-        questions = self._generate_questions(fields, patterns) if include_questions else []
+        questions = self._generate_questions(field_set, patterns) if include_questions else []
 
         return AnalysisResult(
-            fields=fields,
+            fields=field_set.all,
             patterns=patterns,
             suggested_widgets=suggestions,
             questions=questions,
@@ -106,86 +172,147 @@ class DataAnalyzer:
             matching_configs=matching_names,
         )
 
-    def _analyze_fields(self, data: dict[str, Any]) -> list[FieldAnalysis]:
-        """Analyze each field in the data."""
-        fields = []
+    async def analyze_batch(
+        self, datasets: list[dict[str, Any]], include_questions: bool = True
+    ) -> list[AnalysisResult]:
+        """Analyze several datasets, running LLM requests concurrently.
+
+        Rule-based analysis runs inline; LLM requests are limited to
+        max_concurrent_llm in flight at once.
+
+        Args:
+            datasets: List of data dictionaries (same shape as analyze())
+            include_questions: Whether to include clarifying questions
+
+        Returns:
+            AnalysisResult for each dataset, in input order
+        """
+        if not (self.use_llm and include_questions):
+            return [self.analyze(data, include_questions) for data in datasets]
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_llm)
+
+        async def analyze_one(data: dict[str, Any]) -> AnalysisResult:
+            prepared = self._rule_based_analysis(data)
+            async with semaphore:
+                return await self._llm_analyze_async(*prepared, data)
+
+        return list(await asyncio.gather(*(analyze_one(data) for data in datasets)))
+
+    def _rule_based_analysis(
+        self, data: dict[str, Any]
+    ) -> tuple[
+        FieldAnalysisSet,
+        list[DataPattern],
+        list[WidgetSuggestion],
+        str,
+        list[str],
+    ]:
+        """Run field analysis, pattern detection, and config matching.
+
+        Returns:
+            Tuple of (field_set, patterns, suggestions, fingerprint, matching_names)
+        """
+        field_set = self._analyze_fields(data)
+        patterns = self._detect_patterns(field_set, data)
+        suggestions = self._suggest_widgets(field_set, patterns)
+        fingerprint = compute_schema_fingerprint(
+            data, field_types={f.name: f.type for f in field_set.all}
+        )
+
+        # Find matching configs
+        matching = self.repository.find_by_fingerprint(fingerprint)
+        matching_names = [c.name for c in matching]
+
+        return field_set, patterns, suggestions, fingerprint, matching_names
+
+    def _analyze_fields(self, data: dict[str, Any]) -> FieldAnalysisSet:
+        """Analyze each field in the data, bucketing by type as we go."""
+        field_set = FieldAnalysisSet()
         for name, values in data.items():
             if isinstance(values, list):
-                analysis = analyze_field(name, values)
-                fields.append(FieldAnalysis.model_validate(analysis))
-        return fields
+                # analyze_field builds well-typed dicts, so skip revalidation
+                field_set.add(FieldAnalysis.model_construct(**analyze_field(name, values)))
+        return field_set
 
     def _detect_patterns(
-        self, fields: list[FieldAnalysis], data: dict[str, Any]
+        self, field_set: FieldAnalysisSet, data: dict[str, Any]
     ) -> list[DataPattern]:
         """Detect patterns in the data based on field types."""
         patterns = []
 
         # Find temporal fields
-        temporal_fields = [f for f in fields if f.type == "temporal"]
-        numeric_fields = [f for f in fields if f.type == "numeric"]
-        categorical_fields = [f for f in fields if f.type == "categorical"]
+        temporal_fields = field_set.by_type.get("temporal", [])
+        numeric_fields = field_set.by_type.get("numeric", [])
+        categorical_fields = field_set.by_type.get("categorical", [])
+        numeric_names = [f.name for f in numeric_fields]
+        top_numeric_names = numeric_names[:2]
 
         # Time series pattern
         if temporal_fields and numeric_fields:
+            time_name = temporal_fields[0].name
             patterns.append(
-                DataPattern(
+                DataPattern.model_construct(
                     pattern_type="time_series",
                     confidence=0.9,
-                    involved_fields=[temporal_fields[0].name] + [f.name for f in numeric_fields],
-                    description=f"Temporal trend: {', '.join(f.name for f in numeric_fields)} over {temporal_fields[0].name}",
+                    involved_fields=[time_name, *numeric_names],
+                    description=f"Temporal trend: {', '.join(numeric_names)} over {time_name}",
                 )
             )
 
         # Categorical comparison pattern
         if categorical_fields and numeric_fields:
+            category_name = categorical_fields[0].name
             patterns.append(
-                DataPattern(
+                DataPattern.model_construct(
                     pattern_type="comparison",
                     confidence=0.85,
-                    involved_fields=[categorical_fields[0].name] + [f.name for f in numeric_fields[:2]],
-                    description=f"Compare {', '.join(f.name for f in numeric_fields[:2])} across {categorical_fields[0].name}",
+                    involved_fields=[category_name, *top_numeric_names],
+                    description=f"Compare {', '.join(top_numeric_names)} across {category_name}",
                 )
             )
 
-        # Distribution pattern (single numeric)
-        if len(numeric_fields) >= 1:
-            for nf in numeric_fields:
-                if nf.cardinality > 10:  # Enough variation
-                    patterns.append(
-                        DataPattern(
-                            pattern_type="distribution",
-                            confidence=0.7,
-                            involved_fields=[nf.name],
-                            description=f"Distribution of {nf.name}",
-                        )
-                    )
+        # Distribution pattern (single numeric), limited to the most varied fields
+        varied_fields = [nf for nf in numeric_fields if nf.cardinality > 10]
+        if len(varied_fields) > MAX_DISTRIBUTION_PATTERNS:
+            varied_fields = sorted(
+                varied_fields, key=lambda f: f.cardinality, reverse=True
+            )[:MAX_DISTRIBUTION_PATTERNS]
+        for nf in varied_fields:
+            patterns.append(
+                DataPattern.model_construct(
+                    pattern_type="distribution",
+                    confidence=0.7,
+                    involved_fields=[nf.name],
+                    description=f"Distribution of {nf.name}",
+                )
+            )
 
         # Relationship pattern (multiple numerics)
         if len(numeric_fields) >= 2:
             patterns.append(
-                DataPattern(
+                DataPattern.model_construct(
                     pattern_type="relationship",
                     confidence=0.6,
-                    involved_fields=[f.name for f in numeric_fields[:2]],
-                    description=f"Relationship between {numeric_fields[0].name} and {numeric_fields[1].name}",
+                    involved_fields=top_numeric_names,
+                    description=f"Relationship between {top_numeric_names[0]} and {top_numeric_names[1]}",
                 )
             )
 
         return patterns
 
     def _suggest_widgets(
-        self, fields: list[FieldAnalysis], patterns: list[DataPattern]
+        self, field_set: FieldAnalysisSet, patterns: list[DataPattern]
     ) -> list[WidgetSuggestion]:
         """Suggest widgets based on field analysis and patterns."""
         suggestions = []
         priority = 1
 
         # KPI cards for key numeric metrics
-        numeric_fields = [f for f in fields if f.type == "numeric"]
+        numeric_fields = field_set.by_type.get("numeric", [])
         for nf in numeric_fields[:3]:  # Top 3 as KPIs
             suggestions.append(
-                WidgetSuggestion(
+                WidgetSuggestion.model_construct(
                     widget_type="kpi",
                     data_fields=[nf.name],
                     reason=f"Highlight {nf.name} as a key metric",
@@ -198,7 +325,7 @@ class DataAnalyzer:
         for pattern in patterns:
             if pattern.pattern_type == "time_series":
                 suggestions.append(
-                    WidgetSuggestion(
+                    WidgetSuggestion.model_construct(
                         widget_type="chart",
                         chart_type="line",
                         data_fields=pattern.involved_fields,
@@ -209,7 +336,7 @@ class DataAnalyzer:
                 priority += 1
             elif pattern.pattern_type == "comparison":
                 suggestions.append(
-                    WidgetSuggestion(
+                    WidgetSuggestion.model_construct(
                         widget_type="chart",
                         chart_type="bar",
                         data_fields=pattern.involved_fields,
@@ -220,7 +347,7 @@ class DataAnalyzer:
                 priority += 1
             elif pattern.pattern_type == "relationship":
                 suggestions.append(
-                    WidgetSuggestion(
+                    WidgetSuggestion.model_construct(
                         widget_type="chart",
                         chart_type="scatter",
                         data_fields=pattern.involved_fields,
@@ -233,30 +360,17 @@ class DataAnalyzer:
         return suggestions
 
     def _generate_questions(
-        self, fields: list[FieldAnalysis], patterns: list[DataPattern]
+        self, field_set: FieldAnalysisSet, patterns: list[DataPattern]
     ) -> list[AnalysisQuestion]:
         """Generate clarifying questions based on analysis."""
-        questions = []
-
         # Purpose question
-        questions.append(
-            AnalysisQuestion(
-                id="purpose",
-                question="What is the primary purpose of this dashboard?",
-                options=[
-                    "Executive summary (high-level KPIs)",
-                    "Operational monitoring (real-time status)",
-                    "Detailed analysis (exploration)",
-                ],
-                required=True,
-            )
-        )
+        questions = [_PURPOSE_QUESTION]
 
         # Key metrics question
-        numeric_fields = [f for f in fields if f.type == "numeric"]
+        numeric_fields = field_set.by_type.get("numeric", [])
         if len(numeric_fields) > 1:
             questions.append(
-                AnalysisQuestion(
+                AnalysisQuestion.model_construct(
                     id="key_metrics",
                     question="Which metrics should be most prominent?",
                     suggestions=[f.name for f in numeric_fields],
@@ -265,25 +379,15 @@ class DataAnalyzer:
             )
 
         # Time range question if temporal data
-        temporal_fields = [f for f in fields if f.type == "temporal"]
+        temporal_fields = field_set.by_type.get("temporal", [])
         if temporal_fields:
-            questions.append(
-                AnalysisQuestion(
-                    id="time_range",
-                    question="What time range should the dashboard focus on?",
-                    options=[
-                        "All available data",
-                        "Most recent period",
-                        "Specific comparison periods",
-                    ],
-                )
-            )
+            questions.append(_TIME_RANGE_QUESTION)
 
         return questions
 
     def _llm_analyze(
         self,
-        fields: list[FieldAnalysis],
+        field_set: FieldAnalysisSet,
         patterns: list[DataPattern],
         suggestions: list[WidgetSuggestion],
         fingerprint: str,
@@ -292,26 +396,64 @@ class DataAnalyzer:
     ) -> AnalysisResult:
         """Use LLM to enhance analysis and generate better questions."""
         # Build prompt with pre-analyzed data
-        prompt = self._build_llm_prompt(fields, patterns, data)
+        prompt = self._build_llm_prompt(field_set.all, patterns, data)
 
         try:
             result = self.agent.run_sync(prompt)
-            # Merge LLM results with our computed fingerprint and matching configs
-            output = result.output
-            output.schema_fingerprint = fingerprint
-            output.matching_configs = matching_names
-            return output
         except Exception:
             # Fallback to rule-based if LLM fails
-            return AnalysisResult(
-                fields=fields,
-                patterns=patterns,
-                suggested_widgets=suggestions,
-                questions=self._generate_questions(fields, patterns),
-                schema_fingerprint=fingerprint,
-                matching_configs=matching_names,
+            return self._fallback_result(
+                field_set, patterns, suggestions, fingerprint, matching_names
+            )
+
+        # Merge LLM results with our computed fingerprint and matching configs
+        output = result.output
+        output.schema_fingerprint = fingerprint
+        output.matching_configs = matching_names
+        return output
+
+    async def _llm_analyze_async(
+        self,
+        field_set: FieldAnalysisSet,
+        patterns: list[DataPattern],
+        suggestions: list[WidgetSuggestion],
+        fingerprint: str,
+        matching_names: list[str],
+        data: dict[str, Any],
+    ) -> AnalysisResult:
+        """Async variant of _llm_analyze using the agent's native async API."""
+        prompt = self._build_llm_prompt(field_set.all, patterns, data)
+
+        try:
+            result = await self.agent.run(prompt)
+        except Exception:
+            return self._fallback_result(
+                field_set, patterns, suggestions, fingerprint, matching_names
             )
 
+        output = result.output
+        output.schema_fingerprint = fingerprint
+        output.matching_configs = matching_names
+        return output
+
+    def _fallback_result(
+        self,
+        field_set: FieldAnalysisSet,
+        patterns: list[DataPattern],
+        suggestions: list[WidgetSuggestion],
+        fingerprint: str,
+        matching_names: list[str],
+    ) -> AnalysisResult:
+        """Build a rule-based result when the LLM call fails."""
+        return AnalysisResult(
+            fields=field_set.all,
+            patterns=patterns,
+            suggested_widgets=suggestions,
+            questions=self._generate_questions(field_set, patterns),
+            schema_fingerprint=fingerprint,
+            matching_configs=matching_names,
+        )
+
     def _build_llm_prompt(
         self,
         fields: list[FieldAnalysis],
@@ -319,27 +461,24 @@ class DataAnalyzer:
         data: dict[str, Any],
     ) -> str:
         """Build prompt for LLM analysis."""
-        field_summary = "\n".join(
-            f"- {f.name}: {f.type}, {f.cardinality} unique values, sample: {f.sample_values[:3]}"
-            for f in fields
-        )
-
-        pattern_summary = "\n".join(
-            f"- {p.pattern_type}: {p.description} (confidence: {p.confidence:.0%})"
-            for p in patterns
-        )
+        parts: list[str] = ["Analyze this dataset for dashboard visualization recommendations.\n\n## Fields\n"]
 
-        return f"""Analyze this dataset for dashboard visualization recommendations.
+        for f in fields:
+            sample = ", ".join(map(str, f.sample_values[:3]))
+            if len(sample) > SAMPLE_CHAR_BUDGET:
+                sample = sample[: SAMPLE_CHAR_BUDGET - 3] + "..."
+            parts.append(f"- {f.name}: {f.type}, {f.cardinality} unique values, sample: [{sample}]\n")
 
-## Fields
-{field_summary}
-
-## Detected Patterns
-{pattern_summary}
+        parts.append("\n## Detected Patterns\n")
+        for p in patterns:
+            parts.append(f"- {p.pattern_type}: {p.description} (confidence: {p.confidence:.0%})\n")
 
+        parts.append("""
 ## Task
 1. Confirm or refine the detected patterns
 2. Suggest specific widget types and configurations
 3. Generate 2-4 clarifying questions to refine the dashboard design
 
-Focus on practical business dashboard recommendations."""
+Focus on practical business dashboard recommendations.""")
+
+        return "".join(parts)
@@ -2,13 +2,46 @@
 
 import hashlib
 import json
+import re
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 
+# Date formats recognized as temporal values
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y-%m",
+    "%Y",
+)
+
+# Loose superset of the shapes strptime accepts for DATE_FORMATS. Strings that
+# don't match can't parse with any format, so they skip the strptime attempts.
+_TEMPORAL_RE = re.compile(
+    r"\d{4}(?:[-/]\s?\d{1,2}(?:[-/]\s?\d{1,2}"
+    r"(?:(?:T|\s+)\s?\d{1,2}:\s?\d{1,2}:\s?\d{1,2}Z?)?)?)?"
+    r"|\s?\d{1,2}/\s?\d{1,2}/\d{4}",
+    re.IGNORECASE,
+)
+
+# Columns longer than this are classified from an evenly strided sample
+_SAMPLE_CAP = 512
+
+
 def infer_field_type(values: list[Any]) -> str:
     """Infer the type of a field from sample values.
 
+    Not memoized: a key over the column costs as much as classifying it.
+    Callers that already know a column's type pass it on instead (see
+    compute_schema_fingerprint's field_types).
+
     Args:
         values: List of values from the field
 
@@ -18,57 +51,73 @@ def infer_field_type(values: list[Any]) -> str:
     if not values:
         return "null"
 
-    # Filter out None values for analysis
-    non_null = [v for v in values if v is not None]
-    if not non_null:
+    # Type inference is statistical - scan a strided sample of large columns
+    sample = values[:: len(values) // _SAMPLE_CAP] if len(values) > _SAMPLE_CAP else values
+
+    # Count value kinds in a single pass, skipping None values
+    non_null_count = 0
+    dict_count = list_count = bool_count = numeric_count = 0
+    strings: list[str] = []
+    for v in sample:
+        if v is None:
+            continue
+        non_null_count += 1
+        if isinstance(v, str):
+            strings.append(v)
+        elif isinstance(v, bool):  # bool is an int subclass - check first
+            bool_count += 1
+        elif isinstance(v, (int, float)):
+            numeric_count += 1
+        elif isinstance(v, dict):
+            dict_count += 1
+        elif isinstance(v, list):
+            list_count += 1
+
+    if not non_null_count:
         return "null"
 
-    # Check for nested objects (dicts)
-    if all(isinstance(v, dict) for v in non_null):
+    # Nested objects, nested arrays, booleans, numbers
+    if dict_count == non_null_count:
         return "object"
-
-    # Check for nested arrays
-    if all(isinstance(v, list) for v in non_null):
+    if list_count == non_null_count:
         return "array"
-
-    # Check for boolean
-    if all(isinstance(v, bool) for v in non_null):
+    if bool_count == non_null_count:
         return "boolean"
-
-    # Check for numeric
-    numeric_count = sum(1 for v in non_null if isinstance(v, (int, float)) and not isinstance(v, bool))
-    if numeric_count == len(non_null):
+    if numeric_count == non_null_count:
         return "numeric"
 
-    # Check for temporal (date/datetime strings)
-    temporal_count = 0
-    date_formats = [
-        "%Y-%m-%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y/%m/%d",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%Y-%m",
-        "%Y",
-    ]
-    for v in non_null:
-        if isinstance(v, str):
-            for fmt in date_formats:
-                try:
-                    datetime.strptime(v, fmt)
-                    temporal_count += 1
-                    break
-                except ValueError:
-                    continue
+    # Check for temporal (date/datetime strings) - only possible when
+    # strings alone can clear the 80% threshold
+    threshold = non_null_count * 0.8
+    if len(strings) > threshold:
+        temporal_count = 0
+        for v in strings:
+            if _TEMPORAL_RE.fullmatch(v):
+                # Regex only prefilters; strptime still validates ranges (e.g. month 13)
+                for fmt in DATE_FORMATS:
+                    try:
+                        datetime.strptime(v, fmt)
+                        temporal_count += 1
+                        break
+                    except ValueError:
+                        continue
 
-    if temporal_count > len(non_null) * 0.8:  # 80% threshold
-        return "temporal"
+        if temporal_count > threshold:
+            return "temporal"
 
     # Check for categorical (low cardinality strings)
-    if all(isinstance(v, str) for v in non_null):
-        unique_ratio = len(set(non_null)) / len(non_null)
+    if len(strings) == non_null_count:
+        if sample is values:
+            unique_ratio = len(set(strings)) / non_null_count
+        else:
+            # Unique ratio shrinks with column length, so measure it on the
+            # full column rather than the sample
+            try:
+                distinct = set(values)
+            except TypeError:
+                return "text"
+            distinct.discard(None)
+            unique_ratio = len(distinct) / (len(values) - values.count(None))
         if unique_ratio < 0.5:  # Less than 50% unique = categorical
             return "categorical"
         return "text"
@@ -77,7 +126,9 @@ def infer_field_type(values: list[Any]) -> str:
     return "text"
 
 
-def compute_schema_fingerprint(data: dict[str, Any]) -> str:
+def compute_schema_fingerprint(
+    data: dict[str, Any], field_types: dict[str, str] | None = None
+) -> str:
     """Create a deterministic hash of the data schema for matching.
 
     The fingerprint is based on field names and their inferred types,
@@ -85,40 +136,88 @@ def compute_schema_fingerprint(data: dict[str, Any]) -> str:
 
     Args:
         data: Dictionary with field names as keys and lists of values
+        field_types: Already-inferred types for list fields (skips re-inference)
 
     Returns:
         16-character hexadecimal fingerprint
     """
     schema: dict[str, str] = {}
+    known = field_types or {}
 
     for key, values in data.items():
         if isinstance(values, list):
-            # Infer type from list values
-            schema[key] = infer_field_type(values)
+            # Infer type from list values (reuse caller's analysis if given)
+            schema[key] = known.get(key) or infer_field_type(values)
         else:
             # Single value - use Python type
             schema[key] = type(values).__name__
 
     # Sort keys for deterministic output
-    canonical = json.dumps(schema, sort_keys=True)
-    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+    return _hash_schema(tuple(sorted(schema.items())))
+
+
+@lru_cache(maxsize=128)
+def _hash_schema(schema_items: tuple[tuple[str, str], ...]) -> str:
+    """Hash a sorted (field, type) schema into a 16-character fingerprint.
+
+    Fingerprints are persisted in the config index, so the canonical JSON
+    and SHA-256 must not change. Items arrive sorted, so insertion order
+    already matches sort_keys=True output.
+    """
+    canonical = json.dumps(dict(schema_items)).encode("ascii")
+    return hashlib.sha256(canonical).hexdigest()[:16]
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts/lists into hashable equivalents.
+
+    Dicts become frozensets of items, so key order doesn't affect equality.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
 def _safe_cardinality(values: list[Any]) -> int:
     """Compute cardinality, handling unhashable types like dicts."""
+    # Nested columns go straight to structural hashing instead of raising first
+    if not isinstance(values[0], (dict, list)):
+        try:
+            return len(set(values))
+        except TypeError:
+            pass
+
+    # Unhashable types (dicts, lists) - hash a frozen structural copy
+    seen = set()
+    for v in values:
+        try:
+            seen.add(_freeze(v))
+        except TypeError:
+            # Fallback: count as unique
+            seen.add(id(v))
+    return len(seen)
+
+
+def _numeric_summary(values: list[Any]) -> dict[str, float]:
+    """Compute min/max/mean of numeric values with vectorized reductions."""
+    import numpy as np
+
     try:
-        return len(set(values))
-    except TypeError:
-        # Unhashable types (dicts, lists) - use JSON serialization
-        seen = set()
-        for v in values:
-            try:
-                key = json.dumps(v, sort_keys=True, default=str)
-                seen.add(key)
-            except (TypeError, ValueError):
-                # Fallback: count as unique
-                seen.add(id(v))
-        return len(seen)
+        arr = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        # Stray non-numeric values (type was inferred from a sample) - keep numbers only
+        arr = np.fromiter(
+            (float(v) for v in values if isinstance(v, (int, float))),
+            dtype=np.float64,
+        )
+
+    return {
+        "min": float(arr.min()),
+        "max": float(arr.max()),
+        "mean": float(arr.mean()),
+    }
 
 
 def analyze_field(name: str, values: list[Any]) -> dict[str, Any]:
@@ -143,14 +242,8 @@ def analyze_field(name: str, values: list[Any]) -> dict[str, Any]:
     }
 
     if field_type == "numeric" and non_null:
-        numeric_vals = [float(v) for v in non_null]
-        analysis["summary"] = {
-            "min": min(numeric_vals),
-            "max": max(numeric_vals),
-            "mean": sum(numeric_vals) / len(numeric_vals),
-        }
+        analysis["summary"] = _numeric_summary(non_null)
     elif field_type == "categorical" and non_null:
-        from collections import Counter
         try:
             counts = Counter(non_null)
             analysis["summary"] = {
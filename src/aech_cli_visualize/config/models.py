@@ -1,10 +1,11 @@
 """Pydantic models for config repository."""
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ConfigMetadata(BaseModel):
@@ -18,8 +19,12 @@ class ConfigMetadata(BaseModel):
     tags: list[str] = Field(
         default_factory=list, description="Tags for categorization"
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    last_used_at: datetime | None = Field(default=None)
+    created_at: int = Field(
+        default_factory=lambda: int(time.time()), description="Creation time (epoch seconds, UTC)"
+    )
+    last_used_at: int | None = Field(
+        default=None, description="Last use time (epoch seconds, UTC)"
+    )
     usage_count: int = Field(default=0)
     schema_fingerprint: str = Field(
         default="", description="Hash of data schema for auto-matching"
@@ -29,6 +34,34 @@ class ConfigMetadata(BaseModel):
         default=None, description="Relative path to preview image"
     )
 
+    @field_validator("created_at", "last_used_at", mode="before")
+    @classmethod
+    def _coerce_timestamp(cls, value: Any) -> Any:
+        """Accept ISO datetimes written by older index files."""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        if isinstance(value, datetime):
+            # Older versions stored naive UTC datetimes
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return int(value.timestamp())
+        return value
+
+    @property
+    def created_datetime(self) -> datetime:
+        """Creation time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.created_at, timezone.utc)
+
+    @property
+    def last_used_datetime(self) -> datetime | None:
+        """Last use time as an aware UTC datetime, if ever used."""
+        if self.last_used_at is None:
+            return None
+        return datetime.fromtimestamp(self.last_used_at, timezone.utc)
+
 
 class ConfigIndex(BaseModel):
     """Index of all saved configurations."""
@@ -40,6 +73,8 @@ class ConfigIndex(BaseModel):
 class FieldAnalysis(BaseModel):
     """Analysis of a single data field."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Field name")
     type: str = Field(description="Inferred type: numeric, categorical, temporal, text")
     cardinality: int = Field(description="Number of unique values")
@@ -55,6 +90,8 @@ class FieldAnalysis(BaseModel):
 class DataPattern(BaseModel):
     """A detected pattern in the data."""
 
+    model_config = ConfigDict(frozen=True)
+
     pattern_type: str = Field(
         description="Pattern type: time_series, comparison, distribution, relationship"
     )
@@ -66,6 +103,8 @@ class DataPattern(BaseModel):
 class WidgetSuggestion(BaseModel):
     """A suggested widget for the dashboard."""
 
+    model_config = ConfigDict(frozen=True)
+
     widget_type: str = Field(description="Widget type: chart, kpi, table, gauge")
     chart_type: str | None = Field(
         default=None, description="Chart type if widget_type is chart"
@@ -80,6 +119,8 @@ class WidgetSuggestion(BaseModel):
 class AnalysisQuestion(BaseModel):
     """A clarifying question for the user."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique question ID")
     question: str = Field(description="The question to ask")
     options: list[str] | None = Field(
@@ -1,7 +1,7 @@
 """Config repository for storing and retrieving dashboard specifications."""
 
 import json
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +25,10 @@ class ConfigRepository:
         self.previews_dir = self.base_path / "previews"
         self.index_path = self.base_path / "index.json"
 
+        # Bumped on every index write; fingerprint lookups cached against it
+        self._version = 0
+        self._fingerprint_cache: dict[str, tuple[tuple[int, int], list[ConfigMetadata]]] = {}
+
         # Ensure directories exist
         self._ensure_dirs()
 
@@ -45,6 +49,7 @@ class ConfigRepository:
 
     def _write_index(self, index: ConfigIndex) -> None:
         """Write the config index."""
+        self._version += 1
         with open(self.index_path, "w") as f:
             json.dump(
                 index.model_dump(mode="json"),
@@ -163,7 +168,7 @@ class ConfigRepository:
         index = self._read_index()
         for config in index.configs:
             if config.id == metadata.id:
-                config.last_used_at = datetime.utcnow()
+                config.last_used_at = int(time.time())
                 config.usage_count += 1
                 break
         self._write_index(index)
@@ -182,8 +187,15 @@ class ConfigRepository:
         Returns:
             List of matching ConfigMetadata
         """
+        # Key on the index mtime too so writes from other processes invalidate
+        stamp = (self._version, self.index_path.stat().st_mtime_ns)
+        cached = self._fingerprint_cache.get(fingerprint)
+        if cached is not None and cached[0] == stamp:
+            return cached[1][:limit]
+
         index = self._read_index()
         matches = [c for c in index.configs if c.schema_fingerprint == fingerprint]
+        self._fingerprint_cache[fingerprint] = (stamp, matches)
         return matches[:limit]
 
     def find_by_data(
@@ -1,17 +1,21 @@
 """Dashboard composition engine for multi-widget layouts."""
 
+import copy
+import hashlib
+import json
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 from ..themes.loader import load_theme, apply_theme_to_figure
-from ..utils.export import export_figure, parse_resolution, FormatType
-from ..widgets.chart import ChartWidget
-from ..widgets.kpi import KPIWidget
-from ..widgets.table import TableWidget
-from ..widgets.gauge import GaugeWidget
+from ..utils.data import canonical_json
+from ..utils.export import export_figure, export_figures, parse_resolution, FormatType
 
 
 # Standard aspect ratios
@@ -22,37 +26,53 @@ ASPECT_RATIOS = {
 }
 
 # Style presets for different use cases
-STYLE_PRESETS = {
-    "compact": {
+STYLE_PRESETS: dict[str, MappingProxyType[str, Any]] = {
+    "compact": MappingProxyType({
         "font_scale": 0.8,
         "h_spacing": 0.015,
         "v_spacing": 0.03,
         "widget_padding": 10,
         "title_margin": 0.04,
-    },
-    "default": {
+    }),
+    "default": MappingProxyType({
         "font_scale": 1.0,
         "h_spacing": 0.02,
         "v_spacing": 0.04,
         "widget_padding": 15,
         "title_margin": 0.06,
-    },
-    "presentation": {
+    }),
+    "presentation": MappingProxyType({
         "font_scale": 1.45,
         "h_spacing": 0.10,
         "v_spacing": 0.10,
         "widget_padding": 22,
         "title_margin": -0.10,
-    },
-    "spacious": {
+    }),
+    "spacious": MappingProxyType({
         "font_scale": 1.2,
         "h_spacing": 0.04,
         "v_spacing": 0.07,
         "widget_padding": 30,
         "title_margin": 0.02,
-    },
+    }),
 }
 
+# Trace types positioned by a domain rather than by x/y axes
+DOMAIN_TRACE_TYPES = frozenset({
+    "funnelarea", "icicle", "indicator", "parcats", "parcoords",
+    "pie", "sankey", "sunburst", "table", "treemap",
+})
+
+# Cartesian trace types placed on per-widget xaxis/yaxis pairs
+XY_TRACE_TYPES = frozenset({"scatter", "scattergl", "bar"})
+
+
+# Composed figures keyed by canonical spec and theme JSON, least recently used first.
+# Entries keep the spec and theme each figure was built from.
+_COMPOSE_CACHE: OrderedDict[tuple[type, bytes, bytes], tuple[dict[str, Any], dict[str, Any], go.Figure]] = OrderedDict()
+_COMPOSE_CACHE_SIZE = 16
+_COMPOSE_CACHE_LOCK = threading.Lock()
+
 
 class DashboardComposer:
     """Compose multiple widgets into a single dashboard image."""
@@ -68,8 +88,21 @@ class DashboardComposer:
             spec: Dashboard specification with layout and widgets
             theme: Theme name or dictionary (overrides spec theme)
         """
-        self.spec = spec
         self.theme = load_theme(theme) if isinstance(theme, str) else theme
+        # Canonical theme JSON for the compose cache, built on first use
+        self._theme_key: bytes | None = None
+        self.update_spec(spec)
+
+    def update_spec(self, spec: dict[str, Any]) -> None:
+        """Swap in a new spec, keeping the resolved theme.
+
+        Lets one composer render successive revisions of a dashboard
+        (e.g., across validation iterations) without reloading the theme.
+
+        Args:
+            spec: Dashboard specification with layout and widgets
+        """
+        self.spec = spec
 
         # Extract layout settings
         layout = spec.get("layout", {})
@@ -84,31 +117,31 @@ class DashboardComposer:
         preset_name = style.get("preset", "default")
         preset = STYLE_PRESETS.get(preset_name, STYLE_PRESETS["default"])
 
-        # Style values (explicit values override preset)
-        self.font_scale = style.get("font_scale", preset["font_scale"])
-        self.h_spacing = style.get("h_spacing", preset["h_spacing"])
-        self.v_spacing = style.get("v_spacing", preset["v_spacing"])
-        self.widget_padding = style.get("widget_padding", preset["widget_padding"])
-        self.title_size = style.get("title_size", int(28 * self.font_scale))
+        # Effective style (explicit values override preset)
+        self._style = MappingProxyType({**preset, **style})
+        self.font_scale = self._style["font_scale"]
+        self.h_spacing = self._style["h_spacing"]
+        self.v_spacing = self._style["v_spacing"]
+        self.widget_padding = self._style["widget_padding"]
+        self.title_size = self._style.get("title_size", int(28 * self.font_scale))
         # Title margin: space reserved for title area (negative values push content up toward title)
-        default_title_margin = preset.get("title_margin", 0.06 if self.title else 0.02)
-        self.title_margin = style.get("title_margin", default_title_margin)
-
-    def _get_widget_type_category(self, widget_type: str) -> str:
-        """Categorize widget type for subplot handling.
-
-        Args:
-            widget_type: The widget type string
+        self.title_margin = self._style.get("title_margin", 0.06 if self.title else 0.02)
+
+        # Font sizes derived from font_scale
+        self._body_font_size = int(14 * self.font_scale)
+        self._chart_title_size = int(18 * self.font_scale)
+
+        # Axis styling shared by every xy widget; only domain/anchor vary
+        colors = self.theme["colors"]
+        self._axis_template = {
+            "gridcolor": colors["grid"],
+            "linecolor": colors["grid"],
+            "tickfont": {"color": colors["text_secondary"], "size": self._body_font_size},
+            "title": {"font": {"size": self._body_font_size}},
+        }
 
-        Returns:
-            Category: 'domain' for indicators, 'xy' for charts, 'table' for tables
-        """
-        if widget_type in ("kpi", "gauge"):
-            return "domain"
-        elif widget_type == "table":
-            return "table"
-        else:
-            return "xy"
+        # Per-column x0 / per-row y1 offsets, built on first use
+        self._domain_grid: tuple[tuple[Any, ...], float, float, list[float], list[float]] | None = None
 
     def _calculate_domain(
         self,
@@ -133,44 +166,109 @@ class DashboardComposer:
         v_spacing = self.v_spacing
         title_margin = self.title_margin
 
-        # Available space after margins
-        cell_width = (1.0 - h_spacing * (self.columns + 1)) / self.columns
-        cell_height = (1.0 - title_margin - v_spacing * (self.rows + 1)) / self.rows
+        _, cell_width, cell_height, col_x0, row_y1 = self._get_domain_grid()
 
         # Calculate position (y is inverted - row 0 is at top)
-        x0 = h_spacing + col * (cell_width + h_spacing)
+        if 0 <= col < len(col_x0):
+            x0 = col_x0[col]
+        else:
+            x0 = h_spacing + col * (cell_width + h_spacing)
         x1 = x0 + colspan * cell_width + (colspan - 1) * h_spacing
 
-        y1 = 1.0 - title_margin - v_spacing - row * (cell_height + v_spacing)
+        if 0 <= row < len(row_y1):
+            y1 = row_y1[row]
+        else:
+            y1 = 1.0 - title_margin - v_spacing - row * (cell_height + v_spacing)
         y0 = y1 - rowspan * cell_height - (rowspan - 1) * v_spacing
 
         return [x0, x1], [y0, y1]
 
-    def _create_widget_figure(self, widget_spec: dict[str, Any]) -> go.Figure:
+    def _calculate_domains(
+        self, widgets: list[dict[str, Any]]
+    ) -> tuple[list[list[float]], list[list[float]]]:
+        """Calculate domains for all widgets at once.
+
+        Positions are gathered into NumPy arrays and run through the same
+        arithmetic as _calculate_domain, so results match it exactly.
+
+        Args:
+            widgets: List of widget specifications
+
+        Returns:
+            Tuple of (x_domains, y_domains), one [min, max] pair per widget
+        """
+        n = len(widgets)
+        positions = [w.get("position", {}) for w in widgets]
+        rows = np.fromiter((p.get("row", 0) for p in positions), dtype=np.float64, count=n)
+        cols = np.fromiter((p.get("col", 0) for p in positions), dtype=np.float64, count=n)
+        rowspans = np.fromiter((p.get("rowspan", 1) for p in positions), dtype=np.float64, count=n)
+        colspans = np.fromiter((p.get("colspan", 1) for p in positions), dtype=np.float64, count=n)
+
+        h_spacing = self.h_spacing
+        v_spacing = self.v_spacing
+        _, cell_width, cell_height, _, _ = self._get_domain_grid()
+
+        x0 = h_spacing + cols * (cell_width + h_spacing)
+        x1 = x0 + colspans * cell_width + (colspans - 1) * h_spacing
+
+        y1 = 1.0 - self.title_margin - v_spacing - rows * (cell_height + v_spacing)
+        y0 = y1 - rowspans * cell_height - (rowspans - 1) * v_spacing
+
+        return np.column_stack((x0, x1)).tolist(), np.column_stack((y0, y1)).tolist()
+
+    def _get_domain_grid(
+        self,
+    ) -> tuple[tuple[Any, ...], float, float, list[float], list[float]]:
+        """Get cell sizes and per-column/per-row offsets for the grid.
+
+        Computed once with NumPy and reused until the grid settings change.
+
+        Returns:
+            Tuple of (settings_key, cell_width, cell_height, col_x0, row_y1)
+        """
+        h_spacing = self.h_spacing
+        v_spacing = self.v_spacing
+        title_margin = self.title_margin
+        key = (self.columns, self.rows, h_spacing, v_spacing, title_margin)
+        if self._domain_grid is not None and self._domain_grid[0] == key:
+            return self._domain_grid
+
+        # Available space after margins
+        cell_width = (1.0 - h_spacing * (self.columns + 1)) / self.columns
+        cell_height = (1.0 - title_margin - v_spacing * (self.rows + 1)) / self.rows
+
+        col_x0 = h_spacing + np.arange(self.columns) * (cell_width + h_spacing)
+        row_y1 = 1.0 - title_margin - v_spacing - np.arange(self.rows) * (cell_height + v_spacing)
+
+        self._domain_grid = (key, cell_width, cell_height, col_x0.tolist(), row_y1.tolist())
+        return self._domain_grid
+
+    def _create_widget_figure(self, widget_spec: dict[str, Any]) -> dict[str, Any]:
         """Create a widget figure from specification.
 
         Args:
             widget_spec: Widget specification with type and config
 
         Returns:
-            Widget figure
+            Widget figure as a plain dict with "data" and "layout" keys
         """
         widget_type = widget_spec["type"]
-        config = widget_spec.get("config", {}).copy()
-
-        # Inject font_scale into config for widgets that support it
-        config["font_scale"] = self.font_scale
+        config = widget_spec.get("config", {})
 
+        # Widget classes are imported per branch so unused types cost nothing
         if widget_type == "chart":
+            from ..widgets.chart import ChartWidget
+
             widget = ChartWidget(
                 chart_type=config.get("chart_type", "bar"),
                 data=config.get("data", {}),
                 title=config.get("title"),
                 theme=self.theme,
+                font_scale=self.font_scale,
             )
-            # Pass font_scale via widget config
-            widget.config["font_scale"] = self.font_scale
         elif widget_type == "kpi":
+            from ..widgets.kpi import KPIWidget
+
             widget = KPIWidget(
                 value=config.get("value", 0),
                 label=config.get("label", ""),
@@ -179,10 +277,11 @@ class DashboardComposer:
                 format_value=config.get("format_value"),
                 sparkline=config.get("sparkline"),
                 theme=self.theme,
+                font_scale=self.font_scale,
             )
-            # Pass font_scale via widget config
-            widget.config["font_scale"] = self.font_scale
         elif widget_type == "table":
+            from ..widgets.table import TableWidget
+
             widget = TableWidget(
                 headers=config.get("headers", []),
                 rows=config.get("rows", []),
@@ -190,6 +289,8 @@ class DashboardComposer:
                 theme=self.theme,
             )
         elif widget_type == "gauge":
+            from ..widgets.gauge import GaugeWidget
+
             widget = GaugeWidget(
                 value=config.get("value", 0),
                 min_val=config.get("min", 0),
@@ -197,67 +298,168 @@ class DashboardComposer:
                 label=config.get("label"),
                 thresholds=config.get("thresholds"),
                 theme=self.theme,
+                font_scale=self.font_scale,
             )
-            # Pass font_scale via widget config
-            widget.config["font_scale"] = self.font_scale
         else:
             raise ValueError(f"Unknown widget type: {widget_type}")
 
-        return widget.create_figure()
+        return widget.create_figure().to_dict()
+
+    def _widget_key(self, widget_spec: dict[str, Any]) -> str | None:
+        """Hash a widget's type and config (position aside).
 
-    def _build_subplot_specs(
+        Args:
+            widget_spec: Widget specification with type and config
+
+        Returns:
+            Hex digest, or None if the config is not JSON-serializable
+        """
+        try:
+            key_json = canonical_json([widget_spec.get("type"), widget_spec.get("config", {})])
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(key_json, digest_size=16).hexdigest()
+
+    def _iter_widget_figures(
         self, widgets: list[dict[str, Any]]
-    ) -> list[list[dict[str, Any] | None]]:
-        """Build subplot specification matrix with correct types.
+    ) -> Iterator[tuple[int, dict[str, Any], list[float], list[float], dict[str, Any]]]:
+        """Yield each widget's figure with its placement, one at a time.
+
+        Identical widgets are built once. Every placement but the last gets
+        a deep copy; the last takes over the shared build, which is then
+        dropped so no widget figure outlives its use.
 
         Args:
             widgets: List of widget specifications
 
+        Yields:
+            Tuples of (index, widget_spec, x_domain, y_domain, widget_fig)
+        """
+        if len(widgets) == 1:
+            # Single widget: nothing to share, skip hashing and array setup
+            widget_spec = widgets[0]
+            position = widget_spec.get("position", {})
+            x_domain, y_domain = self._calculate_domain(
+                row=position.get("row", 0),
+                col=position.get("col", 0),
+                rowspan=position.get("rowspan", 1),
+                colspan=position.get("colspan", 1),
+            )
+            yield 0, widget_spec, x_domain, y_domain, self._create_widget_figure(widget_spec)
+            return
+
+        x_domains, y_domains = self._calculate_domains(widgets)
+        keys = [self._widget_key(w) for w in widgets]
+        # Keys can collide for unequal configs (e.g., NaN and None), so a
+        # widget only shares the build of an equal first widget with its key
+        firsts: dict[str, dict[str, Any]] = {}
+        for i, (widget_spec, key) in enumerate(zip(widgets, keys)):
+            if key is None:
+                continue
+            first = firsts.setdefault(key, widget_spec)
+            if first is not widget_spec and (
+                (first.get("type"), first.get("config", {}))
+                != (widget_spec.get("type"), widget_spec.get("config", {}))
+            ):
+                keys[i] = None
+        remaining = Counter(k for k in keys if k is not None)
+        shared: dict[str, dict[str, Any]] = {}
+
+        for i, (widget_spec, key) in enumerate(zip(widgets, keys)):
+            if key is None:
+                widget_fig = self._create_widget_figure(widget_spec)
+            else:
+                widget_fig = shared.pop(key, None)
+                if widget_fig is None:
+                    widget_fig = self._create_widget_figure(widget_spec)
+                remaining[key] -= 1
+                if remaining[key]:
+                    shared[key] = widget_fig
+                    widget_fig = copy.deepcopy(widget_fig)
+            yield i, widget_spec, x_domains[i], y_domains[i], widget_fig
+
+    def _merge_line_traces(self, traces: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Merge identically styled line traces of one widget into one trace.
+
+        Traces whose properties match apart from x/y are drawn as a single
+        Scatter with None-separated segments, so the dashboard carries fewer
+        traces. Only unfilled scatter traces are merged, since a None gap
+        would change how a fill is drawn.
+
+        Args:
+            traces: Traces from a single widget figure (same axes)
+
         Returns:
-            2D list of subplot specs with None for empty cells
+            Traces to add, in original order
         """
-        # Initialize empty grid
-        specs = [[{} for _ in range(self.columns)] for _ in range(self.rows)]
-
-        # Map positions to widget types
-        pos_to_widget = {}
-        for widget in widgets:
-            pos = widget.get("position", {})
-            row = pos.get("row", 0)
-            col = pos.get("col", 0)
-            pos_to_widget[(row, col)] = widget
-
-        for widget in widgets:
-            pos = widget.get("position", {})
-            row = pos.get("row", 0)
-            col = pos.get("col", 0)
-            rowspan = pos.get("rowspan", 1)
-            colspan = pos.get("colspan", 1)
-            widget_type = widget.get("type", "chart")
-
-            # Get the subplot type for this widget
-            subplot_type = self._get_widget_type_category(widget_type)
-
-            # Mark occupied cells
-            for r in range(row, min(row + rowspan, self.rows)):
-                for c in range(col, min(col + colspan, self.columns)):
-                    if r == row and c == col:
-                        spec = {"rowspan": rowspan, "colspan": colspan}
-                        if subplot_type == "domain":
-                            spec["type"] = "domain"
-                        elif subplot_type == "table":
-                            spec["type"] = "table"
-                        # xy is the default, no need to specify
-                        specs[r][c] = spec
-                    else:
-                        specs[r][c] = None
-
-        return specs
+        if sum(t.get("type") == "scatter" for t in traces) < 2:
+            return traces
+
+        merged: list[dict[str, Any]] = []
+        buckets: dict[str, dict[str, Any]] = {}
+        for trace in traces:
+            if trace.get("type") != "scatter" or trace.get("fill", "none") != "none":
+                merged.append(trace)
+                continue
+            props = {k: v for k, v in trace.items() if k not in ("x", "y")}
+            x, y = trace.get("x"), trace.get("y")
+            if x is None or y is None:
+                merged.append(trace)
+                continue
+            key = json.dumps(props, sort_keys=True, default=str)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = {"trace": trace, "x": list(x), "y": list(y), "count": 1}
+                buckets[key] = bucket
+                merged.append(trace)
+            else:
+                bucket["x"] += [None, *x]
+                bucket["y"] += [None, *y]
+                bucket["count"] += 1
+
+        for bucket in buckets.values():
+            if bucket["count"] > 1:
+                bucket["trace"]["x"] = bucket["x"]
+                bucket["trace"]["y"] = bucket["y"]
+        return merged
 
     def compose(self) -> go.Figure:
         """Compose all widgets into a single figure.
 
-        Uses domain-based positioning for flexibility.
+        Results are memoized by spec and theme, so rendering the same
+        dashboard in several formats only builds the widgets once.
+
+        Returns:
+            Composed dashboard figure
+        """
+        try:
+            spec_key = canonical_json(self.spec)
+            if self._theme_key is None:
+                self._theme_key = canonical_json(self.theme)
+        except (TypeError, ValueError):
+            # Non-JSON values in the spec; build without caching
+            return self._build_figure()
+
+        key = (type(self), spec_key, self._theme_key)
+        with _COMPOSE_CACHE_LOCK:
+            entry = _COMPOSE_CACHE.get(key)
+            if entry is not None:
+                _COMPOSE_CACHE.move_to_end(key)
+
+        # Distinct specs can share a key (NaN and None both serialize to null,
+        # tuples to lists), so only reuse a figure built from an equal spec
+        if entry is not None and entry[0] == self.spec and entry[1] == self.theme:
+            return go.Figure(entry[2])
+
+        fig = self._build_figure()
+        with _COMPOSE_CACHE_LOCK:
+            _COMPOSE_CACHE[key] = (copy.deepcopy(self.spec), self.theme, fig)
+            if len(_COMPOSE_CACHE) > _COMPOSE_CACHE_SIZE:
+                _COMPOSE_CACHE.popitem(last=False)
+        return go.Figure(fig)
+
+    def _build_figure(self) -> go.Figure:
+        """Build the dashboard figure using domain-based positioning.
 
         Returns:
             Composed dashboard figure
@@ -265,29 +467,17 @@ class DashboardComposer:
         widgets = self.spec.get("widgets", [])
         if not widgets:
             # Return empty figure
-            fig = go.Figure()
-            fig.update_layout(
+            return go.Figure(layout=dict(
                 title=self.title,
                 paper_bgcolor=self.theme["colors"]["background"],
-            )
-            return fig
+            ))
 
-        fig = go.Figure()
+        traces: list[dict[str, Any]] = []
+        axis_layouts: dict[str, dict[str, Any]] = {}
         chart_annotations = []
 
-        # Add each widget with calculated domain
-        for i, widget_spec in enumerate(widgets):
-            pos = widget_spec.get("position", {})
-            row = pos.get("row", 0)
-            col = pos.get("col", 0)
-            rowspan = pos.get("rowspan", 1)
-            colspan = pos.get("colspan", 1)
-
-            # Calculate domain for this widget
-            x_domain, y_domain = self._calculate_domain(row, col, rowspan, colspan)
-
-            # Create widget figure
-            widget_fig = self._create_widget_figure(widget_spec)
+        # Add each widget with calculated domain; figures are built lazily
+        for i, widget_spec, x_domain, y_domain, widget_fig in self._iter_widget_figures(widgets):
 
             # Extract chart title from widget config for charts
             widget_type = widget_spec.get("type")
@@ -295,7 +485,6 @@ class DashboardComposer:
                 chart_title = widget_spec.get("config", {}).get("title")
                 if chart_title:
                     # Add title as annotation above the chart
-                    chart_title_size = int(18 * self.font_scale)
                     chart_annotations.append(dict(
                         text=f"<b>{chart_title}</b>",
                         x=(x_domain[0] + x_domain[1]) / 2,
@@ -304,7 +493,7 @@ class DashboardComposer:
                         yref="paper",
                         showarrow=False,
                         font=dict(
-                            size=chart_title_size,
+                            size=self._chart_title_size,
                             color=self.theme["colors"]["text"],
                         ),
                         xanchor="center",
@@ -312,69 +501,57 @@ class DashboardComposer:
                     ))
 
             # Transfer widget annotations (like KPI deltas) with remapped coordinates
-            if widget_fig.layout.annotations:
-                for ann in widget_fig.layout.annotations:
-                    # Remap paper coordinates from widget space to dashboard space
-                    ann_dict = ann.to_plotly_json()
+            widget_annotations = widget_fig["layout"].get("annotations")
+            if widget_annotations:
+                # Affine map from widget paper space [0,1] to the widget's domain
+                x0, y0 = x_domain[0], y_domain[0]
+                x_width, y_height = x_domain[1] - x0, y_domain[1] - y0
+                for ann_dict in widget_annotations:
                     if ann_dict.get("xref") == "paper" and ann_dict.get("yref") == "paper":
-                        # Map x from [0,1] in widget to [x_domain[0], x_domain[1]] in dashboard
-                        orig_x = ann_dict.get("x", 0.5)
-                        orig_y = ann_dict.get("y", 0.5)
-                        ann_dict["x"] = x_domain[0] + orig_x * (x_domain[1] - x_domain[0])
-                        ann_dict["y"] = y_domain[0] + orig_y * (y_domain[1] - y_domain[0])
-                    chart_annotations.append(ann_dict)
+                        ann_dict["x"] = x0 + ann_dict.get("x", 0.5) * x_width
+                        ann_dict["y"] = y0 + ann_dict.get("y", 0.5) * y_height
+                chart_annotations.extend(widget_annotations)
 
             # Add traces with updated domain
-            for trace in widget_fig.data:
+            for trace in self._merge_line_traces(widget_fig["data"]):
+                trace_type = trace.get("type")
+
                 # Update trace domain based on trace type
-                if hasattr(trace, 'domain'):
-                    trace.domain = dict(x=x_domain, y=y_domain)
+                if trace_type in DOMAIN_TRACE_TYPES:
+                    trace["domain"] = dict(x=x_domain, y=y_domain)
 
                 # For scatter/bar traces, we need to use xaxis/yaxis references
-                if isinstance(trace, (go.Scatter, go.Bar)):
+                if trace_type in XY_TRACE_TYPES:
                     axis_suffix = "" if i == 0 else str(i + 1)
-                    trace.xaxis = f"x{axis_suffix}"
-                    trace.yaxis = f"y{axis_suffix}"
+                    trace["xaxis"] = f"x{axis_suffix}"
+                    trace["yaxis"] = f"y{axis_suffix}"
 
                     # Create axis for this widget
                     x_axis_key = f"xaxis{axis_suffix}"
                     y_axis_key = f"yaxis{axis_suffix}"
 
-                    tick_font_size = int(14 * self.font_scale)
-                    axis_title_size = int(14 * self.font_scale)
-                    fig.layout[x_axis_key] = dict(
-                        domain=x_domain,
-                        anchor=f"y{axis_suffix}" if axis_suffix else "y",
-                        gridcolor=self.theme["colors"]["grid"],
-                        linecolor=self.theme["colors"]["grid"],
-                        tickfont=dict(
-                            color=self.theme["colors"]["text_secondary"],
-                            size=tick_font_size,
-                        ),
-                        title=dict(font=dict(size=axis_title_size)),
-                    )
-                    fig.layout[y_axis_key] = dict(
-                        domain=y_domain,
-                        anchor=f"x{axis_suffix}" if axis_suffix else "x",
-                        gridcolor=self.theme["colors"]["grid"],
-                        linecolor=self.theme["colors"]["grid"],
-                        tickfont=dict(
-                            color=self.theme["colors"]["text_secondary"],
-                            size=tick_font_size,
-                        ),
-                        title=dict(font=dict(size=axis_title_size)),
-                    )
+                    axis_layouts[x_axis_key] = {
+                        **self._axis_template,
+                        "domain": x_domain,
+                        "anchor": f"y{axis_suffix}",
+                    }
+                    axis_layouts[y_axis_key] = {
+                        **self._axis_template,
+                        "domain": y_domain,
+                        "anchor": f"x{axis_suffix}",
+                    }
 
-                fig.add_trace(trace)
+                traces.append(trace)
 
         # Apply theme and title
         layout_updates = {
+            **axis_layouts,
             "paper_bgcolor": self.theme["colors"]["background"],
             "plot_bgcolor": self.theme["colors"]["background"],
             "font": {
                 "family": self.theme["fonts"]["body"],
                 "color": self.theme["colors"]["text"],
-                "size": int(14 * self.font_scale),
+                "size": self._body_font_size,
             },
             "showlegend": False,
             "margin": dict(l=60, r=40, t=100 if self.title else 60, b=60),
@@ -392,9 +569,8 @@ class DashboardComposer:
         if chart_annotations:
             layout_updates["annotations"] = chart_annotations
 
-        fig.update_layout(**layout_updates)
-
-        return fig
+        # Build the figure once rather than validating per add_trace call
+        return go.Figure(data=traces, layout=layout_updates)
 
     def render(
         self,
@@ -428,3 +604,36 @@ class DashboardComposer:
             height=height,
             scale=scale,
         )
+
+    def render_many(
+        self,
+        output_dir: str | Path,
+        filename: str = "dashboard",
+        formats: list[FormatType] | None = None,
+        resolution: str = "1080p",
+        scale: float = 2.0,
+    ) -> list[Path]:
+        """Render the dashboard to several formats, composing it once.
+
+        Args:
+            output_dir: Directory to write the files
+            filename: Base filename (without extension)
+            formats: Output formats (defaults to png, svg, pdf)
+            resolution: Resolution preset or WxH
+            scale: Scale factor for higher DPI
+
+        Returns:
+            Paths to the exported files, in the order of formats
+        """
+        fig = self.compose()
+        width, height = parse_resolution(resolution)
+
+        return export_figures(
+            fig=fig,
+            output_dir=output_dir,
+            filename=filename,
+            formats=formats or ["png", "svg", "pdf"],
+            width=width,
+            height=height,
+            scale=scale,
+        )
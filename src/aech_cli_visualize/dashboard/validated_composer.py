@@ -1,8 +1,15 @@
 """Dashboard composer with VLM validation feedback loop."""
 
+import asyncio
+import copy
 import logging
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from ..utils.export import FormatType
 from ..validation import (
@@ -10,13 +17,79 @@ from ..validation import (
     LayoutCorrection,
     RenderResult,
     ValidationResult,
-    VLMValidator,
+    VLMBatchClient,
 )
 from .composer import DashboardComposer
 
+if TYPE_CHECKING:
+    from ..validation.vlm_validator import VLMValidator
+
 
 logger = logging.getLogger(__name__)
 
+# Local quality score above which a first render skips the VLM (AECH_VLM_SKIP_EASY)
+EASY_SKIP_THRESHOLD = 0.9
+
+# Issue weights when ranking beam candidates by their validation result
+SEVERITY_WEIGHTS = {"critical": 3, "major": 2, "minor": 1}
+
+T = TypeVar("T")
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    asyncio.run fails in a thread that is already running an event loop
+    (Jupyter, an async web handler), so there the coroutine gets its own
+    loop on a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _start_daemon(fn: Callable[..., T], *args: Any) -> "Future[T]":
+    """Run fn(*args) on a daemon thread and return a future for its result.
+
+    Used for speculative renders. Unlike a ThreadPoolExecutor or the event
+    loop's default executor, nothing joins a daemon thread, so an unused
+    render never holds up the loop's shutdown or interpreter exit.
+    """
+    future: Future[T] = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="aech-speculative-render", daemon=True).start()
+    return future
+
+
+def _remove_rendered_file(future: "Future[Path]") -> None:
+    """Done callback that deletes the output of a discarded render."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().unlink(missing_ok=True)
+
+
+@dataclass
+class RenderJob:
+    """One dashboard to render in a render_many batch."""
+
+    spec: dict[str, Any]
+    output_dir: str | Path
+    filename: str = "dashboard"
+    format: FormatType = "png"
+    resolution: str = "1080p"
+    scale: float = 2.0
+
 
 class ValidatedDashboardComposer:
     """Dashboard composer with VLM validation and correction loop."""
@@ -28,6 +101,10 @@ class ValidatedDashboardComposer:
         enable_vlm_validation: bool = True,
         max_iterations: int = 3,
         vlm_model: str | None = None,
+        use_vlm_cache: bool = True,
+        skip_easy: bool | None = None,
+        beam_width: int | None = None,
+        speculate: bool | None = None,
     ):
         """Initialize the validated composer.
 
@@ -37,14 +114,37 @@ class ValidatedDashboardComposer:
             enable_vlm_validation: Whether to use VLM validation loop
             max_iterations: Maximum render/validate iterations
             vlm_model: VLM model identifier (e.g., "openai:gpt-4o")
+            use_vlm_cache: Reuse stored VLM results for identical renders
+            skip_easy: Accept a first render without a VLM call when local
+                       layout checks pass. Defaults to AECH_VLM_SKIP_EASY=1.
+            beam_width: Alternative correction sets to render and validate in
+                        parallel per iteration. Defaults to AECH_VLM_BEAM or 1.
+            speculate: Render the predicted next iteration while the VLM
+                       evaluates the current one. Defaults to AECH_VLM_SPECULATE=1.
         """
         self.spec = spec
         self.theme = theme
         self.enable_vlm_validation = enable_vlm_validation
         self.max_iterations = max_iterations
+        self.skip_easy = (
+            skip_easy if skip_easy is not None
+            else os.environ.get("AECH_VLM_SKIP_EASY") == "1"
+        )
+        self.beam_width = max(1, beam_width or int(os.environ.get("AECH_VLM_BEAM", 1)))
+        self.speculate = (
+            speculate if speculate is not None
+            else os.environ.get("AECH_VLM_SPECULATE") == "1"
+        )
 
-        self.validator = VLMValidator(model=vlm_model) if enable_vlm_validation else None
+        self.validator: VLMValidator | None = None
+        if enable_vlm_validation:
+            # Needs the optional vlm extra; plain renders work without it
+            from ..validation.vlm_validator import VLMValidator
+
+            self.validator = VLMValidator(model=vlm_model, use_cache=use_vlm_cache)
         self.correction_engine = CorrectionEngine()
+        # Set only on the per-job copies made by arender_many
+        self._batch_client: VLMBatchClient | None = None
 
     def render(
         self,
@@ -56,6 +156,9 @@ class ValidatedDashboardComposer:
     ) -> RenderResult:
         """Render dashboard with optional VLM validation loop.
 
+        Synchronous entry point for the CLI. It also works when called from
+        inside a running event loop, but blocks that loop; prefer arender there.
+
         Args:
             output_dir: Directory to write output file
             filename: Base filename (without extension)
@@ -75,10 +178,92 @@ class ValidatedDashboardComposer:
             )
 
         # VLM validation loop
-        return self._render_with_validation(
+        return _run_sync(self._arender_with_validation(
+            output_dir, filename, format, resolution, scale
+        ))
+
+    async def arender(
+        self,
+        output_dir: str | Path,
+        filename: str = "dashboard",
+        format: FormatType = "png",
+        resolution: str = "1080p",
+        scale: float = 2.0,
+    ) -> RenderResult:
+        """Async variant of render.
+
+        Renders run in a worker thread and VLM calls are awaited, so several
+        dashboards rendered concurrently overlap their VLM latency.
+
+        Args:
+            output_dir: Directory to write output file
+            filename: Base filename (without extension)
+            format: Output format (png, svg, pdf)
+            resolution: Resolution preset or WxH
+            scale: Scale factor for higher DPI
+
+        Returns:
+            RenderResult with path, iterations, and validation history
+        """
+        output_dir = Path(output_dir)
+
+        if not self.enable_vlm_validation or self.validator is None:
+            return await asyncio.to_thread(
+                self._render_without_validation,
+                output_dir, filename, format, resolution, scale,
+            )
+
+        return await self._arender_with_validation(
             output_dir, filename, format, resolution, scale
         )
 
+    async def arender_many(
+        self, jobs: list[RenderJob], max_concurrency: int = 10
+    ) -> list[RenderResult | BaseException]:
+        """Render several dashboards concurrently with this composer's settings.
+
+        Each job's spec stands in for this composer's spec; the theme,
+        validator, and iteration limit are shared. With more than one job,
+        concurrent validations share VLM calls through a batch client owned
+        by this call, so throughput is bounded by the provider's rate limits
+        rather than the sum of call latencies.
+
+        Args:
+            jobs: Dashboards to render
+            max_concurrency: Maximum dashboards in their render/validate loop at once
+
+        Returns:
+            One entry per job, in order: its RenderResult, or the exception it raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        batch_client = (
+            VLMBatchClient(self.validator)
+            if self.validator is not None and len(jobs) > 1 else None
+        )
+
+        async def render_one(job: RenderJob) -> RenderResult:
+            composer = copy.copy(self)
+            composer.spec = job.spec
+            composer._batch_client = batch_client
+            async with semaphore:
+                return await composer.arender(
+                    job.output_dir, job.filename, job.format, job.resolution, job.scale
+                )
+
+        try:
+            return list(await asyncio.gather(
+                *(render_one(job) for job in jobs), return_exceptions=True
+            ))
+        finally:
+            if batch_client is not None:
+                await batch_client.aclose()
+
+    def render_many(
+        self, jobs: list[RenderJob], max_concurrency: int = 10
+    ) -> list[RenderResult | BaseException]:
+        """Synchronous wrapper around arender_many for the CLI."""
+        return _run_sync(self.arender_many(jobs, max_concurrency))
+
     def _render_without_validation(
         self,
         output_dir: Path,
@@ -105,7 +290,7 @@ class ValidatedDashboardComposer:
             corrections_applied=[],
         )
 
-    def _render_with_validation(
+    async def _arender_with_validation(
         self,
         output_dir: Path,
         filename: str,
@@ -113,34 +298,87 @@ class ValidatedDashboardComposer:
         resolution: str,
         scale: float,
     ) -> RenderResult:
-        """Render with VLM validation and correction loop."""
+        """Render with VLM validation and correction loop.
+
+        With speculation on, while the VLM evaluates one iteration the next
+        is rendered from corrections for the previous VLM result, under a
+        temporary name. The speculative render is renamed and used if the
+        real corrections produce the same spec. Otherwise it is discarded
+        without waiting for it to finish. With the built-in CorrectionEngine
+        the prediction only holds when the VLM reports the same issues again,
+        which usually ends the loop instead, so speculation is off by default.
+
+        With a beam width above 1, each iteration instead renders and
+        validates several alternative corrections in parallel and carries
+        the best one, with its render and result, into the next iteration.
+        """
         current_spec = self.spec.copy()
+        # One composer per session; renders run one at a time, so it is
+        # safe to swap specs into it rather than rebuild it per iteration
+        composer = DashboardComposer(spec=current_spec, theme=self.theme)
         validation_history: list[ValidationResult] = []
         all_corrections: list[LayoutCorrection] = []
+        speculative: tuple[dict[str, Any], Future[Path]] | None = None
+        prevalidated: ValidationResult | None = None
         iteration = 0
         output_path: Path | None = None
         vlm_error: str | None = None
 
         while iteration < self.max_iterations:
-            # Render with current spec
+            # Render with current spec, reusing a correct speculative render
             iter_filename = f"{filename}_iter{iteration}" if iteration > 0 else filename
-            composer = DashboardComposer(spec=current_spec, theme=self.theme)
-
             try:
-                output_path = composer.render(
-                    output_dir=output_dir,
-                    filename=iter_filename,
-                    format=format,
-                    resolution=resolution,
-                    scale=scale,
-                )
+                if speculative is not None and speculative[0] == current_spec:
+                    path = await asyncio.wrap_future(speculative[1])
+                    output_path = path.replace(path.with_name(f"{iter_filename}{path.suffix}"))
+                else:
+                    self._discard_render(speculative)
+                    output_path = await self._render_spec(
+                        composer, current_spec, output_dir, iter_filename, format, resolution, scale
+                    )
             except Exception as e:
                 logger.error(f"Render failed at iteration {iteration}: {e}")
                 raise
 
-            # Validate with VLM
+            # Accept an obviously fine first render without asking the VLM
+            if iteration == 0 and self.skip_easy:
+                score = await asyncio.to_thread(
+                    self.correction_engine.local_quality_score, current_spec, output_path
+                )
+                if score > EASY_SKIP_THRESHOLD:
+                    validation_history.append(ValidationResult(
+                        is_acceptable=True,
+                        confidence=score,
+                        reasoning=f"VLM skipped: local layout checks passed (score {score:.2f})",
+                    ))
+                    logger.info("Dashboard accepted by local layout checks")
+                    break
+
+            # Start the likely next render while the VLM looks at this one
+            if (
+                self.speculate
+                and prevalidated is None
+                and validation_history
+                and iteration + 1 < self.max_iterations
+            ):
+                predicted = self.correction_engine.compute_corrections(
+                    validation_history[-1], current_spec
+                )
+                predicted_spec = self.correction_engine.apply_corrections(current_spec, predicted)
+                if predicted and predicted_spec != current_spec:
+                    speculative = (predicted_spec, _start_daemon(
+                        self._render_sync, copy.copy(composer), predicted_spec, output_dir,
+                        f"{filename}_iter{iteration + 1}_speculative", format, resolution, scale,
+                    ))
+
+            # Validate with VLM, unless a beam step already did
             try:
-                result = self.validator.evaluate(output_path, current_spec)  # type: ignore
+                if prevalidated is None:
+                    result = await self.validator.aevaluate(  # type: ignore[union-attr]
+                        output_path, current_spec, self._batch_client
+                    )
+                else:
+                    result, prevalidated = prevalidated, None
                 validation_history.append(result)
             except Exception as e:
                 logger.warning(f"VLM validation failed: {e}")
@@ -157,15 +395,52 @@ class ValidatedDashboardComposer:
                 logger.warning("Corrections not improving - stopping early")
                 break
 
-            # Compute and apply corrections
-            corrections = self.correction_engine.compute_corrections(result, current_spec)
+            # Compute corrections, with alternatives when searching a beam
+            # (not on the last iteration, whose renders would go unused)
+            if self.beam_width > 1 and iteration + 1 < self.max_iterations:
+                candidates = self.correction_engine.compute_corrections_topk(
+                    result, current_spec, k=self.beam_width
+                )
+            else:
+                corrections = self.correction_engine.compute_corrections(result, current_spec)
+                candidates = [corrections] if corrections else []
 
-            if not corrections:
+            if not candidates:
                 logger.info("No further corrections available")
                 break
 
-            # Apply corrections
-            current_spec = self.correction_engine.apply_corrections(current_spec, corrections)
+            # Drop corrections that would make widgets overlap more
+            baseline_overlaps = self.correction_engine.overlap_count(current_spec)
+            corrected: list[tuple[list[LayoutCorrection], dict[str, Any]]] = []
+            for candidate in candidates:
+                candidate_spec = self.correction_engine.apply_corrections(current_spec, candidate)
+                if self.correction_engine.overlap_count(candidate_spec) <= baseline_overlaps:
+                    corrected.append((candidate, candidate_spec))
+
+            if not corrected:
+                logger.warning("Corrections would add widget overlaps - stopping early")
+                break
+
+            if len(corrected) > 1:
+                # Render and validate every candidate; continue from the best
+                self._discard_render(speculative)
+                speculative = None
+                picked = await self._beam_search(
+                    composer, [spec for _, spec in corrected], output_dir,
+                    f"{filename}_iter{iteration + 1}", format, resolution, scale,
+                )
+                if isinstance(picked, Exception):
+                    logger.warning(f"VLM validation failed: {picked}")
+                    vlm_error = str(picked)
+                    break
+                best, best_path, prevalidated = picked
+                rendered: Future[Path] = Future()
+                rendered.set_result(best_path)
+                speculative = (corrected[best][1], rendered)
+            else:
+                best = 0
+
+            corrections, current_spec = corrected[best]
             all_corrections.extend(corrections)
 
             logger.info(
@@ -175,6 +450,8 @@ class ValidatedDashboardComposer:
 
             iteration += 1
 
+        self._discard_render(speculative)
+
         # Determine final status
         warning = None
         if validation_history and not validation_history[-1].is_acceptable:
@@ -193,6 +470,145 @@ class ValidatedDashboardComposer:
             vlm_error=vlm_error,
         )
 
+    async def _render_spec(
+        self,
+        composer: DashboardComposer,
+        spec: dict[str, Any],
+        output_dir: Path,
+        filename: str,
+        format: FormatType,
+        resolution: str,
+        scale: float,
+    ) -> Path:
+        """Render a spec in a worker thread with the session composer.
+
+        Returns:
+            Path to the rendered file
+        """
+        return await asyncio.to_thread(
+            self._render_sync, composer, spec, output_dir, filename, format, resolution, scale
+        )
+
+    @staticmethod
+    def _render_sync(
+        composer: DashboardComposer,
+        spec: dict[str, Any],
+        output_dir: Path,
+        filename: str,
+        format: FormatType,
+        resolution: str,
+        scale: float,
+    ) -> Path:
+        """Swap a spec into a composer and render it.
+
+        Returns:
+            Path to the rendered file
+        """
+        composer.update_spec(spec)
+        return composer.render(
+            output_dir=output_dir,
+            filename=filename,
+            format=format,
+            resolution=resolution,
+            scale=scale,
+        )
+
+    async def _beam_search(
+        self,
+        composer: DashboardComposer,
+        specs: list[dict[str, Any]],
+        output_dir: Path,
+        filename: str,
+        format: FormatType,
+        resolution: str,
+        scale: float,
+    ) -> tuple[int, Path, ValidationResult] | Exception:
+        """Render and validate candidate specs in parallel and keep the best.
+
+        The winning render is moved to filename; the others are removed.
+        A candidate whose render fails is dropped, and its siblings' files
+        are still cleaned up.
+
+        Args:
+            composer: Session composer; each candidate renders with a copy
+            specs: Candidate specs
+            output_dir: Directory to write output files
+            filename: Base filename for the winning render
+            format: Output format (png, svg, pdf)
+            resolution: Resolution preset or WxH
+            scale: Scale factor for higher DPI
+
+        Returns:
+            (index, path, result) of the best candidate, or the first VLM
+            error if no candidate could be validated
+
+        Raises:
+            Exception: The first render error, if no candidate could be validated
+        """
+        async def evaluate(
+            index: int, spec: dict[str, Any]
+        ) -> tuple[Path, ValidationResult | Exception]:
+            path = await self._render_spec(
+                copy.copy(composer), spec, output_dir, f"{filename}_beam{index}",
+                format, resolution, scale,
+            )
+            try:
+                return path, await self.validator.aevaluate(  # type: ignore[union-attr]
+                    path, spec, self._batch_client
+                )
+            except Exception as e:
+                return path, e
+
+        outcomes = await asyncio.gather(
+            *(evaluate(i, spec) for i, spec in enumerate(specs)), return_exceptions=True
+        )
+
+        rendered: dict[int, tuple[Path, ValidationResult | Exception]] = {}
+        render_errors: list[BaseException] = []
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Beam candidate {i + 1} failed to render: {outcome}")
+                render_errors.append(outcome)
+            else:
+                rendered[i] = outcome
+
+        scored = {
+            i: result for i, (_, result) in rendered.items()
+            if isinstance(result, ValidationResult)
+        }
+        best = max(scored, key=lambda i: self._rank(scored[i])) if scored else None
+
+        for i, (path, _) in rendered.items():
+            if i != best:
+                path.unlink(missing_ok=True)
+
+        if best is None:
+            if render_errors:
+                raise render_errors[0]
+            return next(result for _, result in rendered.values() if isinstance(result, Exception))
+
+        logger.info(f"Beam search picked candidate {best + 1} of {len(specs)}")
+        path = rendered[best][0]
+        return best, path.replace(path.with_name(f"{filename}{path.suffix}")), scored[best]
+
+    @staticmethod
+    def _rank(result: ValidationResult) -> tuple[bool, int, float]:
+        """Sort key for validation results; higher is better."""
+        penalty = sum(SEVERITY_WEIGHTS.get(issue.severity, 1) for issue in result.issues)
+        return result.is_acceptable, -penalty, result.confidence
+
+    @staticmethod
+    def _discard_render(speculative: tuple[dict[str, Any], "Future[Path]"] | None) -> None:
+        """Remove an unused speculative render's output once it finishes.
+
+        Render threads cannot be cancelled. Speculative renders write to
+        their own temporary name, so nothing waits for them; the file is
+        removed from a done callback instead. A render still running when
+        the process exits is abandoned and can leave its temporary file.
+        """
+        if speculative is not None:
+            speculative[1].add_done_callback(_remove_rendered_file)
+
     def _is_diverging(self, history: list[ValidationResult]) -> bool:
         """Check if corrections are making things worse.
 
@@ -214,9 +630,7 @@ class ValidatedDashboardComposer:
 
         # If same number of issues and same types, we're stuck
         if len(recent.issues) == len(previous.issues):
-            recent_types = {(i.issue_type, tuple(i.affected_widgets)) for i in recent.issues}
-            prev_types = {(i.issue_type, tuple(i.affected_widgets)) for i in previous.issues}
-            if recent_types == prev_types:
+            if recent.issue_fingerprint == previous.issue_fingerprint:
                 return True
 
         return False
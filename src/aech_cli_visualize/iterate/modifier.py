@@ -1,15 +1,20 @@
 """LLM-based spec modifier for interpreting user feedback."""
 
-import json
+import asyncio
 import os
-from pathlib import Path
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent, BinaryContent
+from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
 
 from ..model_utils import parse_model_string, get_model_settings
+from ..utils.data import canonical_json
+from ..validation.cache import VLMCache
+from ..validation.images import load_vlm_image, vlm_image_max_dim
 
 
 class StyleModification(BaseModel):
@@ -140,76 +145,207 @@ When analyzing feedback + image:
 - **Row math**: Widget rowspans must not exceed layout rows.
 - **Position changes**: When resizing widgets (colspan/rowspan), ensure adjacent widgets don't overlap."""
 
+# StyleModification fields copied onto spec["style"] when set, in order
+_STYLE_FIELDS = (
+    "preset",
+    "font_scale",
+    "h_spacing",
+    "v_spacing",
+    "widget_padding",
+    "title_size",
+    "title_margin",
+)
+
+# Static tail of every feedback prompt
+_PROMPT_FOOTER = """IMPORTANT: If an image is provided, ANALYZE it carefully:
+- Is there excessive empty space anywhere? (top, between rows, around widgets)
+- Are widgets filling their allocated space appropriately?
+- Is text readable at presentation distance?
+- Are elements visually balanced (no tiny widgets next to huge ones)?
+- Do charts have readable axis labels?
+
+Based on the feedback AND your visual analysis, what modifications would fix the issues?
+Be BOLD with changes - small tweaks won't fix significant visual problems."""
+
+
+@lru_cache(maxsize=8)
+def _build_agent(model_string: str, enable_thinking: bool = True) -> Agent[None, SpecModification]:
+    """Build the modification agent for a model string.
+
+    Cached so modifiers using the same model share one agent, and model
+    settings are resolved once per model rather than per modifier.
+    """
+    model, _ = parse_model_string(model_string)
+    settings = get_model_settings(model_string)
+    if settings and not enable_thinking:
+        settings.pop("anthropic_thinking", None)
+    return Agent(
+        model,
+        output_type=SpecModification,
+        instructions=MODIFICATION_INSTRUCTIONS,
+        model_settings=settings or None,
+    )
+
 
 class SpecModifier:
     """Modifies dashboard specs based on user feedback using LLM."""
 
-    def __init__(self, model: str | None = None, enable_thinking: bool = True):
+    def __init__(
+        self,
+        model: str | None = None,
+        enable_thinking: bool = True,
+        use_cache: bool = True,
+    ):
         """Initialize the modifier.
 
         Args:
             model: LLM model identifier (e.g., "openai:gpt-4o", "anthropic:claude-sonnet-4-20250514")
             enable_thinking: Enable extended thinking for Anthropic models (default: True)
+            use_cache: Reuse stored modifications for identical feedback, spec, and image
         """
         model_string = model or os.environ.get("AECH_LLM_WORKER_MODEL", "anthropic:claude-sonnet-4-20250514")
+        self.model_string = model_string
         self.model, _ = parse_model_string(model_string)
-        self._model_settings = get_model_settings(model_string)
         self.enable_thinking = enable_thinking
-        self.agent: Agent[None, SpecModification] = Agent(
-            self.model,
-            output_type=SpecModification,
-            instructions=MODIFICATION_INSTRUCTIONS,
-            model_settings=self._model_settings,
-        )
+        self.agent: Agent[None, SpecModification] = _build_agent(model_string, enable_thinking)
+        self.cache = VLMCache() if use_cache else None
 
     def interpret_feedback(
         self,
         feedback: str,
         current_spec: dict[str, Any],
-        image_path: Path | None = None,
+        image_bytes: bytes | None = None,
     ) -> SpecModification:
         """Interpret user feedback and generate spec modifications.
 
         Args:
             feedback: User's feedback about the dashboard
             current_spec: Current dashboard specification
-            image_path: Optional path to current render for visual context
+            image_bytes: Optional contents of the current render for visual context
 
         Returns:
             SpecModification with changes to apply
         """
-        # Build prompt with current spec context
-        current_style = current_spec.get("style", {})
-        widgets_summary = self._summarize_widgets(current_spec)
+        key, cached = self._cache_lookup(feedback, current_spec, image_bytes)
+        if cached is not None:
+            return cached
 
-        layout = current_spec.get("layout", {})
-        prompt = f"""User feedback: "{feedback}"
+        messages = self._build_messages(feedback, current_spec, image_bytes)
+        result = self.agent.run_sync(messages)
+        self._cache_store(key, result.output)
+
+        return result.output
 
-Current dashboard state:
-- Title: {current_spec.get('title', 'None')}
-- Grid: {layout.get('columns', 12)} columns × {layout.get('rows', 2)} rows
-- Current style: {json.dumps(current_style) if current_style else 'default (no custom style)'}
-- Widgets:
-{widgets_summary}
+    async def interpret_feedback_stream(
+        self,
+        feedback: str,
+        current_spec: dict[str, Any],
+        image_bytes: bytes | None = None,
+    ) -> AsyncIterator[SpecModification]:
+        """Stream spec modifications while the LLM is still generating.
 
-IMPORTANT: If an image is provided, ANALYZE it carefully:
-- Is there excessive empty space anywhere? (top, between rows, around widgets)
-- Are widgets filling their allocated space appropriately?
-- Is text readable at presentation distance?
-- Are elements visually balanced (no tiny widgets next to huge ones)?
-- Do charts have readable axis labels?
+        Snapshots are partially validated, so only fields that are complete
+        so far are set; the last snapshot is the full result.
 
-Based on the feedback AND your visual analysis, what modifications would fix the issues?
-Be BOLD with changes - small tweaks won't fix significant visual problems."""
+        Args:
+            feedback: User's feedback about the dashboard
+            current_spec: Current dashboard specification
+            image_bytes: Optional contents of the current render for visual context
+
+        Yields:
+            SpecModification snapshots, ending with the complete one
+        """
+        # Hashing, image resizing, and SQLite access block; keep them off the event loop
+        key, cached = await asyncio.to_thread(
+            self._cache_lookup, feedback, current_spec, image_bytes
+        )
+        if cached is not None:
+            yield cached
+            return
+
+        messages = await asyncio.to_thread(
+            self._build_messages, feedback, current_spec, image_bytes
+        )
+        async with self.agent.run_stream(messages) as stream:
+            snapshot = None
+            async for snapshot in stream.stream_output():
+                yield snapshot
+
+            output = await stream.get_output()
+            await asyncio.to_thread(self._cache_store, key, output)
+            if output != snapshot:
+                yield output
+
+    def _cache_lookup(
+        self,
+        feedback: str,
+        current_spec: dict[str, Any],
+        image_bytes: bytes | None,
+    ) -> tuple[bytes | None, SpecModification | None]:
+        """Look up stored modifications for this feedback, spec, and image.
+
+        Returns:
+            Tuple of (cache key, cached modification or None)
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.make_key(
+            self.model_string, image_bytes, current_spec,
+            MODIFICATION_INSTRUCTIONS, f"thinking={self.enable_thinking}",
+            str(vlm_image_max_dim()), "feedback", feedback,
+        )
+        cached = self.cache.get(key)
+        if cached is None:
+            return key, None
+        return key, SpecModification.model_validate_json(cached)
+
+    def _cache_store(self, key: bytes | None, modification: SpecModification) -> None:
+        """Store modifications under a key from _cache_lookup."""
+        if self.cache is not None:
+            self.cache.set(key, modification.model_dump_json())
+
+    def _build_messages(
+        self,
+        feedback: str,
+        current_spec: dict[str, Any],
+        image_bytes: bytes | None,
+    ) -> list[Any]:
+        """Build the agent messages for a feedback request.
+
+        Args:
+            feedback: User's feedback about the dashboard
+            current_spec: Current dashboard specification
+            image_bytes: Optional contents of the current render for visual context
+
+        Returns:
+            Prompt string, followed by the image if one was provided
+        """
+        # Build prompt with current spec context
+        current_style = current_spec.get("style", {})
+        fingerprint = self._widgets_fingerprint(current_spec)
+        try:
+            widgets_summary = self._summarize_widgets(fingerprint)
+        except TypeError:
+            # Unhashable label or position values; summarize without caching
+            widgets_summary = self._summarize_widgets.__wrapped__(fingerprint)
+
+        layout = current_spec.get("layout", {})
+        prompt = "".join([
+            f'User feedback: "{feedback}"\n\n',
+            "Current dashboard state:\n",
+            f"- Title: {current_spec.get('title', 'None')}\n",
+            f"- Grid: {layout.get('columns', 12)} columns × {layout.get('rows', 2)} rows\n",
+            f"- Current style: {canonical_json(current_style).decode() if current_style else 'default (no custom style)'}\n",
+            f"- Widgets:\n{widgets_summary}\n\n",
+            _PROMPT_FOOTER,
+        ])
 
         # Include image if provided for visual context
         messages: list[Any] = [prompt]
-        if image_path and image_path.exists():
-            messages.append(BinaryContent.from_path(image_path))
-
-        result = self.agent.run_sync(messages)
+        if image_bytes:
+            messages.append(load_vlm_image(image_bytes))
 
-        return result.output
+        return messages
 
     def apply_modifications(
         self,
@@ -223,78 +359,82 @@ Be BOLD with changes - small tweaks won't fix significant visual problems."""
             modifications: Modifications to apply
 
         Returns:
-            Modified spec (new copy)
+            Modified spec (new copy; unmodified subtrees are shared with spec)
         """
-        # Deep copy spec
-        new_spec = json.loads(json.dumps(spec))
+        # Copy only the containers on the write path
+        new_spec = {**spec}
 
         # Apply style modifications
         if modifications.style:
-            if "style" not in new_spec:
-                new_spec["style"] = {}
-
             style_mod = modifications.style
-            if style_mod.preset:
-                new_spec["style"]["preset"] = style_mod.preset
-            if style_mod.font_scale is not None:
-                new_spec["style"]["font_scale"] = style_mod.font_scale
-            if style_mod.h_spacing is not None:
-                new_spec["style"]["h_spacing"] = style_mod.h_spacing
-            if style_mod.v_spacing is not None:
-                new_spec["style"]["v_spacing"] = style_mod.v_spacing
-            if style_mod.widget_padding is not None:
-                new_spec["style"]["widget_padding"] = style_mod.widget_padding
-            if style_mod.title_size is not None:
-                new_spec["style"]["title_size"] = style_mod.title_size
-            if style_mod.title_margin is not None:
-                new_spec["style"]["title_margin"] = style_mod.title_margin
+            updates = {
+                name: value
+                for name in _STYLE_FIELDS
+                if (value := getattr(style_mod, name)) is not None
+            }
+            if not style_mod.preset:
+                # An empty preset name means "no preset change"
+                updates.pop("preset", None)
+            new_spec["style"] = {**(spec.get("style") or {}), **updates}
 
         # Apply layout changes
         if modifications.layout_changes:
-            if "layout" not in new_spec:
-                new_spec["layout"] = {}
-            new_spec["layout"].update(modifications.layout_changes)
-
-        # Apply widget modifications
-        widgets = new_spec.get("widgets", [])
-        for widget_mod in modifications.widget_modifications:
-            if 0 <= widget_mod.widget_index < len(widgets):
-                widget = widgets[widget_mod.widget_index]
+            new_spec["layout"] = {**(spec.get("layout") or {}), **modifications.layout_changes}
+
+        # Apply widget modifications, copying each touched widget once
+        if modifications.widget_modifications and "widgets" in spec:
+            widgets = list(spec["widgets"])
+            mods_by_index: defaultdict[int, list[WidgetModification]] = defaultdict(list)
+            for widget_mod in modifications.widget_modifications:
+                if 0 <= widget_mod.widget_index < len(widgets):
+                    mods_by_index[widget_mod.widget_index].append(widget_mod)
+
+            for index, widget_mods in mods_by_index.items():
+                widget = {**widgets[index]}
+                config_changes: dict[str, Any] = {}
+                position_changes: dict[str, int] = {}
+                for widget_mod in widget_mods:
+                    config_changes.update(widget_mod.config_changes)
+                    position_changes.update(widget_mod.position_changes)
 
                 # Apply config changes
-                if widget_mod.config_changes:
-                    if "config" not in widget:
-                        widget["config"] = {}
-                    widget["config"].update(widget_mod.config_changes)
+                if config_changes:
+                    widget["config"] = {**widget.get("config", {}), **config_changes}
 
                 # Apply position changes (colspan, rowspan, row, col)
-                if widget_mod.position_changes:
-                    if "position" not in widget:
-                        widget["position"] = {}
-                    widget["position"].update(widget_mod.position_changes)
+                if position_changes:
+                    widget["position"] = {**widget.get("position", {}), **position_changes}
 
-        return new_spec
+                widgets[index] = widget
+            new_spec["widgets"] = widgets
 
-    def _summarize_widgets(self, spec: dict[str, Any]) -> str:
-        """Create a summary of widgets for the prompt."""
-        widgets = spec.get("widgets", [])
-        if not widgets:
-            return "No widgets"
+        return new_spec
 
-        summaries = []
-        for i, w in enumerate(widgets):
-            w_type = w.get("type", "unknown")
+    @staticmethod
+    def _widgets_fingerprint(spec: dict[str, Any]) -> tuple[tuple[Any, ...], ...]:
+        """Reduce widgets to the fields shown in the prompt summary."""
+        fingerprint = []
+        for w in spec.get("widgets", []):
             pos = w.get("position", {})
             config = w.get("config", {})
+            fingerprint.append((
+                w.get("type", "unknown"),
+                pos.get("row", 0),
+                pos.get("col", 0),
+                pos.get("rowspan", 1),
+                pos.get("colspan", 1),
+                config.get("label") or config.get("title") or "",
+            ))
+        return tuple(fingerprint)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _summarize_widgets(fingerprint: tuple[tuple[Any, ...], ...]) -> str:
+        """Create a summary of widgets for the prompt, memoized per fingerprint."""
+        if not fingerprint:
+            return "No widgets"
 
-            label = config.get("label") or config.get("title") or ""
-            row = pos.get("row", 0)
-            col = pos.get("col", 0)
-            rowspan = pos.get("rowspan", 1)
-            colspan = pos.get("colspan", 1)
-
-            summaries.append(
-                f"  [{i}] {w_type}: \"{label}\" at row={row} col={col}, spans {colspan}×{rowspan} (col×row)"
-            )
-
-        return "\n".join(summaries)
+        return "\n".join(
+            f"  [{i}] {w_type}: \"{label}\" at row={row} col={col}, spans {colspan}×{rowspan} (col×row)"
+            for i, (w_type, row, col, rowspan, colspan, label) in enumerate(fingerprint)
+        )
@@ -1,20 +1,22 @@
 """CLI entry point for aech-cli-visualize."""
 
-import json
+import functools
 import sys
+from collections.abc import Callable
+from itertools import islice
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
 
-from .dashboard.composer import DashboardComposer
-from .themes.loader import get_available_themes
-from .utils.data import parse_data_input
-from .utils.export import parse_resolution
-from .widgets.chart import ChartWidget, ChartType
-from .widgets.gauge import GaugeWidget
-from .widgets.kpi import KPIWidget
-from .widgets.table import TableWidget
+from .utils.data import dumps_json, parse_data_input, parse_json_data
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .config.models import AnalysisResult
+    from .iterate.modifier import SpecModification, SpecModifier
+    from .validation.models import RenderResult
 
 app = typer.Typer(
     help="Render charts, KPIs, tables, and dashboards to presentation-ready images.",
@@ -22,22 +24,59 @@ app = typer.Typer(
     add_completion=False,
 )
 
+# Chart types accepted by the chart command, in the order listed in errors
+_CHART_TYPES = ("bar", "line", "pie", "scatter", "area", "heatmap")
+
+# SpecModification fields declared before reasoning
+_MODIFICATION_FIELDS = frozenset({"style", "widget_modifications", "layout_changes"})
+
 
 def output_json(data: dict) -> None:
     """Output JSON to stdout."""
-    print(json.dumps(data, indent=2))
+    payload = dumps_json(data) + b"\n"
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        # Replaced stdout without a byte layer (e.g., captured in tests)
+        sys.stdout.write(payload.decode())
+        return
+    # Keep order with any text already written, then skip the text codec
+    sys.stdout.flush()
+    stream.write(payload)
+
+
+def _json_errors(command: Callable[..., None]) -> Callable[..., None]:
+    """Report a command's unexpected errors as JSON and exit with status 1."""
+    @functools.wraps(command)
+    def wrapper(*args, **kwargs) -> None:
+        try:
+            command(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            output_json({
+                "success": False,
+                "error": str(e),
+            })
+            raise typer.Exit(1)
 
+    return wrapper
 
-def get_file_info(path: Path) -> dict:
-    """Get file info for output."""
-    return {
+
+def get_file_info(path: Path, width: int | None = None, height: int | None = None) -> dict:
+    """Get file info for output, with image dimensions when given."""
+    info = {
         "path": str(path),
         "format": path.suffix[1:],
         "size_bytes": path.stat().st_size,
     }
+    if width is not None:
+        info["width"] = width
+        info["height"] = height
+    return info
 
 
 @app.command("chart")
+@_json_errors
 def chart_command(
     chart_type: Annotated[str, typer.Argument(help="Chart type: bar, line, pie, scatter, area, heatmap")],
     data_file: Annotated[Optional[str], typer.Argument(help="Path to JSON data file (reads stdin if omitted)")] = None,
@@ -51,48 +90,42 @@ def chart_command(
     Input: JSON with x/y values or series data.
     Output: chart image at <output-dir>/chart.<format>.
     """
-    try:
-        # Parse input data
-        data = parse_data_input(data_file)
-
-        # Validate chart type
-        valid_types = ["bar", "line", "pie", "scatter", "area", "heatmap"]
-        if chart_type not in valid_types:
-            output_json({
-                "success": False,
-                "error": f"Invalid chart type: {chart_type}. Valid types: {', '.join(valid_types)}",
-            })
-            raise typer.Exit(1)
-
-        # Create and render widget
-        widget = ChartWidget(
-            chart_type=chart_type,  # type: ignore
-            data=data,
-            title=title,
-            theme=theme,
-        )
+    from .widgets.chart import ChartWidget
 
-        output_path = widget.render(
-            output_dir=output_dir,
-            filename="chart",
-            format=format,  # type: ignore
-        )
+    # Parse input data
+    data = parse_data_input(data_file)
 
-        output_json({
-            "success": True,
-            "output_files": [get_file_info(output_path)],
-            "message": f"Chart rendered successfully",
-        })
-
-    except Exception as e:
+    # Validate chart type
+    if chart_type not in _CHART_TYPES:
         output_json({
             "success": False,
-            "error": str(e),
+            "error": f"Invalid chart type: {chart_type}. Valid types: {', '.join(_CHART_TYPES)}",
         })
         raise typer.Exit(1)
 
+    # Create and render widget
+    widget = ChartWidget(
+        chart_type=chart_type,  # type: ignore
+        data=data,
+        title=title,
+        theme=theme,
+    )
+
+    output_path = widget.render(
+        output_dir=output_dir,
+        filename="chart",
+        format=format,  # type: ignore
+    )
+
+    output_json({
+        "success": True,
+        "output_files": [get_file_info(output_path)],
+        "message": f"Chart rendered successfully",
+    })
+
 
 @app.command("kpi")
+@_json_errors
 def kpi_command(
     value: Annotated[str, typer.Option("--value", help="Metric value to display")],
     label: Annotated[str, typer.Option("--label", help="Label describing the metric")],
@@ -108,45 +141,42 @@ def kpi_command(
     Input: value and label via options.
     Output: KPI card image at <output-dir>/kpi.<format>.
     """
-    try:
-        # Try to convert value to number
-        try:
-            numeric_value: float | int | str = float(value)
-            if numeric_value == int(numeric_value):
-                numeric_value = int(numeric_value)
-        except ValueError:
-            numeric_value = value
-
-        widget = KPIWidget(
-            value=numeric_value,
-            label=label,
-            delta=delta,
-            delta_good=delta_good,
-            format_value=format_value,
-            theme=theme,
-        )
+    from .widgets.kpi import KPIWidget
 
-        output_path = widget.render(
-            output_dir=output_dir,
-            filename="kpi",
-            format=format,  # type: ignore
+    # Try to convert value to number, keeping whole numbers as int
+    try:
+        numeric_value: float | int | str = (
+            int(value) if value.strip().lstrip("+-").isdigit() else float(value)
         )
+        if isinstance(numeric_value, float) and numeric_value.is_integer():
+            numeric_value = int(numeric_value)
+    except ValueError:
+        numeric_value = value
+
+    widget = KPIWidget(
+        value=numeric_value,
+        label=label,
+        delta=delta,
+        delta_good=delta_good,
+        format_value=format_value,
+        theme=theme,
+    )
+
+    output_path = widget.render(
+        output_dir=output_dir,
+        filename="kpi",
+        format=format,  # type: ignore
+    )
 
-        output_json({
-            "success": True,
-            "output_files": [get_file_info(output_path)],
-            "message": "KPI rendered successfully",
-        })
-
-    except Exception as e:
-        output_json({
-            "success": False,
-            "error": str(e),
-        })
-        raise typer.Exit(1)
+    output_json({
+        "success": True,
+        "output_files": [get_file_info(output_path)],
+        "message": "KPI rendered successfully",
+    })
 
 
 @app.command("table")
+@_json_errors
 def table_command(
     data_file: Annotated[Optional[str], typer.Argument(help="Path to JSON file (reads stdin if omitted)")] = None,
     output_dir: Annotated[str, typer.Option("--output-dir", help="Directory for output image")] = ".",
@@ -159,47 +189,42 @@ def table_command(
     Input: JSON with headers and rows.
     Output: table image at <output-dir>/table.<format>.
     """
-    try:
-        data = parse_data_input(data_file)
-
-        headers = data.get("headers", [])
-        rows = data.get("rows", [])
-
-        if not headers:
-            output_json({
-                "success": False,
-                "error": "Data must include 'headers' array",
-            })
-            raise typer.Exit(1)
-
-        widget = TableWidget(
-            headers=headers,
-            rows=rows,
-            title=title,
-            theme=theme,
-        )
+    from .widgets.table import TableWidget
 
-        output_path = widget.render(
-            output_dir=output_dir,
-            filename="table",
-            format=format,  # type: ignore
-        )
+    data = parse_data_input(data_file)
 
-        output_json({
-            "success": True,
-            "output_files": [get_file_info(output_path)],
-            "message": "Table rendered successfully",
-        })
+    headers = data.get("headers", [])
+    rows = data.get("rows", [])
 
-    except Exception as e:
+    if not headers:
         output_json({
             "success": False,
-            "error": str(e),
+            "error": "Data must include 'headers' array",
         })
         raise typer.Exit(1)
 
+    widget = TableWidget(
+        headers=headers,
+        rows=rows,
+        title=title,
+        theme=theme,
+    )
+
+    output_path = widget.render(
+        output_dir=output_dir,
+        filename="table",
+        format=format,  # type: ignore
+    )
+
+    output_json({
+        "success": True,
+        "output_files": [get_file_info(output_path)],
+        "message": "Table rendered successfully",
+    })
+
 
 @app.command("gauge")
+@_json_errors
 def gauge_command(
     value: Annotated[float, typer.Option("--value", help="Current value to display")],
     output_dir: Annotated[str, typer.Option("--output-dir", help="Directory for output image")] = ".",
@@ -215,196 +240,271 @@ def gauge_command(
     Input: value and range via options.
     Output: gauge image at <output-dir>/gauge.<format>.
     """
-    try:
-        # Parse thresholds if provided
-        threshold_list = None
-        if thresholds:
-            threshold_list = json.loads(thresholds)
-
-        widget = GaugeWidget(
-            value=value,
-            min_val=min_val,
-            max_val=max_val,
-            label=label,
-            thresholds=threshold_list,
-            theme=theme,
-        )
+    from .widgets.gauge import GaugeWidget
+
+    # Parse thresholds if provided
+    threshold_list = None
+    if thresholds:
+        threshold_list = parse_json_data(thresholds)
+
+    widget = GaugeWidget(
+        value=value,
+        min_val=min_val,
+        max_val=max_val,
+        label=label,
+        thresholds=threshold_list,
+        theme=theme,
+    )
+
+    output_path = widget.render(
+        output_dir=output_dir,
+        filename="gauge",
+        format=format,  # type: ignore
+    )
 
-        output_path = widget.render(
-            output_dir=output_dir,
-            filename="gauge",
-            format=format,  # type: ignore
-        )
+    output_json({
+        "success": True,
+        "output_files": [get_file_info(output_path)],
+        "message": "Gauge rendered successfully",
+    })
 
-        output_json({
-            "success": True,
-            "output_files": [get_file_info(output_path)],
-            "message": "Gauge rendered successfully",
-        })
 
-    except Exception as e:
-        output_json({
-            "success": False,
-            "error": str(e),
-        })
-        raise typer.Exit(1)
+def _validation_info(result: "RenderResult") -> dict:
+    """Summarize a validated render for the JSON output."""
+    history = result.validation_history
+    last = history[-1] if history else None
+
+    # Build validation metadata for output
+    validation_info = {
+        "enabled": True,
+        "iterations": result.iterations,
+        "final_status": "approved" if last and last.is_acceptable else "issues_remaining",
+        "corrections_applied": len(result.corrections_applied),
+    }
+
+    if last is not None:
+        # Summarize resolved issues from every validation but the last
+        if len(history) > 1:
+            resolved = [
+                {"type": issue.issue_type, "widgets": issue.affected_widgets}
+                for vr in islice(history, len(history) - 1)
+                for issue in vr.issues
+            ]
+            if resolved:
+                validation_info["issues_resolved"] = resolved
+
+        # Remaining issues from last validation
+        if last.issues:
+            validation_info["remaining_issues"] = [
+                {"type": i.issue_type, "severity": i.severity}
+                for i in last.issues
+            ]
+
+    return validation_info
 
 
 @app.command("dashboard")
+@_json_errors
 def dashboard_command(
     spec_file: Annotated[Optional[str], typer.Argument(help="Path to dashboard spec JSON (reads stdin if omitted)")] = None,
     output_dir: Annotated[str, typer.Option("--output-dir", help="Directory for output image")] = ".",
     theme: Annotated[str, typer.Option("--theme", help="Visual theme for all widgets")] = "corporate",
     resolution: Annotated[str, typer.Option("--resolution", help="Output resolution: 1080p, 4k, or WxH")] = "1080p",
-    format: Annotated[str, typer.Option("--format", help="Output format: png, svg, pdf")] = "png",
+    format: Annotated[str, typer.Option("--format", help="Output format: png, svg, pdf, or a comma-separated list (e.g., png,svg)")] = "png",
     vlm_validate: Annotated[bool, typer.Option("--vlm-validate/--no-vlm-validate", help="Enable VLM validation loop")] = False,
     vlm_max_iterations: Annotated[int, typer.Option("--vlm-max-iterations", help="Max VLM correction iterations")] = 3,
     vlm_model: Annotated[Optional[str], typer.Option("--vlm-model", help="VLM model (e.g., openai:gpt-4o)")] = None,
+    cache: Annotated[bool, typer.Option("--cache/--no-cache", help="Reuse stored VLM results for identical renders")] = True,
+    vlm_concurrency: Annotated[int, typer.Option("--vlm-concurrency", help="Max dashboards rendered/validated at once for a list of specs")] = 10,
 ) -> None:
     """Compose multiple widgets into a single dashboard image.
 
-    Input: JSON specification with layout and widgets.
-    Output: dashboard image at <output-dir>/dashboard.<format>.
+    Input: JSON specification with layout and widgets, or a JSON list of them.
+    Output: dashboard image at <output-dir>/dashboard.<format>, or
+    <output-dir>/dashboard_<i>.<format> for each spec in a list.
+
+    Several comma-separated formats render one spec to each of them from a
+    single composed figure and export call. They cannot be combined with a
+    list of specs or --vlm-validate.
 
     Use --vlm-validate to enable VLM-based validation that checks the rendered
-    output for visual issues and automatically applies corrections.
+    output for visual issues and automatically applies corrections. A list of
+    specs is processed concurrently, up to --vlm-concurrency at a time; the
+    VLM provider's rate limits cap the effective parallelism.
     """
-    try:
-        spec = parse_data_input(spec_file)
-        width, height = parse_resolution(resolution)
+    from .dashboard.composer import DashboardComposer
+    from .utils.export import parse_resolution
 
-        if vlm_validate:
-            # Use validated composer with VLM feedback loop
-            from .dashboard.validated_composer import ValidatedDashboardComposer
-
-            composer = ValidatedDashboardComposer(
-                spec=spec,
-                theme=theme,
-                enable_vlm_validation=True,
-                max_iterations=vlm_max_iterations,
-                vlm_model=vlm_model,
-            )
+    spec = parse_data_input(spec_file)
+    width, height = parse_resolution(resolution)
+    formats = [f.strip() for f in format.split(",")]
+
+    if len(formats) > 1 and (isinstance(spec, list) or vlm_validate):
+        raise ValueError("Multiple formats need a single spec without --vlm-validate")
+
+    if isinstance(spec, list):
+        from .dashboard.validated_composer import RenderJob, ValidatedDashboardComposer
 
-            result = composer.render(
+        composer = ValidatedDashboardComposer(
+            spec={},
+            theme=theme,
+            enable_vlm_validation=vlm_validate,
+            max_iterations=vlm_max_iterations,
+            vlm_model=vlm_model,
+            use_vlm_cache=cache,
+        )
+        jobs = [
+            RenderJob(
+                spec=dashboard_spec,
                 output_dir=output_dir,
-                filename="dashboard",
+                filename=f"dashboard_{i}",
                 format=format,  # type: ignore
                 resolution=resolution,
             )
+            for i, dashboard_spec in enumerate(spec)
+        ]
+        results = composer.render_many(jobs, max_concurrency=vlm_concurrency)
+
+        output_files = []
+        validations = []
+        errors = []
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                errors.append({"index": i, "error": str(result)})
+                continue
+            output_files.append(get_file_info(result.path, width, height))
+            if vlm_validate:
+                validations.append({"index": i, **_validation_info(result)})
+
+        output_data = {
+            "success": not errors,
+            "output_files": output_files,
+            "message": f"{len(output_files)} of {len(jobs)} dashboard(s) rendered",
+        }
+        if vlm_validate:
+            output_data["validation"] = validations
+        if errors:
+            output_data["errors"] = errors
 
-            # Build validation metadata for output
-            validation_info = {
-                "enabled": True,
-                "iterations": result.iterations,
-                "final_status": "approved" if (
-                    result.validation_history
-                    and result.validation_history[-1].is_acceptable
-                ) else "issues_remaining",
-                "corrections_applied": len(result.corrections_applied),
-            }
+        output_json(output_data)
+        if errors:
+            raise typer.Exit(1)
+        return
 
-            if result.validation_history:
-                # Summarize resolved issues
-                all_issues = []
-                for vr in result.validation_history[:-1]:
-                    for issue in vr.issues:
-                        all_issues.append({
-                            "type": issue.issue_type,
-                            "widgets": issue.affected_widgets,
-                        })
-                validation_info["issues_resolved"] = all_issues
-
-                # Remaining issues from last validation
-                if result.validation_history[-1].issues:
-                    validation_info["remaining_issues"] = [
-                        {"type": i.issue_type, "severity": i.severity}
-                        for i in result.validation_history[-1].issues
-                    ]
-
-            output_data = {
-                "success": True,
-                "output_files": [{
-                    **get_file_info(result.path),
-                    "width": width,
-                    "height": height,
-                }],
-                "validation": validation_info,
-                "message": f"Dashboard rendered after {result.iterations} iteration(s)",
-            }
+    if vlm_validate:
+        # Use validated composer with VLM feedback loop
+        from .dashboard.validated_composer import ValidatedDashboardComposer
 
-            if result.warning:
-                output_data["warning"] = result.warning
-            if result.vlm_error:
-                output_data["vlm_error"] = result.vlm_error
+        composer = ValidatedDashboardComposer(
+            spec=spec,
+            theme=theme,
+            enable_vlm_validation=True,
+            max_iterations=vlm_max_iterations,
+            vlm_model=vlm_model,
+            use_vlm_cache=cache,
+        )
+
+        result = composer.render(
+            output_dir=output_dir,
+            filename="dashboard",
+            format=format,  # type: ignore
+            resolution=resolution,
+        )
 
-            output_json(output_data)
+        validation_info = _validation_info(result)
 
-        else:
-            # Standard render without VLM validation
-            composer = DashboardComposer(spec=spec, theme=theme)
+        output_data = {
+            "success": True,
+            "output_files": [get_file_info(result.path, width, height)],
+            "validation": validation_info,
+            "message": f"Dashboard rendered after {result.iterations} iteration(s)",
+        }
+
+        if result.warning:
+            output_data["warning"] = result.warning
+        if result.vlm_error:
+            output_data["vlm_error"] = result.vlm_error
+
+        output_json(output_data)
+
+    else:
+        # Standard render without VLM validation
+        composer = DashboardComposer(spec=spec, theme=theme)
 
-            output_path = composer.render(
+        if len(formats) > 1:
+            output_paths = composer.render_many(
                 output_dir=output_dir,
                 filename="dashboard",
-                format=format,  # type: ignore
+                formats=formats,  # type: ignore
                 resolution=resolution,
             )
+        else:
+            output_paths = [composer.render(
+                output_dir=output_dir,
+                filename="dashboard",
+                format=format,  # type: ignore
+                resolution=resolution,
+            )]
 
-            output_json({
-                "success": True,
-                "output_files": [{
-                    **get_file_info(output_path),
-                    "width": width,
-                    "height": height,
-                }],
-                "message": "Dashboard rendered successfully",
-            })
-
-    except Exception as e:
         output_json({
-            "success": False,
-            "error": str(e),
+            "success": True,
+            "output_files": [get_file_info(path, width, height) for path in output_paths],
+            "message": "Dashboard rendered successfully",
         })
-        raise typer.Exit(1)
+
+
+def _analysis_info(result: "AnalysisResult", questions: bool) -> dict:
+    """Build the JSON payload for one AnalysisResult."""
+    return {
+        "analysis": {
+            "fields": [f.model_dump() for f in result.fields],
+            "patterns": [p.model_dump() for p in result.patterns],
+            "suggested_widgets": [w.model_dump() for w in result.suggested_widgets],
+        },
+        "questions": [q.model_dump() for q in result.questions] if questions else [],
+        "schema_fingerprint": result.schema_fingerprint,
+        "matching_configs": result.matching_configs,
+    }
 
 
 @app.command("analyze")
+@_json_errors
 def analyze_command(
     data_file: Annotated[Optional[str], typer.Argument(help="Path to JSON data file (reads stdin if omitted)")] = None,
     questions: Annotated[bool, typer.Option("--questions/--no-questions", help="Include clarifying questions")] = True,
     use_llm: Annotated[bool, typer.Option("--llm/--no-llm", help="Use LLM for enhanced analysis")] = True,
+    llm_concurrency: Annotated[int, typer.Option("--llm-concurrency", help="Max LLM requests in flight for a list of datasets")] = 5,
 ) -> None:
     """Analyze data to suggest visualizations and generate dashboard recommendations.
 
-    Input: JSON data with field names as keys and value arrays.
+    Input: JSON data with field names as keys and value arrays, or a JSON list of them.
     Output: Field analysis, detected patterns, widget suggestions, and optional questions.
+    A list of datasets is analyzed with up to --llm-concurrency LLM requests at once
+    and reported under "analyses", in input order.
     """
-    try:
-        from .config import DataAnalyzer
+    from .config import DataAnalyzer
 
-        data = parse_data_input(data_file)
-        analyzer = DataAnalyzer(use_llm=use_llm)
-        result = analyzer.analyze(data, include_questions=questions)
+    data = parse_data_input(data_file)
+    analyzer = DataAnalyzer(use_llm=use_llm, max_concurrent_llm=llm_concurrency)
 
+    if isinstance(data, list):
+        import asyncio
+
+        results = asyncio.run(analyzer.analyze_batch(data, include_questions=questions))
         output_json({
             "success": True,
-            "analysis": {
-                "fields": [f.model_dump() for f in result.fields],
-                "patterns": [p.model_dump() for p in result.patterns],
-                "suggested_widgets": [w.model_dump() for w in result.suggested_widgets],
-            },
-            "questions": [q.model_dump() for q in result.questions] if questions else [],
-            "schema_fingerprint": result.schema_fingerprint,
-            "matching_configs": result.matching_configs,
-            "message": f"Analyzed {len(result.fields)} fields, detected {len(result.patterns)} patterns",
+            "analyses": [_analysis_info(result, questions) for result in results],
+            "message": f"Analyzed {len(results)} dataset(s)",
         })
+        return
 
-    except Exception as e:
-        output_json({
-            "success": False,
-            "error": str(e),
-        })
-        raise typer.Exit(1)
+    result = analyzer.analyze(data, include_questions=questions)
+
+    output_json({
+        "success": True,
+        **_analysis_info(result, questions),
+        "message": f"Analyzed {len(result.fields)} fields, detected {len(result.patterns)} patterns",
+    })
 
 
 # Config subcommand group
@@ -413,6 +513,7 @@ app.add_typer(config_app, name="config")
 
 
 @config_app.command("save")
+@_json_errors
 def config_save_command(
     name: Annotated[str, typer.Option("--name", help="Unique name for the config")],
     spec_file: Annotated[Optional[str], typer.Argument(help="Path to spec JSON (reads stdin if omitted)")] = None,
@@ -420,192 +521,201 @@ def config_save_command(
     description: Annotated[Optional[str], typer.Option("--description", help="Description of the dashboard")] = None,
 ) -> None:
     """Save a dashboard specification to the config repository."""
-    try:
-        from .config import ConfigRepository
+    from .config import ConfigRepository
 
-        spec = parse_data_input(spec_file)
-        repo = ConfigRepository()
+    spec = parse_data_input(spec_file)
+    repo = ConfigRepository()
 
-        tag_list = [t.strip() for t in tags.split(",")] if tags else []
+    tag_list = [t.strip() for t in tags.split(",")] if tags else []
 
-        metadata = repo.save(
-            spec=spec,
-            name=name,
-            tags=tag_list,
-            description=description,
-        )
+    metadata = repo.save(
+        spec=spec,
+        name=name,
+        tags=tag_list,
+        description=description,
+    )
 
-        output_json({
-            "success": True,
-            "config": {
-                "id": metadata.id,
-                "name": metadata.name,
-                "tags": metadata.tags,
-                "created_at": metadata.created_at.isoformat(),
-            },
-            "message": f"Config '{name}' saved successfully",
-        })
-
-    except Exception as e:
-        output_json({
-            "success": False,
-            "error": str(e),
-        })
-        raise typer.Exit(1)
+    output_json({
+        "success": True,
+        "config": {
+            "id": metadata.id,
+            "name": metadata.name,
+            "tags": metadata.tags,
+            "created_at": metadata.created_datetime.isoformat(),
+        },
+        "message": f"Config '{name}' saved successfully",
+    })
 
 
 @config_app.command("list")
+@_json_errors
 def config_list_command(
     tags: Annotated[Optional[str], typer.Option("--tags", help="Filter by tags (comma-separated)")] = None,
     limit: Annotated[int, typer.Option("--limit", help="Maximum configs to return")] = 20,
 ) -> None:
     """List saved dashboard configurations."""
-    try:
-        from .config import ConfigRepository
+    from .config import ConfigRepository
 
-        repo = ConfigRepository()
-        tag_list = [t.strip() for t in tags.split(",")] if tags else None
-        configs = repo.list_configs(tags=tag_list, limit=limit)
+    repo = ConfigRepository()
+    tag_list = [t.strip() for t in tags.split(",")] if tags else None
+    configs = repo.list_configs(tags=tag_list, limit=limit)
 
-        output_json({
-            "success": True,
-            "configs": [
-                {
-                    "id": c.id,
-                    "name": c.name,
-                    "description": c.description,
-                    "tags": c.tags,
-                    "created_at": c.created_at.isoformat(),
-                    "last_used_at": c.last_used_at.isoformat() if c.last_used_at else None,
-                    "usage_count": c.usage_count,
-                }
-                for c in configs
-            ],
-            "count": len(configs),
-            "message": f"Found {len(configs)} config(s)",
-        })
-
-    except Exception as e:
-        output_json({
-            "success": False,
-            "error": str(e),
-        })
-        raise typer.Exit(1)
+    output_json({
+        "success": True,
+        "configs": [
+            {
+                "id": c.id,
+                "name": c.name,
+                "description": c.description,
+                "tags": c.tags,
+                "created_at": c.created_datetime.isoformat(),
+                "last_used_at": c.last_used_datetime.isoformat() if c.last_used_at else None,
+                "usage_count": c.usage_count,
+            }
+            for c in configs
+        ],
+        "count": len(configs),
+        "message": f"Found {len(configs)} config(s)",
+    })
 
 
 @config_app.command("get")
+@_json_errors
 def config_get_command(
     name_or_id: Annotated[str, typer.Argument(help="Config name or UUID")],
 ) -> None:
     """Retrieve a saved dashboard configuration by name or ID."""
-    try:
-        from .config import ConfigRepository
-
-        repo = ConfigRepository()
-        result = repo.get(name_or_id)
+    from .config import ConfigRepository
 
-        if not result:
-            output_json({
-                "success": False,
-                "error": f"Config '{name_or_id}' not found",
-            })
-            raise typer.Exit(1)
-
-        metadata, spec = result
-
-        output_json({
-            "success": True,
-            "config": {
-                "id": metadata.id,
-                "name": metadata.name,
-                "description": metadata.description,
-                "tags": metadata.tags,
-                "created_at": metadata.created_at.isoformat(),
-                "last_used_at": metadata.last_used_at.isoformat() if metadata.last_used_at else None,
-                "usage_count": metadata.usage_count,
-                "schema_fingerprint": metadata.schema_fingerprint,
-            },
-            "spec": spec,
-            "message": f"Retrieved config '{metadata.name}'",
-        })
+    repo = ConfigRepository()
+    result = repo.get(name_or_id)
 
-    except Exception as e:
+    if not result:
         output_json({
             "success": False,
-            "error": str(e),
+            "error": f"Config '{name_or_id}' not found",
         })
         raise typer.Exit(1)
 
+    metadata, spec = result
+
+    output_json({
+        "success": True,
+        "config": {
+            "id": metadata.id,
+            "name": metadata.name,
+            "description": metadata.description,
+            "tags": metadata.tags,
+            "created_at": metadata.created_datetime.isoformat(),
+            "last_used_at": metadata.last_used_datetime.isoformat() if metadata.last_used_at else None,
+            "usage_count": metadata.usage_count,
+            "schema_fingerprint": metadata.schema_fingerprint,
+        },
+        "spec": spec,
+        "message": f"Retrieved config '{metadata.name}'",
+    })
+
 
 @config_app.command("match")
+@_json_errors
 def config_match_command(
     data_file: Annotated[Optional[str], typer.Argument(help="Path to JSON data (reads stdin if omitted)")] = None,
     limit: Annotated[int, typer.Option("--limit", help="Maximum matches to return")] = 5,
 ) -> None:
     """Find saved configs that match a data schema."""
-    try:
-        from .config import ConfigRepository
+    from .config import ConfigRepository
 
-        data = parse_data_input(data_file)
-        repo = ConfigRepository()
-        matches = repo.find_by_data(data, limit=limit)
+    data = parse_data_input(data_file)
+    repo = ConfigRepository()
+    matches = repo.find_by_data(data, limit=limit)
 
-        output_json({
-            "success": True,
-            "matches": [
-                {
-                    "id": c.id,
-                    "name": c.name,
-                    "description": c.description,
-                    "tags": c.tags,
-                    "usage_count": c.usage_count,
-                }
-                for c in matches
-            ],
-            "count": len(matches),
-            "message": f"Found {len(matches)} matching config(s)" if matches else "No matching configs found",
-        })
-
-    except Exception as e:
-        output_json({
-            "success": False,
-            "error": str(e),
-        })
-        raise typer.Exit(1)
+    output_json({
+        "success": True,
+        "matches": [
+            {
+                "id": c.id,
+                "name": c.name,
+                "description": c.description,
+                "tags": c.tags,
+                "usage_count": c.usage_count,
+            }
+            for c in matches
+        ],
+        "count": len(matches),
+        "message": f"Found {len(matches)} matching config(s)" if matches else "No matching configs found",
+    })
 
 
 @config_app.command("delete")
+@_json_errors
 def config_delete_command(
     name_or_id: Annotated[str, typer.Argument(help="Config name or UUID to delete")],
 ) -> None:
     """Delete a saved configuration from the repository."""
-    try:
-        from .config import ConfigRepository
+    from .config import ConfigRepository
 
-        repo = ConfigRepository()
-        deleted = repo.delete(name_or_id)
+    repo = ConfigRepository()
+    deleted = repo.delete(name_or_id)
 
-        if deleted:
-            output_json({
-                "success": True,
-                "message": f"Config '{name_or_id}' deleted successfully",
-            })
-        else:
-            output_json({
-                "success": False,
-                "error": f"Config '{name_or_id}' not found",
-            })
-            raise typer.Exit(1)
-
-    except Exception as e:
+    if deleted:
+        output_json({
+            "success": True,
+            "message": f"Config '{name_or_id}' deleted successfully",
+        })
+    else:
         output_json({
             "success": False,
-            "error": str(e),
+            "error": f"Config '{name_or_id}' not found",
         })
         raise typer.Exit(1)
 
 
+async def _interpret_and_render(
+    modifier: "SpecModifier",
+    spec: dict,
+    feedback: str,
+    image_bytes: bytes | None,
+    render: Callable[[dict], Path],
+) -> tuple["SpecModification", dict, Path]:
+    """Stream feedback interpretation and start rendering before it finishes.
+
+    reasoning is required, so no snapshot validates before the model starts
+    writing it. Providers don't guarantee field order: only when the first
+    snapshot already carries every other field were they written before
+    reasoning and are complete. Rendering then starts in a worker thread
+    while reasoning streams in, and is redone only if the final
+    modifications differ.
+
+    Returns:
+        Tuple of (modifications, new_spec, output_path)
+    """
+    import asyncio
+
+    speculative: tuple[dict, "asyncio.Task[Path]"] | None = None
+    modifications = None
+    first = True
+    async for modifications in modifier.interpret_feedback_stream(feedback, spec, image_bytes):
+        if first and _MODIFICATION_FIELDS <= modifications.model_fields_set:
+            early_spec = modifier.apply_modifications(spec, modifications)
+            speculative = (early_spec, asyncio.create_task(asyncio.to_thread(render, early_spec)))
+        first = False
+
+    new_spec = modifier.apply_modifications(spec, modifications)
+
+    if speculative is not None:
+        # Always wait: a redo would write to the same file
+        try:
+            output_path = await speculative[1]
+        except Exception:
+            output_path = None
+        if output_path is not None and speculative[0] == new_spec:
+            return modifications, new_spec, output_path
+
+    return modifications, new_spec, await asyncio.to_thread(render, new_spec)
+
+
 @app.command("iterate")
+@_json_errors
 def iterate_command(
     spec_file: Annotated[Optional[str], typer.Argument(help="Path to spec JSON (reads stdin if omitted)")] = None,
     feedback: Annotated[str, typer.Option("--feedback", "-f", help="User feedback to apply")] = "",
@@ -615,6 +725,7 @@ def iterate_command(
     format: Annotated[str, typer.Option("--format", help="Output format: png, svg, pdf")] = "png",
     resolution: Annotated[str, typer.Option("--resolution", help="Output resolution")] = "1080p",
     save_spec: Annotated[bool, typer.Option("--save-spec/--no-save-spec", help="Save modified spec to output dir")] = True,
+    cache: Annotated[bool, typer.Option("--cache/--no-cache", help="Reuse stored LLM results for identical feedback and spec")] = True,
 ) -> None:
     """Iterate on a dashboard based on user feedback.
 
@@ -624,82 +735,80 @@ def iterate_command(
     Example:
         aech-cli-visualize iterate spec.json --feedback "fonts too small, too crowded"
     """
-    try:
-        from .iterate import SpecModifier
-        from .dashboard.composer import DashboardComposer
+    import asyncio
+
+    from .iterate import SpecModifier
+    from .dashboard.composer import DashboardComposer
+    from .utils.export import parse_resolution
+
+    if not feedback:
+        output_json({
+            "success": False,
+            "error": "Feedback is required. Use --feedback 'your feedback here'",
+        })
+        raise typer.Exit(1)
 
-        if not feedback:
+    # Read the previous render once; the cache key and prompt share the bytes
+    image_bytes = None
+    if previous_image:
+        image_file = Path(previous_image)
+        if not image_file.is_file():
             output_json({
                 "success": False,
-                "error": "Feedback is required. Use --feedback 'your feedback here'",
+                "error": f"Previous image not found: {previous_image}",
             })
             raise typer.Exit(1)
+        image_bytes = image_file.read_bytes()
 
-        # Parse input spec
-        spec = parse_data_input(spec_file)
+    # Parse input spec
+    spec = parse_data_input(spec_file)
 
-        # Initialize modifier
-        modifier = SpecModifier()
+    # Initialize modifier
+    modifier = SpecModifier(use_cache=cache)
 
-        # Get previous image path if provided
-        image_path = Path(previous_image) if previous_image else None
-
-        # Interpret feedback and generate modifications
-        modifications = modifier.interpret_feedback(
-            feedback=feedback,
-            current_spec=spec,
-            image_path=image_path,
-        )
-
-        # Apply modifications
-        new_spec = modifier.apply_modifications(spec, modifications)
-
-        # Render with new spec
+    def render(new_spec: dict) -> Path:
         composer = DashboardComposer(new_spec, theme=theme)
-        output_path = composer.render(
+        return composer.render(
             output_dir=output_dir,
             filename="dashboard",
             format=format,  # type: ignore
             resolution=resolution,
         )
 
-        # Add image dimensions
-        width, height = parse_resolution(resolution)
-        file_info = get_file_info(output_path)
-        file_info["width"] = width
-        file_info["height"] = height
+    # Interpret feedback, apply modifications, and render with new spec
+    modifications, new_spec, output_path = asyncio.run(_interpret_and_render(
+        modifier, spec, feedback, image_bytes, render
+    ))
 
-        # Save modified spec if requested
-        spec_path = None
-        if save_spec:
-            spec_path = Path(output_dir) / "dashboard_spec.json"
-            with open(spec_path, "w") as f:
-                json.dump(new_spec, f, indent=2)
+    # Add image dimensions
+    width, height = parse_resolution(resolution)
+    file_info = get_file_info(output_path, width, height)
 
-        output_json({
-            "success": True,
-            "output_files": [file_info],
-            "spec_file": str(spec_path) if spec_path else None,
-            "modifications": {
-                "reasoning": modifications.reasoning,
-                "style_changes": modifications.style.model_dump(exclude_none=True) if modifications.style else {},
-                "widget_count": len(modifications.widget_modifications),
-                "layout_changes": modifications.layout_changes,
-            },
-            "message": f"Dashboard iterated successfully based on feedback",
-        })
+    # Save modified spec if requested
+    spec_path = None
+    if save_spec:
+        spec_path = Path(output_dir) / "dashboard_spec.json"
+        spec_path.write_bytes(dumps_json(new_spec))
 
-    except Exception as e:
-        output_json({
-            "success": False,
-            "error": str(e),
-        })
-        raise typer.Exit(1)
+    output_json({
+        "success": True,
+        "output_files": [file_info],
+        "spec_file": str(spec_path) if spec_path else None,
+        "modifications": {
+            "reasoning": modifications.reasoning,
+            "style_changes": modifications.style.model_dump(exclude_none=True) if modifications.style else {},
+            "widget_count": len(modifications.widget_modifications),
+            "layout_changes": modifications.layout_changes,
+        },
+        "message": f"Dashboard iterated successfully based on feedback",
+    })
 
 
 @app.command("themes", hidden=True)
 def themes_command() -> None:
     """List available themes."""
+    from .themes.loader import get_available_themes
+
     themes = get_available_themes()
     output_json({
         "themes": themes,
@@ -708,6 +817,10 @@ def themes_command() -> None:
 
 def run() -> None:
     """Entry point for the CLI."""
+    # `themes` takes no arguments; skip building the Click command tree
+    if sys.argv[1:] == ["themes"]:
+        themes_command()
+        return
     app()
 
 
@@ -9,6 +9,9 @@ Example: anthropic:claude-sonnet-4-20250514@thinking=true
 
 from typing import Any
 
+# Boolean spellings accepted for @key=value settings (compared lowercased)
+_BOOL_VALUES = {"true": True, "false": False}
+
 
 def parse_model_string(model_string: str) -> tuple[str, dict[str, Any]]:
     """Parse model string with optional settings.
@@ -21,38 +24,46 @@ def parse_model_string(model_string: str) -> tuple[str, dict[str, Any]]:
     Returns:
         Tuple of (model_name, settings_dict)
     """
-    if "@" not in model_string:
+    model_name, sep, rest = model_string.partition("@")
+    if not sep:
         return model_string, {}
 
-    parts = model_string.split("@")
-    model_name = parts[0]
     settings: dict[str, Any] = {}
-
-    for part in parts[1:]:
-        if "=" in part:
-            key, value = part.split("=", 1)
-            # Parse value types
-            if value.lower() == "true":
-                settings[key] = True
-            elif value.lower() == "false":
-                settings[key] = False
-            elif value.isdigit():
-                settings[key] = int(value)
-            else:
-                settings[key] = value
+    for part in rest.split("@"):
+        key, eq, value = part.partition("=")
+        if not eq:
+            continue
+        # Parse value types
+        lowered = value.lower()
+        if lowered in _BOOL_VALUES:
+            settings[key] = _BOOL_VALUES[lowered]
+        elif value.isdigit():
+            settings[key] = int(value)
+        else:
+            settings[key] = value
 
     return model_name, settings
 
 
-def get_model_settings(model_string: str):
+def get_model_settings(model_string: str, cache_prompt: bool = False):
     """Get pydantic-ai model_settings from parsed model string.
 
+    Args:
+        model_string: Model string, optionally with @key=value settings
+        cache_prompt: Mark static instructions and tool definitions as
+            cacheable on providers that need an explicit opt-in (Anthropic).
+            OpenAI caches long prompt prefixes automatically.
+
     Returns appropriate ModelSettings subclass based on provider, or None
     if no settings are needed.
     """
+    wants_cache = cache_prompt and model_string.startswith("anthropic:")
+    if "@" not in model_string and not wants_cache:
+        return None
+
     model_name, settings = parse_model_string(model_string)
 
-    if not settings:
+    if not settings and not wants_cache:
         return None
 
     if model_name.startswith("openai-responses:"):
@@ -76,6 +87,9 @@ def get_model_settings(model_string: str):
                 kwargs["anthropic_thinking"] = {"type": "enabled", "budget_tokens": 10000}
             elif isinstance(thinking_val, int) and thinking_val > 0:
                 kwargs["anthropic_thinking"] = {"type": "enabled", "budget_tokens": thinking_val}
+        if cache_prompt:
+            kwargs["anthropic_cache_instructions"] = True
+            kwargs["anthropic_cache_tool_definitions"] = True
 
         return AnthropicModelSettings(**kwargs) if kwargs else None
 
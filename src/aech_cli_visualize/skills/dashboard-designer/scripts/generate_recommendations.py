@@ -11,10 +11,18 @@ import json
 import sys
 from pathlib import Path
 
+# (rows, max KPIs) for each dashboard purpose, matched in order
+LAYOUT_RULES = {
+    "executive": (2, 3),  # KPIs prominent, one main chart
+    "operational": (3, 4),  # More charts, detailed view
+}
+DEFAULT_LAYOUT = (2, 2)  # Analysis: balanced
+
 
 def load_json(path_or_string: str) -> dict:
     """Load JSON from file path or inline string."""
-    if path_or_string.startswith("{"):
+    # Inline JSON may arrive with leading whitespace (e.g. from a heredoc)
+    if path_or_string.lstrip().startswith("{"):
         return json.loads(path_or_string)
     with open(path_or_string) as f:
         return json.load(f)
@@ -38,19 +46,17 @@ def generate_spec(analysis: dict, answers: dict) -> dict:
     patterns = analysis.get("analysis", {}).get("patterns", [])
     suggested_widgets = analysis.get("analysis", {}).get("suggested_widgets", [])
 
+    # Index fields by name; reversed so the first field with a name wins
+    fields_by_name = {f.get("name"): f for f in reversed(fields)}
+    kpi_suggestions = [w for w in suggested_widgets if w.get("widget_type") == "kpi"]
+
     # Determine layout based on purpose
-    if "executive" in purpose.lower():
-        # Executive: KPIs prominent, one main chart
-        rows = 2
-        kpi_count = min(3, len([w for w in suggested_widgets if w.get("widget_type") == "kpi"]))
-    elif "operational" in purpose.lower():
-        # Operational: More charts, detailed view
-        rows = 3
-        kpi_count = min(4, len([w for w in suggested_widgets if w.get("widget_type") == "kpi"]))
-    else:
-        # Analysis: Balanced
-        rows = 2
-        kpi_count = min(2, len([w for w in suggested_widgets if w.get("widget_type") == "kpi"]))
+    purpose_lower = purpose.lower()
+    rows, max_kpis = next(
+        (rule for key, rule in LAYOUT_RULES.items() if key in purpose_lower),
+        DEFAULT_LAYOUT,
+    )
+    kpi_count = min(max_kpis, len(kpi_suggestions))
 
     # Build widgets
     widgets = []
@@ -58,7 +64,6 @@ def generate_spec(analysis: dict, answers: dict) -> dict:
     row = 0
 
     # Add KPI widgets
-    kpi_suggestions = [w for w in suggested_widgets if w.get("widget_type") == "kpi"]
 
     # Filter by key_metrics if specified
     if key_metrics:
@@ -71,7 +76,7 @@ def generate_spec(analysis: dict, answers: dict) -> dict:
     for i, kpi in enumerate(kpi_suggestions[:kpi_count]):
         field_name = kpi.get("data_fields", ["value"])[0]
         # Find field analysis for this field
-        field_info = next((f for f in fields if f.get("name") == field_name), {})
+        field_info = fields_by_name.get(field_name, {})
         summary = field_info.get("summary", {})
 
         widgets.append({
@@ -102,8 +107,8 @@ def generate_spec(analysis: dict, answers: dict) -> dict:
             y_fields = involved_fields[1:]
 
             # Find actual data
-            x_data = _extract_field_data(fields, x_field)
-            y_data = _extract_field_data(fields, y_fields[0] if y_fields else x_field)
+            x_data = fields_by_name.get(x_field, {})
+            y_data = fields_by_name.get(y_fields[0] if y_fields else x_field, {})
 
             widgets.append({
                 "type": "chart",
@@ -124,8 +129,8 @@ def generate_spec(analysis: dict, answers: dict) -> dict:
             x_field = involved_fields[0]
             y_field = involved_fields[1] if len(involved_fields) > 1 else involved_fields[0]
 
-            x_data = _extract_field_data(fields, x_field)
-            y_data = _extract_field_data(fields, y_field)
+            x_data = fields_by_name.get(x_field, {})
+            y_data = fields_by_name.get(y_field, {})
 
             widgets.append({
                 "type": "chart",
@@ -159,14 +164,6 @@ def generate_spec(analysis: dict, answers: dict) -> dict:
     return spec
 
 
-def _extract_field_data(fields: list, field_name: str) -> dict:
-    """Extract field data by name."""
-    for field in fields:
-        if field.get("name") == field_name:
-            return field
-    return {}
-
-
 def _generate_title(answers: dict, fields: list) -> str:
     """Generate a dashboard title based on answers and data."""
     purpose = answers.get("purpose", "").lower()
@@ -206,6 +203,11 @@ def main():
         required=True,
         help="Output path for generated spec",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the spec file for reading (default: compact)",
+    )
 
     args = parser.parse_args()
 
@@ -219,7 +221,10 @@ def main():
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w") as f:
-            json.dump(spec, f, indent=2)
+            if args.pretty:
+                json.dump(spec, f, indent=2)
+            else:
+                json.dump(spec, f, separators=(",", ":"))
 
         print(json.dumps({
             "success": True,
@@ -1,10 +1,13 @@
 """Theme loading and management."""
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import plotly.graph_objects as go
+from ..utils.data import parse_json_data
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # Directory containing built-in theme JSON files
 THEMES_DIR = Path(__file__).parent / "builtin"
@@ -152,6 +155,9 @@ def get_available_themes() -> list[str]:
 def load_theme(name: str) -> dict[str, Any]:
     """Load a theme by name or from file path.
 
+    Built-in themes and parsed theme files are shared, not copied, so
+    callers must treat the returned dict as read-only.
+
     Args:
         name: Theme name (corporate, modern, minimal, dark, light) or path to JSON file
 
@@ -159,14 +165,15 @@ def load_theme(name: str) -> dict[str, Any]:
         Theme configuration dictionary
     """
     # Check built-in themes first
-    if name.lower() in BUILTIN_THEMES:
-        return BUILTIN_THEMES[name.lower()]
+    theme = BUILTIN_THEMES.get(name.lower())
+    if theme is not None:
+        return theme
 
     # Check if it's a file path
     path = Path(name)
     if path.exists() and path.suffix == ".json":
-        with open(path) as f:
-            return json.load(f)
+        resolved = path.resolve()
+        return _load_theme_file(str(resolved), resolved.stat().st_mtime_ns)
 
     raise ValueError(
         f"Theme not found: {name}. "
@@ -174,6 +181,22 @@ def load_theme(name: str) -> dict[str, Any]:
     )
 
 
+@lru_cache(maxsize=32)
+def _load_theme_file(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a theme JSON file, memoized per path and modification time.
+
+    Like the built-in themes, the returned dict is shared between callers.
+
+    Args:
+        path: Resolved path to the theme file
+        mtime_ns: File modification time, so edited files are re-read
+
+    Returns:
+        Theme configuration dictionary
+    """
+    return parse_json_data(Path(path).read_bytes())
+
+
 def apply_theme_to_layout(theme: dict[str, Any]) -> dict[str, Any]:
     """Generate Plotly layout settings from theme.
 
@@ -186,6 +209,7 @@ def apply_theme_to_layout(theme: dict[str, Any]) -> dict[str, Any]:
     colors = theme["colors"]
     fonts = theme["fonts"]
     chart = theme.get("chart", {})
+    gridcolor = colors["grid"] if chart.get("gridlines", True) else "rgba(0,0,0,0)"
 
     return {
         "paper_bgcolor": colors["background"],
@@ -202,12 +226,12 @@ def apply_theme_to_layout(theme: dict[str, Any]) -> dict[str, Any]:
             }
         },
         "xaxis": {
-            "gridcolor": colors["grid"] if chart.get("gridlines", True) else "rgba(0,0,0,0)",
+            "gridcolor": gridcolor,
             "linecolor": colors["grid"],
             "tickfont": {"color": colors["text_secondary"]},
         },
         "yaxis": {
-            "gridcolor": colors["grid"] if chart.get("gridlines", True) else "rgba(0,0,0,0)",
+            "gridcolor": gridcolor,
             "linecolor": colors["grid"],
             "tickfont": {"color": colors["text_secondary"]},
         },
@@ -215,7 +239,7 @@ def apply_theme_to_layout(theme: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def apply_theme_to_figure(fig: go.Figure, theme: dict[str, Any]) -> go.Figure:
+def apply_theme_to_figure(fig: "go.Figure", theme: dict[str, Any]) -> "go.Figure":
     """Apply theme styling to a Plotly figure.
 
     Args:
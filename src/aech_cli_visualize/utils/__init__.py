@@ -1,6 +1,19 @@
 """Utility functions for data parsing and image export."""
 
-from .data import parse_data_input, parse_json_data
-from .export import export_figure, RESOLUTIONS
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["parse_data_input", "parse_json_data", "export_figure", "RESOLUTIONS"]
+from .data import canonical_json, dumps_json, parse_data_input, parse_json_data
+
+if TYPE_CHECKING:
+    from .export import RESOLUTIONS, export_figure, export_figures
+
+__all__ = ["canonical_json", "dumps_json", "parse_data_input", "parse_json_data", "export_figure", "export_figures", "RESOLUTIONS"]
+
+
+def __getattr__(name: str) -> Any:
+    """Load the export helpers, which pull in plotly and kaleido, on first use."""
+    if name in ("export_figure", "export_figures", "RESOLUTIONS"):
+        from . import export
+
+        return getattr(export, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,15 +5,56 @@ import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with kaleido>=1.0
+    orjson = None
 
-def parse_json_data(content: str) -> dict[str, Any]:
-    """Parse JSON string into dictionary."""
+
+def parse_json_data(content: str | bytes) -> dict[str, Any]:
+    """Parse JSON text or UTF-8 bytes into dictionary."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # Let the stdlib parser accept NaN/big ints or report the error
     try:
         return json.loads(content)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON: {e}")
 
 
+def dumps_json(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON for CLI output and spec files.
+
+    Uses orjson when available, falling back to the stdlib for values it
+    cannot encode (e.g., integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2).encode()
+
+
+def canonical_json(obj: Any) -> bytes:
+    """Serialize obj to compact, sorted-key JSON for cache keys and hashing.
+
+    Uses orjson when available, which is several times faster than the
+    stdlib encoder on specs carrying large inline data arrays.
+
+    Raises:
+        TypeError: If obj contains values that are not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
 def parse_data_input(
     file_path: str | None = None,
     stdin: bool = True,
@@ -27,15 +68,17 @@ def parse_data_input(
     Returns:
         Parsed data dictionary
     """
-    content: str
+    content: str | bytes
 
+    # Read raw bytes where possible so the parser skips a decode/encode pass
     if file_path:
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"Data file not found: {file_path}")
-        content = path.read_text()
+        content = path.read_bytes()
     elif stdin and not sys.stdin.isatty():
-        content = sys.stdin.read()
+        stream = getattr(sys.stdin, "buffer", None)
+        content = stream.read() if stream is not None else sys.stdin.read()
     else:
         raise ValueError("No data input provided. Provide a file path or pipe data to stdin.")
 
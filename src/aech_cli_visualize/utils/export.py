@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Literal
 
 import plotly.graph_objects as go
+import plotly.io as pio
 
 # Standard resolutions for presentations
 RESOLUTIONS: dict[str, tuple[int, int]] = {
@@ -78,3 +79,57 @@ def export_figure(
     )
 
     return file_path
+
+
+def export_figures(
+    fig: go.Figure,
+    output_dir: str | Path,
+    filename: str,
+    formats: list[FormatType],
+    width: int = 1920,
+    height: int = 1080,
+    scale: float = 2.0,
+) -> list[Path]:
+    """Export one Plotly figure to several formats in a single Kaleido session.
+
+    Args:
+        fig: Plotly figure to export
+        output_dir: Directory to write the files
+        filename: Base filename (without extension)
+        formats: Output formats (png, svg, pdf)
+        width: Image width in pixels
+        height: Image height in pixels
+        scale: Scale factor for higher DPI output
+
+    Returns:
+        Paths to the exported files, in the order of formats
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    file_paths = [output_path / f"{filename}.{fmt}" for fmt in formats]
+
+    if hasattr(pio, "write_images"):
+        # plotly>=6.1: one batched Kaleido call, figure serialized once
+        fig_dict = fig.to_dict()
+        pio.write_images(
+            [fig_dict] * len(formats),
+            [str(p) for p in file_paths],
+            format=list(formats),
+            width=width,
+            height=height,
+            scale=scale,
+            validate=False,
+        )
+    else:
+        for file_path, fmt in zip(file_paths, formats):
+            fig.write_image(
+                str(file_path),
+                format=fmt,
+                width=width,
+                height=height,
+                scale=scale,
+                engine="kaleido",
+            )
+
+    return file_paths
@@ -1,5 +1,9 @@
 """VLM validation for dashboard renders."""
 
+from typing import TYPE_CHECKING, Any
+
+from .batch_client import VLMBatchClient
+from .cache import VLMCache
 from .corrections import CorrectionEngine
 from .models import (
     LayoutCorrection,
@@ -8,7 +12,9 @@ from .models import (
     ValidationDeps,
     ValidationResult,
 )
-from .vlm_validator import VLMValidator
+
+if TYPE_CHECKING:
+    from .vlm_validator import VLMValidator
 
 __all__ = [
     "CorrectionEngine",
@@ -17,5 +23,16 @@ __all__ = [
     "RenderResult",
     "ValidationDeps",
     "ValidationResult",
+    "VLMBatchClient",
+    "VLMCache",
     "VLMValidator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Load the VLM validator, which needs the optional pydantic-ai, on first use."""
+    if name == "VLMValidator":
+        from .vlm_validator import VLMValidator
+
+        return VLMValidator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,147 @@
+"""Micro-batching client that shares VLM calls across concurrent dashboards."""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .models import ValidationResult
+
+if TYPE_CHECKING:
+    from .vlm_validator import VLMValidator
+
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the AECH_VLM_BATCH_MAX / AECH_VLM_BATCH_TIMEOUT_MS knobs
+DEFAULT_BATCH_MAX = 8
+DEFAULT_BATCH_TIMEOUT_MS = 50
+
+
+class VLMBatchClient:
+    """Collect evaluation requests and send them to the VLM in small batches.
+
+    Requests are queued and flushed once max_batch are waiting or timeout_ms
+    has passed since the first one arrived. Each flushed batch is evaluated
+    in a single multimodal call, while the next batch is being collected.
+
+    A client is meant for one group of concurrent renders (see
+    ValidatedDashboardComposer.arender_many); call aclose when it is done.
+    """
+
+    def __init__(
+        self,
+        validator: "VLMValidator",
+        max_batch: int | None = None,
+        timeout_ms: float | None = None,
+    ):
+        """Initialize the batch client.
+
+        Args:
+            validator: Validator used to evaluate each batch
+            max_batch: Maximum dashboards per VLM call.
+                       Defaults to AECH_VLM_BATCH_MAX or 8.
+            timeout_ms: Maximum wait for a batch to fill, in milliseconds.
+                        Defaults to AECH_VLM_BATCH_TIMEOUT_MS or 50.
+        """
+        self.validator = validator
+        self.max_batch = max(1, max_batch or int(
+            os.environ.get("AECH_VLM_BATCH_MAX", DEFAULT_BATCH_MAX)
+        ))
+        self.timeout = (timeout_ms if timeout_ms is not None else float(
+            os.environ.get("AECH_VLM_BATCH_TIMEOUT_MS", DEFAULT_BATCH_TIMEOUT_MS)
+        )) / 1000
+
+        # Queue and worker belong to one event loop; rebuilt if the loop changes
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(self, image_path: Path, spec: dict[str, Any]) -> ValidationResult:
+        """Queue one dashboard for evaluation and wait for its result.
+
+        Args:
+            image_path: Path to the rendered dashboard PNG
+            spec: Dashboard specification used for the render
+
+        Returns:
+            ValidationResult for this dashboard
+
+        Raises:
+            Exception: Whatever the VLM call raised for this dashboard's batch
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future: asyncio.Future[ValidationResult] = loop.create_future()
+        self._queue.put_nowait((future, image_path, spec))  # type: ignore[union-attr]
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop collecting batches and wait for batches already sent."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _collect(self) -> list[tuple[asyncio.Future, Path, dict[str, Any]]]:
+        """Wait for the next batch of queued requests.
+
+        Returns:
+            Between 1 and max_batch queued (future, image_path, spec) entries
+        """
+        queue = self._queue
+        assert queue is not None
+
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.timeout
+        while len(batch) < self.max_batch:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Collect batches forever, dispatching each without waiting on it."""
+        while True:
+            batch = await self._collect()
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list[tuple[asyncio.Future, Path, dict[str, Any]]]) -> None:
+        """Evaluate one batch and resolve its futures.
+
+        A failed call fails every future in the batch, so each caller sees
+        the error and stops correcting rather than blocking.
+
+        Args:
+            batch: Queued (future, image_path, spec) entries
+        """
+        items = [(image_path, spec) for _, image_path, spec in batch]
+        try:
+            results = await self.validator.aevaluate_many(items)
+        except Exception as e:
+            logger.warning(f"Batched VLM validation failed: {e}")
+            for future, _, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (future, _, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
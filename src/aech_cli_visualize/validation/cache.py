@@ -0,0 +1,146 @@
+"""Persistent cache of VLM responses keyed by image and spec content."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from ..utils.data import canonical_json
+
+
+logger = logging.getLogger(__name__)
+
+# Part of every key. Bump when prompt building or response models change in
+# ways the instructions text passed by callers doesn't capture.
+CACHE_VERSION = 2
+
+# Default cap on stored responses (AECH_VLM_CACHE_MAX_ENTRIES)
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class VLMCache:
+    """Content-addressed VLM response cache in ~/.aech/visualize/cache/.
+
+    Responses are stored as JSON text in SQLite, keyed by a hash of the
+    cache version, model, rendered image bytes, spec, and any extra prompt
+    inputs. Past max_entries, the oldest stored responses are dropped.
+    The cache is best-effort: storage errors are logged and treated as misses.
+
+    Every method does blocking file I/O; call them through asyncio.to_thread
+    from async code.
+    """
+
+    DEFAULT_PATH = Path.home() / ".aech" / "visualize" / "cache"
+
+    def __init__(self, base_path: Path | None = None, max_entries: int | None = None):
+        """Initialize the cache.
+
+        Args:
+            base_path: Directory for the cache database. Defaults to
+                       AECH_VLM_CACHE_DIR or ~/.aech/visualize/cache/
+            max_entries: Responses to keep. Defaults to
+                         AECH_VLM_CACHE_MAX_ENTRIES or 10000.
+        """
+        env_path = os.environ.get("AECH_VLM_CACHE_DIR")
+        self.base_path = base_path or (Path(env_path) if env_path else self.DEFAULT_PATH)
+        self.max_entries = max(1, max_entries or int(
+            os.environ.get("AECH_VLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        ))
+        self.db_path = self.base_path / "vlm_cache.sqlite3"
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.base_path.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, result TEXT NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(
+        model: str,
+        image: Path | bytes | None,
+        spec: dict[str, Any],
+        *extra: str,
+    ) -> bytes | None:
+        """Build a cache key from everything that shapes the VLM response.
+
+        Args:
+            model: Model string used for the call
+            image: Rendered image sent with the prompt (path or contents), if any
+            spec: Dashboard specification
+            *extra: Other inputs that shape the response (e.g., instructions,
+                    image size limit, user feedback)
+
+        Returns:
+            Key bytes, or None if the inputs cannot be hashed
+        """
+        try:
+            spec_json = canonical_json(spec)
+            if isinstance(image, bytes):
+                image_bytes = image
+            else:
+                image_bytes = Path(image).read_bytes() if image else b""
+        except (TypeError, ValueError, OSError):
+            return None
+
+        h = hashlib.blake2b(digest_size=32)
+        parts = (str(CACHE_VERSION).encode(), model.encode(), image_bytes, spec_json)
+        for part in (*parts, *(e.encode() for e in extra)):
+            h.update(len(part).to_bytes(8, "little"))
+            h.update(part)
+        return h.digest()
+
+    def get(self, key: bytes | None) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached response JSON, or None on a miss
+        """
+        if key is None:
+            return None
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT result FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"VLM cache read failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def set(self, key: bytes | None, result: str) -> None:
+        """Store a response, dropping the oldest ones past max_entries.
+
+        Args:
+            key: Key from make_key
+            result: Response serialized as JSON
+        """
+        if key is None:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, result) VALUES (?, ?)", (key, result)
+                )
+                # Replaced rows get a new rowid, so rowid order is write order
+                conn.execute(
+                    "DELETE FROM cache WHERE rowid <= (SELECT MAX(rowid) FROM cache) - ?",
+                    (self.max_entries,),
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"VLM cache write failed: {e}")
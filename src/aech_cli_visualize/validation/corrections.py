@@ -1,10 +1,28 @@
 """Correction engine for translating VLM feedback to spec modifications."""
 
 import copy
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
 
 from .models import LayoutCorrection, LayoutIssue, ValidationResult
 
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow ships with the vlm extra
+    Image = None
+
+# Issues are corrected most-severe first; unknown severities sort last
+SEVERITY_ORDER = {"critical": 0, "major": 1, "minor": 2}
+
+# Rough characters of widget text that fit across the full dashboard width
+TEXT_CHARS_ACROSS = 120
+# Table rows that fit in the full dashboard height
+TABLE_ROWS_DOWN = 30
+# Share of the image height, from the top, where the dashboard title is drawn
+TITLE_STRIP_FRACTION = 0.08
+
 
 class CorrectionEngine:
     """Translates VLM validation issues into concrete spec corrections."""
@@ -19,6 +37,22 @@ class CorrectionEngine:
         self.max_grid_rows = max_grid_rows
         self.max_grid_columns = max_grid_columns
 
+        # Issue type -> correction rule, built once rather than per issue
+        self._handlers: dict[str, Callable[..., LayoutCorrection | None]] = {
+            "overlap": self._fix_overlap,
+            "spacing": self._fix_spacing,
+            "truncation": self._fix_undersized,
+            "sizing": self._fix_undersized,
+            "alignment": self._add_row,
+            "readability": self._add_row,
+        }
+        # Alternative rules that resize widgets before growing the grid
+        self._span_handlers = {
+            **self._handlers,
+            "overlap": self._shrink_overlapping,
+            "readability": self._widen_affected,
+        }
+
     def compute_corrections(
         self,
         result: ValidationResult,
@@ -30,118 +64,324 @@ class CorrectionEngine:
             result: VLM validation result with issues
             spec: Current dashboard spec
 
+        Returns:
+            List of corrections to apply
+        """
+        return self._compute(result, spec, self._handlers, step=1)
+
+    def compute_corrections_topk(
+        self,
+        result: ValidationResult,
+        spec: dict[str, Any],
+        k: int = 3,
+    ) -> list[list[LayoutCorrection]]:
+        """Compute up to k alternative correction sets for a beam search.
+
+        Alternatives resize widgets before growing the grid, or take larger
+        steps. The compute_corrections set, if any, comes first.
+
+        Args:
+            result: VLM validation result with issues
+            spec: Current dashboard spec
+            k: Maximum number of alternatives
+
+        Returns:
+            Distinct, non-empty correction sets, most conventional first
+        """
+        candidates: list[list[LayoutCorrection]] = []
+        for handlers, step in (
+            (self._handlers, 1),
+            (self._span_handlers, 1),
+            (self._handlers, 2),
+        ):
+            if len(candidates) >= k:
+                break
+            corrections = self._compute(result, spec, handlers, step)
+            if corrections and corrections not in candidates:
+                candidates.append(corrections)
+        return candidates
+
+    def _compute(
+        self,
+        result: ValidationResult,
+        spec: dict[str, Any],
+        handlers: dict[str, Callable[..., LayoutCorrection | None]],
+        step: int,
+    ) -> list[LayoutCorrection]:
+        """Compute corrections with a rule table and step size.
+
+        Args:
+            result: VLM validation result with issues
+            spec: Current dashboard spec
+            handlers: Issue type -> correction rule
+            step: Multiplier for how far each rule moves the layout
+
         Returns:
             List of corrections to apply
         """
         corrections: list[LayoutCorrection] = []
 
         # Sort issues by severity (critical first)
-        severity_order = {"critical": 0, "major": 1, "minor": 2}
         sorted_issues = sorted(
             result.issues,
-            key=lambda x: severity_order.get(x.severity, 3),
+            key=lambda x: SEVERITY_ORDER.get(x.severity, 3),
         )
 
         for issue in sorted_issues:
-            correction = self._issue_to_correction(issue, spec)
+            handler = handlers.get(issue.issue_type)
+            if handler is None:
+                continue
+            correction = handler(issue, spec, step)
             if correction:
                 corrections.append(correction)
 
         return corrections
 
-    def _issue_to_correction(
+    def local_quality_score(
         self,
-        issue: LayoutIssue,
         spec: dict[str, Any],
-    ) -> LayoutCorrection | None:
-        """Map a single issue to a correction.
+        image_path: Path | None = None,
+    ) -> float:
+        """Estimate render quality from the spec and image without a VLM call.
+
+        Checks that widget boxes fit the grid and do not overlap, that widget
+        text is likely to fit its cell, and that the title strip of the image
+        is not blank. Only a layout that passes every check scores near 1.0.
 
         Args:
-            issue: The layout issue to fix
-            spec: Current dashboard spec
+            spec: Dashboard spec that was rendered
+            image_path: Rendered PNG, used for the title check if given
 
         Returns:
-            Correction to apply, or None if no correction available
+            Score from 0.0 (likely broken) to 1.0 (likely fine)
         """
+        widgets = spec.get("widgets", [])
         layout = spec.get("layout", {})
-        current_rows = layout.get("rows", 2)
-        current_cols = layout.get("columns", 12)
-        current_padding = layout.get("padding", 20)
+        rows = layout.get("rows", 2)
+        columns = layout.get("columns", 12)
+        score = 1.0
 
-        if issue.issue_type == "overlap":
-            # Try increasing rows first, then columns
-            if current_rows < self.max_grid_rows:
-                return LayoutCorrection(
-                    action="increase_rows",
-                    target="layout",
-                    parameters={"rows": current_rows + 1},
-                )
-            elif current_cols < self.max_grid_columns:
-                return LayoutCorrection(
-                    action="increase_columns",
-                    target="layout",
-                    parameters={"columns": current_cols + 2},
-                )
-            # Last resort: reduce spans of affected widgets
-            elif issue.affected_widgets:
-                return self._reduce_widget_spans(issue.affected_widgets, spec)
+        if widgets:
+            boxes = self._grid_boxes(widgets)
+            if (boxes[:, :2] < 0).any() or (boxes[:, 2] > columns).any() or (boxes[:, 3] > rows).any():
+                return 0.0
+            if self._overlap_matrix(boxes).any():
+                return 0.0
 
-        elif issue.issue_type == "spacing":
-            # Adjust padding based on whether things are too close or too far
-            if "too close" in issue.description.lower() or "cramped" in issue.description.lower():
-                return LayoutCorrection(
-                    action="adjust_padding",
-                    target="layout",
-                    parameters={"padding": current_padding + 10},
-                )
-            elif "too far" in issue.description.lower() or "wasted" in issue.description.lower():
-                new_padding = max(10, current_padding - 10)
-                return LayoutCorrection(
-                    action="adjust_padding",
-                    target="layout",
-                    parameters={"padding": new_padding},
-                )
+            for widget, (x0, y0, x1, y1) in zip(widgets, boxes):
+                chars = (x1 - x0) / columns * TEXT_CHARS_ACROSS
+                lines = (y1 - y0) / rows * TABLE_ROWS_DOWN
+                if self._text_overflows(widget, chars, lines):
+                    score -= 0.25
 
-        elif issue.issue_type == "truncation":
-            # Increase span of affected widgets
-            if issue.affected_widgets:
-                return self._increase_widget_spans(issue.affected_widgets, spec)
+        if spec.get("title") and image_path is not None and not self._has_title_ink(image_path):
+            score -= 0.5
 
-        elif issue.issue_type == "sizing":
-            # Similar to truncation - increase affected widget sizes
-            if issue.affected_widgets:
-                return self._increase_widget_spans(issue.affected_widgets, spec)
+        return max(0.0, score)
 
-        elif issue.issue_type == "alignment":
-            # Add rows to give more room for alignment
-            if current_rows < self.max_grid_rows:
-                return LayoutCorrection(
-                    action="increase_rows",
-                    target="layout",
-                    parameters={"rows": current_rows + 1},
-                )
+    def overlap_count(self, spec: dict[str, Any]) -> int:
+        """Count pairs of widgets whose grid cells overlap.
 
-        elif issue.issue_type == "readability":
-            # Increase grid size to give widgets more room
-            if current_rows < self.max_grid_rows:
-                return LayoutCorrection(
-                    action="increase_rows",
-                    target="layout",
-                    parameters={"rows": current_rows + 1},
-                )
+        Args:
+            spec: Dashboard spec
+
+        Returns:
+            Number of overlapping widget pairs
+        """
+        widgets = spec.get("widgets", [])
+        if len(widgets) < 2:
+            return 0
+        overlap = self._overlap_matrix(self._grid_boxes(widgets))
+        return int(np.triu(overlap, k=1).sum())
+
+    @staticmethod
+    def _grid_boxes(widgets: list[dict[str, Any]]) -> np.ndarray:
+        """Widget grid boxes as rows of (col0, row0, col1, row1)."""
+        positions = [w.get("position", {}) for w in widgets]
+        return np.array([
+            (
+                p.get("col", 0),
+                p.get("row", 0),
+                p.get("col", 0) + p.get("colspan", 1),
+                p.get("row", 0) + p.get("rowspan", 1),
+            )
+            for p in positions
+        ], dtype=np.float64).reshape(-1, 4)
+
+    @staticmethod
+    def _overlap_matrix(boxes: np.ndarray) -> np.ndarray:
+        """Pairwise overlap of grid boxes, with the diagonal cleared.
+
+        Returns:
+            Boolean (n, n) matrix, True where boxes i and j share a cell
+        """
+        overlap = (
+            (boxes[:, None, 0] < boxes[None, :, 2]) & (boxes[None, :, 0] < boxes[:, None, 2])
+            & (boxes[:, None, 1] < boxes[None, :, 3]) & (boxes[None, :, 1] < boxes[:, None, 3])
+        )
+        np.fill_diagonal(overlap, False)
+        return overlap
+
+    @staticmethod
+    def _text_overflows(widget: dict[str, Any], chars: float, lines: float) -> bool:
+        """Guess whether a widget's text is too long for its cell.
+
+        Args:
+            widget: Widget spec
+            chars: Approximate characters that fit across the cell
+            lines: Approximate table rows that fit down the cell
+
+        Returns:
+            True if the text likely truncates or wraps badly
+        """
+        widget_type = widget.get("type")
+        config = widget.get("config", {})
+
+        if len(str(config.get("title") or "")) > chars:
+            return True
+        if widget_type in ("kpi", "gauge"):
+            return len(str(config.get("label") or "")) > chars
+        if widget_type == "table":
+            headers = config.get("headers", [])
+            width = sum(max(len(str(h)), 6) + 2 for h in headers)
+            return width > chars or len(config.get("rows", [])) + 1 > lines
+        return False
+
+    @staticmethod
+    def _has_title_ink(image_path: Path) -> bool:
+        """Check that the title strip of a rendered PNG is not blank.
+
+        Returns True when the image cannot be inspected, so the check
+        never vetoes a render on its own.
+        """
+        if Image is None or Path(image_path).suffix.lower() != ".png":
+            return True
+        try:
+            with Image.open(image_path) as img:
+                width, height = img.size
+                strip = img.crop((0, 0, width, max(1, int(height * TITLE_STRIP_FRACTION))))
+                low, high = strip.convert("L").getextrema()
+        except OSError:
+            return True
+        return high > low
+
+    def _fix_overlap(
+        self,
+        issue: LayoutIssue,
+        spec: dict[str, Any],
+        step: int = 1,
+    ) -> LayoutCorrection | None:
+        """Grow the grid for overlapping widgets, shrinking spans as a last resort."""
+        layout = spec.get("layout", {})
+        current_rows = layout.get("rows", 2)
+        current_cols = layout.get("columns", 12)
 
+        # Try increasing rows first, then columns
+        if current_rows < self.max_grid_rows:
+            return LayoutCorrection(
+                action="increase_rows",
+                target="layout",
+                parameters={"rows": min(current_rows + step, self.max_grid_rows)},
+            )
+        elif current_cols < self.max_grid_columns:
+            return LayoutCorrection(
+                action="increase_columns",
+                target="layout",
+                parameters={"columns": current_cols + 2 * step},
+            )
+        # Last resort: reduce spans of affected widgets
+        elif issue.affected_widgets:
+            return self._reduce_widget_spans(issue.affected_widgets, spec, step)
         return None
 
+    def _fix_spacing(
+        self,
+        issue: LayoutIssue,
+        spec: dict[str, Any],
+        step: int = 1,
+    ) -> LayoutCorrection | None:
+        """Adjust padding based on whether things are too close or too far."""
+        current_padding = spec.get("layout", {}).get("padding", 20)
+        description = issue.description.lower()
+
+        if "too close" in description or "cramped" in description:
+            return LayoutCorrection(
+                action="adjust_padding",
+                target="layout",
+                parameters={"padding": current_padding + 10 * step},
+            )
+        elif "too far" in description or "wasted" in description:
+            new_padding = max(10, current_padding - 10 * step)
+            return LayoutCorrection(
+                action="adjust_padding",
+                target="layout",
+                parameters={"padding": new_padding},
+            )
+        return None
+
+    def _fix_undersized(
+        self,
+        issue: LayoutIssue,
+        spec: dict[str, Any],
+        step: int = 1,
+    ) -> LayoutCorrection | None:
+        """Increase span of truncated or undersized widgets."""
+        if issue.affected_widgets:
+            return self._increase_widget_spans(issue.affected_widgets, spec, step)
+        return None
+
+    def _add_row(
+        self,
+        issue: LayoutIssue,
+        spec: dict[str, Any],
+        step: int = 1,
+    ) -> LayoutCorrection | None:
+        """Add a grid row to give widgets more room (alignment, readability)."""
+        current_rows = spec.get("layout", {}).get("rows", 2)
+        if current_rows < self.max_grid_rows:
+            return LayoutCorrection(
+                action="increase_rows",
+                target="layout",
+                parameters={"rows": min(current_rows + step, self.max_grid_rows)},
+            )
+        return None
+
+    def _shrink_overlapping(
+        self,
+        issue: LayoutIssue,
+        spec: dict[str, Any],
+        step: int = 1,
+    ) -> LayoutCorrection | None:
+        """Shrink overlapping widgets, growing the grid only if none can shrink."""
+        return (
+            self._reduce_widget_spans(issue.affected_widgets, spec, step)
+            or self._fix_overlap(issue, spec, step)
+        )
+
+    def _widen_affected(
+        self,
+        issue: LayoutIssue,
+        spec: dict[str, Any],
+        step: int = 1,
+    ) -> LayoutCorrection | None:
+        """Enlarge hard-to-read widgets, adding a grid row only if none can grow."""
+        return (
+            self._increase_widget_spans(issue.affected_widgets, spec, step)
+            or self._add_row(issue, spec, step)
+        )
+
     def _reduce_widget_spans(
         self,
         widget_indices: list[int],
         spec: dict[str, Any],
+        step: int = 1,
     ) -> LayoutCorrection | None:
         """Create correction to reduce spans of overlapping widgets.
 
         Args:
             widget_indices: Indices of widgets to adjust
             spec: Current dashboard spec
+            step: How many cells to take off the span
 
         Returns:
             Correction to reduce spans, or None
@@ -163,13 +403,13 @@ class CorrectionEngine:
                 return LayoutCorrection(
                     action="adjust_span",
                     target=f"widgets[{idx}]",
-                    parameters={"colspan": colspan - 1},
+                    parameters={"colspan": max(1, colspan - step)},
                 )
             elif rowspan > 1:
                 return LayoutCorrection(
                     action="adjust_span",
                     target=f"widgets[{idx}]",
-                    parameters={"rowspan": rowspan - 1},
+                    parameters={"rowspan": max(1, rowspan - step)},
                 )
 
         return None
@@ -178,12 +418,14 @@ class CorrectionEngine:
         self,
         widget_indices: list[int],
         spec: dict[str, Any],
+        step: int = 1,
     ) -> LayoutCorrection | None:
         """Create correction to increase spans of undersized widgets.
 
         Args:
             widget_indices: Indices of widgets to adjust
             spec: Current dashboard spec
+            step: How many cells to add to the span, room permitting
 
         Returns:
             Correction to increase spans, or None
@@ -212,14 +454,14 @@ class CorrectionEngine:
                 return LayoutCorrection(
                     action="adjust_span",
                     target=f"widgets[{idx}]",
-                    parameters={"colspan": colspan + 1},
+                    parameters={"colspan": colspan + min(step, max_cols - col - colspan)},
                 )
             # Try increasing rowspan if room available
             elif row + rowspan < max_rows:
                 return LayoutCorrection(
                     action="adjust_span",
                     target=f"widgets[{idx}]",
-                    parameters={"rowspan": rowspan + 1},
+                    parameters={"rowspan": rowspan + min(step, max_rows - row - rowspan)},
                 )
 
         return None
@@ -0,0 +1,73 @@
+"""Image preparation for VLM requests."""
+
+import io
+import os
+from pathlib import Path
+
+from pydantic_ai import BinaryContent
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow ships with the vlm extra
+    Image = None
+
+# Default longest side sent to the VLM (AECH_VLM_IMAGE_MAX_DIM). Anthropic
+# resizes anything larger to this, and image tokens scale with area.
+DEFAULT_VLM_IMAGE_MAX_DIM = 1568
+VLM_JPEG_QUALITY = 85
+
+# Leading bytes of formats that may be passed in memory, by media type
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+    (b"%PDF", "application/pdf"),
+)
+
+
+def _media_type(data: bytes) -> str:
+    """Guess the media type of image bytes from their signature."""
+    for signature, media_type in _SIGNATURES:
+        if data.startswith(signature):
+            return media_type
+    if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/svg+xml" if b"<svg" in data[:1024] else "application/octet-stream"
+
+
+def vlm_image_max_dim() -> int:
+    """Longest side, in pixels, of PNG renders sent to the VLM."""
+    return int(os.environ.get("AECH_VLM_IMAGE_MAX_DIM", DEFAULT_VLM_IMAGE_MAX_DIM))
+
+
+def load_vlm_image(image: Path | bytes) -> BinaryContent:
+    """Load a rendered image in a compact form for a VLM request.
+
+    PNG renders are downscaled to AECH_VLM_IMAGE_MAX_DIM on the long side
+    and re-encoded as JPEG in memory, which cuts both the upload and the
+    image token count several-fold. The file on disk is left untouched. Other
+    formats, or PNGs when Pillow is not installed, are sent as-is.
+
+    Args:
+        image: Path to the rendered image, or its contents already read
+
+    Returns:
+        BinaryContent to include in the agent messages
+    """
+    if isinstance(image, bytes):
+        media_type = _media_type(image)
+        if Image is None or media_type != "image/png":
+            return BinaryContent(data=image, media_type=media_type)
+        source = io.BytesIO(image)
+    elif Image is None or Path(image).suffix.lower() != ".png":
+        return BinaryContent.from_path(image)
+    else:
+        source = image
+
+    max_dim = vlm_image_max_dim()
+    with Image.open(source) as img:
+        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        img.convert("RGB").save(buf, "JPEG", quality=VLM_JPEG_QUALITY, optimize=True)
+
+    return BinaryContent(data=buf.getvalue(), media_type="image/jpeg")
@@ -1,6 +1,7 @@
 """Pydantic models for VLM validation of dashboard renders."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal
 
@@ -59,6 +60,13 @@ class ValidationResult(BaseModel):
         description="Explanation of the overall assessment"
     )
 
+    @cached_property
+    def issue_fingerprint(self) -> frozenset[tuple[str, tuple[int, ...]]]:
+        """Set of (issue_type, affected_widgets) pairs, built once per result."""
+        return frozenset(
+            (issue.issue_type, tuple(issue.affected_widgets)) for issue in self.issues
+        )
+
 
 class LayoutCorrection(BaseModel):
     """A concrete correction to apply to the dashboard spec."""
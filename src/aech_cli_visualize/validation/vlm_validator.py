@@ -1,15 +1,22 @@
 """VLM-based validation for dashboard renders using pydantic-ai."""
 
+import asyncio
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic_ai import Agent, BinaryContent
+from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
 
 from ..model_utils import parse_model_string, get_model_settings
+from .cache import VLMCache
+from .images import load_vlm_image, vlm_image_max_dim
 from .models import ValidationDeps, ValidationResult
 
+if TYPE_CHECKING:
+    from .batch_client import VLMBatchClient
+
 
 VALIDATION_INSTRUCTIONS = """You are a visual QA expert evaluating dashboard layouts for presentation quality.
 
@@ -38,27 +45,58 @@ Pixel-perfect alignment is not required - focus on practical usability.
 A dashboard is "acceptable" if it has no critical issues and at most minor issues.
 """
 
+BATCH_INSTRUCTIONS = VALIDATION_INSTRUCTIONS + """
+You will be given several dashboards, each introduced by a "# Dashboard N" heading
+and followed by its image. Evaluate each one independently and return exactly one
+validation result per dashboard, in the order given.
+"""
+
+
+@lru_cache(maxsize=8)
+def _build_agent(model_string: str) -> Agent[ValidationDeps, ValidationResult]:
+    """Build the single-dashboard validation agent for a model string.
+
+    Cached so validators using the same model share one agent and resolve
+    its model settings once.
+    """
+    model, _ = parse_model_string(model_string)
+    return Agent(
+        model,
+        deps_type=ValidationDeps,
+        output_type=ValidationResult,
+        instructions=VALIDATION_INSTRUCTIONS,
+        model_settings=get_model_settings(model_string),
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_batch_agent(model_string: str) -> Agent[None, list[ValidationResult]]:
+    """Build the multi-dashboard validation agent for a model string."""
+    model, _ = parse_model_string(model_string)
+    return Agent(
+        model,
+        output_type=list[ValidationResult],
+        instructions=BATCH_INSTRUCTIONS,
+        model_settings=get_model_settings(model_string),
+    )
+
 
 class VLMValidator:
     """Validates dashboard renders using a Vision Language Model."""
 
-    def __init__(self, model: str | None = None):
+    def __init__(self, model: str | None = None, use_cache: bool = True):
         """Initialize the validator.
 
         Args:
             model: Model identifier in format "provider:model" (e.g., "openai:gpt-4o").
                    Defaults to AECH_VLM_MODEL environment variable or "openai:gpt-4o".
+            use_cache: Reuse stored results for identical image and spec
         """
         model_string = model or os.environ.get("AECH_VLM_MODEL", "anthropic:claude-sonnet-4-20250514")
+        self.model_string = model_string
         self.model, _ = parse_model_string(model_string)
-        self._model_settings = get_model_settings(model_string)
-        self.agent: Agent[ValidationDeps, ValidationResult] = Agent(
-            self.model,
-            deps_type=ValidationDeps,
-            output_type=ValidationResult,
-            instructions=VALIDATION_INSTRUCTIONS,
-            model_settings=self._model_settings,
-        )
+        self.agent: Agent[ValidationDeps, ValidationResult] = _build_agent(model_string)
+        self.cache = VLMCache() if use_cache else None
 
     def _summarize_spec(self, spec: dict[str, Any]) -> str:
         """Create a human-readable summary of the dashboard spec.
@@ -120,6 +158,26 @@ Analyze the attached image and determine:
 
 Provide your assessment as a structured validation result."""
 
+    def _build_run_inputs(
+        self, image_path: Path, spec: dict[str, Any]
+    ) -> tuple[list[Any], ValidationDeps]:
+        """Build the agent messages and dependencies for one evaluation.
+
+        Args:
+            image_path: Path to the rendered dashboard PNG
+            spec: Dashboard specification used for the render
+
+        Returns:
+            Tuple of (messages, deps) for the agent run
+        """
+        # Compact JPEG copy of the render; the file itself is unchanged
+        image = load_vlm_image(image_path)
+
+        summary = self._summarize_spec(spec)
+        deps = ValidationDeps(spec=spec, widget_summary=summary)
+
+        return [self._build_prompt(spec), image], deps
+
     def evaluate(self, image_path: Path, spec: dict[str, Any]) -> ValidationResult:
         """Evaluate a rendered dashboard image.
 
@@ -130,19 +188,116 @@ Provide your assessment as a structured validation result."""
         Returns:
             ValidationResult with assessment and any issues found
         """
-        # Load image using BinaryContent.from_path()
-        image = BinaryContent.from_path(image_path)
+        key, cached = self._cache_lookup(image_path, spec)
+        if cached is not None:
+            return cached
+
+        messages, deps = self._build_run_inputs(image_path, spec)
+        result = self.agent.run_sync(messages, deps=deps)
+        self._cache_store(key, result.output)
+        return result.output
+
+    async def aevaluate(
+        self,
+        image_path: Path,
+        spec: dict[str, Any],
+        batch_client: "VLMBatchClient | None" = None,
+    ) -> ValidationResult:
+        """Async variant of evaluate.
+
+        Args:
+            image_path: Path to the rendered dashboard PNG
+            spec: Dashboard specification used for the render
+            batch_client: Client to queue the request on, so dashboards
+                          validated concurrently share VLM calls. Without
+                          one, the VLM is called directly.
+
+        Returns:
+            ValidationResult with assessment and any issues found
+        """
+        # Hashing the image and SQLite access block; keep them off the event loop
+        key, cached = await asyncio.to_thread(self._cache_lookup, image_path, spec)
+        if cached is not None:
+            return cached
+
+        if batch_client is None:
+            result = await self._aevaluate_one(image_path, spec)
+        else:
+            result = await batch_client.submit(image_path, spec)
+        await asyncio.to_thread(self._cache_store, key, result)
+        return result
+
+    def _cache_lookup(
+        self, image_path: Path, spec: dict[str, Any]
+    ) -> tuple[bytes | None, ValidationResult | None]:
+        """Look up a stored result for this image and spec.
 
-        # Build dependencies
-        deps = ValidationDeps(
-            spec=spec,
-            widget_summary=self._summarize_spec(spec),
+        Returns:
+            Tuple of (cache key, cached result or None)
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.make_key(
+            self.model_string, image_path, spec, VALIDATION_INSTRUCTIONS, str(vlm_image_max_dim())
         )
+        cached = self.cache.get(key)
+        if cached is None:
+            return key, None
+        return key, ValidationResult.model_validate_json(cached)
+
+    def _cache_store(self, key: bytes | None, result: ValidationResult) -> None:
+        """Store a result under a key from _cache_lookup."""
+        if self.cache is not None:
+            self.cache.set(key, result.model_dump_json())
+
+    async def aevaluate_many(
+        self, items: list[tuple[Path, dict[str, Any]]]
+    ) -> list[ValidationResult]:
+        """Evaluate several rendered dashboards in one VLM call.
+
+        Falls back to one call per dashboard if the model does not return
+        exactly one result for each.
+
+        Args:
+            items: (image_path, spec) pairs to evaluate
+
+        Returns:
+            ValidationResults in the same order as items
+        """
+        if len(items) == 1:
+            return [await self._aevaluate_one(*items[0])]
 
-        # Run the agent with image and prompt
-        result = self.agent.run_sync(
-            [self._build_prompt(spec), image],
-            deps=deps,
+        # Image resizing is CPU-bound; keep it off the event loop
+        images = await asyncio.gather(
+            *(asyncio.to_thread(load_vlm_image, image_path) for image_path, _ in items)
         )
+        messages: list[Any] = []
+        for i, ((_, spec), image) in enumerate(zip(items, images), 1):
+            messages.append(f"# Dashboard {i}\n\n{self._build_prompt(spec)}")
+            messages.append(image)
+
+        result = await self._get_batch_agent().run(messages)
+        if len(result.output) == len(items):
+            return result.output
+
+        return list(await asyncio.gather(
+            *(self._aevaluate_one(image_path, spec) for image_path, spec in items)
+        ))
 
+    async def _aevaluate_one(self, image_path: Path, spec: dict[str, Any]) -> ValidationResult:
+        """Evaluate one dashboard with its own VLM call.
+
+        Args:
+            image_path: Path to the rendered dashboard PNG
+            spec: Dashboard specification used for the render
+
+        Returns:
+            ValidationResult with assessment and any issues found
+        """
+        messages, deps = await asyncio.to_thread(self._build_run_inputs, image_path, spec)
+        result = await self.agent.run(messages, deps=deps)
         return result.output
+
+    def _get_batch_agent(self) -> Agent[None, list[ValidationResult]]:
+        """Get the agent for multi-dashboard calls, shared per model string."""
+        return _build_batch_agent(self.model_string)
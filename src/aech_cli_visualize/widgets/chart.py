@@ -2,7 +2,6 @@
 
 from typing import Any, Literal
 
-import plotly.express as px
 import plotly.graph_objects as go
 
 from .base import BaseWidget
@@ -23,6 +22,7 @@ class ChartWidget(BaseWidget):
         show_legend: bool = True,
         show_values: bool = False,
         theme: str | dict[str, Any] = "corporate",
+        font_scale: float = 1.0,
     ):
         """Initialize chart widget.
 
@@ -35,6 +35,7 @@ class ChartWidget(BaseWidget):
             show_legend: Whether to show legend
             show_values: Whether to show values on data points
             theme: Theme name or dictionary
+            font_scale: Multiplier applied to all font sizes
         """
         config = {
             "chart_type": chart_type,
@@ -44,6 +45,7 @@ class ChartWidget(BaseWidget):
             "y_label": y_label,
             "show_legend": show_legend,
             "show_values": show_values,
+            "font_scale": font_scale,
         }
         super().__init__(config, theme)
 
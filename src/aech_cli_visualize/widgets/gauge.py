@@ -19,6 +19,7 @@ class GaugeWidget(BaseWidget):
         unit: str = "",
         thresholds: list[dict[str, Any]] | None = None,
         theme: str | dict[str, Any] = "corporate",
+        font_scale: float = 1.0,
     ):
         """Initialize gauge widget.
 
@@ -30,6 +31,7 @@ class GaugeWidget(BaseWidget):
             unit: Unit suffix (e.g., '%', 'ms')
             thresholds: List of threshold dicts with value, color, label
             theme: Theme name or dictionary
+            font_scale: Multiplier applied to all font sizes
         """
         config = {
             "value": value,
@@ -38,6 +40,7 @@ class GaugeWidget(BaseWidget):
             "label": label,
             "unit": unit,
             "thresholds": thresholds,
+            "font_scale": font_scale,
         }
         super().__init__(config, theme)
 
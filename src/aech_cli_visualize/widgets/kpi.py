@@ -19,6 +19,7 @@ class KPIWidget(BaseWidget):
         format_value: str | None = None,
         sparkline: list[float] | None = None,
         theme: str | dict[str, Any] = "corporate",
+        font_scale: float = 1.0,
     ):
         """Initialize KPI widget.
 
@@ -30,6 +31,7 @@ class KPIWidget(BaseWidget):
             format_value: Python format string for value (e.g., '{:,.0f}')
             sparkline: Optional list of values for sparkline
             theme: Theme name or dictionary
+            font_scale: Multiplier applied to all font sizes
         """
         config = {
             "value": value,
@@ -38,6 +40,7 @@ class KPIWidget(BaseWidget):
             "delta_good": delta_good,
             "format_value": format_value,
             "sparkline": sparkline,
+            "font_scale": font_scale,
         }
         super().__init__(config, theme)
 
@@ -0,0 +1,71 @@
+"""Tests for batch data analysis."""
+
+import asyncio
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from aech_cli_visualize.config.analyzer import DataAnalyzer
+from aech_cli_visualize.config.repository import ConfigRepository
+from aech_cli_visualize.main import app
+
+
+DATASETS = [
+    {"month": ["2025-01", "2025-02", "2025-03"], "revenue": [100, 120, 150]},
+    {"region": ["North", "South"], "sales": [10.5, 20.5]},
+    {"score": [1, 2, 3, 4]},
+]
+
+
+@pytest.fixture(autouse=True)
+def config_dir(monkeypatch, tmp_path):
+    """Keep the analyzer's config lookups out of the real home directory."""
+    monkeypatch.setattr(ConfigRepository, "DEFAULT_PATH", tmp_path / "configs")
+
+
+def test_analyze_batch_limits_llm_requests_in_flight(monkeypatch):
+    analyzer = DataAnalyzer(model="test", max_concurrent_llm=2)
+    in_flight = 0
+    peak = 0
+
+    async def fake_llm(self, field_set, patterns, suggestions, fingerprint, matching_names, data):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return self._fallback_result(field_set, patterns, suggestions, fingerprint, matching_names)
+
+    monkeypatch.setattr(DataAnalyzer, "_llm_analyze_async", fake_llm)
+
+    results = asyncio.run(analyzer.analyze_batch(DATASETS * 2))
+
+    assert peak == 2
+    # Results come back in input order
+    expected = [analyzer.analyze(data, include_questions=False) for data in DATASETS * 2]
+    assert [r.schema_fingerprint for r in results] == [e.schema_fingerprint for e in expected]
+
+
+def test_analyze_batch_with_llm_keeps_computed_fingerprints():
+    analyzer = DataAnalyzer(model="test")
+
+    results = asyncio.run(analyzer.analyze_batch(DATASETS))
+
+    rule_based = DataAnalyzer(use_llm=False)
+    assert [r.schema_fingerprint for r in results] == [
+        rule_based.analyze(data).schema_fingerprint for data in DATASETS
+    ]
+
+
+def test_analyze_command_accepts_a_list_of_datasets(tmp_path):
+    data_file = tmp_path / "datasets.json"
+    data_file.write_text(json.dumps(DATASETS))
+
+    result = CliRunner().invoke(app, ["analyze", str(data_file), "--no-llm"])
+
+    assert result.exit_code == 0
+    output = json.loads(result.stdout)
+    assert output["success"] is True
+    assert [len(a["analysis"]["fields"]) for a in output["analyses"]] == [2, 2, 1]
+    assert output["message"] == "Analyzed 3 dataset(s)"
@@ -0,0 +1,81 @@
+"""Tests for the VLM micro-batching client."""
+
+import asyncio
+from pathlib import Path
+
+from aech_cli_visualize.validation import ValidationResult, VLMBatchClient
+
+
+class StubValidator:
+    """Records each batch and answers with one result per dashboard."""
+
+    def __init__(self, error: Exception | None = None):
+        self.batches: list[list[tuple[Path, dict]]] = []
+        self.error = error
+
+    async def aevaluate_many(self, items):
+        self.batches.append(items)
+        if self.error is not None:
+            raise self.error
+        return [
+            ValidationResult(is_acceptable=True, confidence=1.0, reasoning=str(path))
+            for path, _ in items
+        ]
+
+
+async def _submit_all(client: VLMBatchClient, count: int) -> list:
+    try:
+        return await asyncio.gather(
+            *(client.submit(Path(f"d{i}.png"), {"i": i}) for i in range(count)),
+            return_exceptions=True,
+        )
+    finally:
+        await client.aclose()
+
+
+def test_concurrent_requests_share_one_call():
+    validator = StubValidator()
+    client = VLMBatchClient(validator, max_batch=8, timeout_ms=50)
+
+    results = asyncio.run(_submit_all(client, 3))
+
+    assert len(validator.batches) == 1
+    assert [spec for _, spec in validator.batches[0]] == [{"i": 0}, {"i": 1}, {"i": 2}]
+    # Each caller gets the result for its own dashboard
+    assert [r.reasoning for r in results] == ["d0.png", "d1.png", "d2.png"]
+
+
+def test_batches_are_capped_at_max_batch():
+    validator = StubValidator()
+    client = VLMBatchClient(validator, max_batch=2, timeout_ms=50)
+
+    results = asyncio.run(_submit_all(client, 5))
+
+    assert sorted(len(batch) for batch in validator.batches) == [1, 2, 2]
+    assert [r.reasoning for r in results] == [f"d{i}.png" for i in range(5)]
+
+
+def test_failed_call_fails_every_request_in_the_batch():
+    error = RuntimeError("vlm down")
+    validator = StubValidator(error=error)
+    client = VLMBatchClient(validator, max_batch=8, timeout_ms=50)
+
+    results = asyncio.run(_submit_all(client, 3))
+
+    assert len(validator.batches) == 1
+    assert results == [error, error, error]
+
+
+def test_aclose_stops_the_worker():
+    client = VLMBatchClient(StubValidator(), max_batch=8, timeout_ms=50)
+
+    async def run():
+        await client.submit(Path("d.png"), {})
+        worker = client._worker
+        await client.aclose()
+        return worker
+
+    worker = asyncio.run(run())
+    assert worker.cancelled()
+    assert client._worker is None
+
@@ -0,0 +1,156 @@
+"""Tests for the dashboard command."""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+from typer.testing import CliRunner
+
+from aech_cli_visualize.dashboard.composer import DashboardComposer
+from aech_cli_visualize.dashboard.validated_composer import ValidatedDashboardComposer
+from aech_cli_visualize.main import app
+from aech_cli_visualize.validation import RenderResult, ValidationResult
+
+
+runner = CliRunner()
+
+
+def _stub_render_many(monkeypatch, tmp_path, outcomes):
+    """Make render_many return the given outcomes, writing a file per success."""
+    def render_many(self, jobs, max_concurrency=10):
+        results = []
+        for job, outcome in zip(jobs, outcomes):
+            if isinstance(outcome, BaseException):
+                results.append(outcome)
+                continue
+            path = tmp_path / f"{job.filename}.{job.format}"
+            path.write_bytes(b"png")
+            results.append(RenderResult(
+                path=path,
+                iterations=1,
+                validation_history=outcome,
+                final_spec=job.spec,
+                corrections_applied=[],
+            ))
+        return results
+
+    monkeypatch.setattr(ValidatedDashboardComposer, "render_many", render_many)
+
+
+def _invoke(tmp_path, *args):
+    spec_file = tmp_path / "specs.json"
+    spec_file.write_text(json.dumps([{"widgets": []}] * 3))
+    result = runner.invoke(
+        app, ["dashboard", str(spec_file), "--output-dir", str(tmp_path), *args]
+    )
+    return result, json.loads(result.stdout)
+
+
+def test_failed_dashboards_are_reported_by_index(monkeypatch, tmp_path):
+    _stub_render_many(monkeypatch, tmp_path, [None, RuntimeError("boom"), None])
+
+    result, output = _invoke(tmp_path)
+
+    assert result.exit_code == 1
+    assert output["success"] is False
+    assert output["errors"] == [{"index": 1, "error": "boom"}]
+    assert [f["path"] for f in output["output_files"]] == [
+        str(tmp_path / "dashboard_0.png"),
+        str(tmp_path / "dashboard_2.png"),
+    ]
+    assert output["message"] == "2 of 3 dashboard(s) rendered"
+    assert "validation" not in output
+
+
+def test_validation_entries_keep_their_job_index(monkeypatch, tmp_path):
+    approved = [ValidationResult(is_acceptable=True, confidence=1.0, reasoning="")]
+    _stub_render_many(monkeypatch, tmp_path, [RuntimeError("boom"), approved, approved])
+
+    result, output = _invoke(tmp_path, "--vlm-validate", "--vlm-model", "test")
+
+    assert result.exit_code == 1
+    assert output["errors"] == [{"index": 0, "error": "boom"}]
+    assert [v["index"] for v in output["validation"]] == [1, 2]
+    assert all(v["final_status"] == "approved" for v in output["validation"])
+
+
+def test_all_dashboards_rendered(monkeypatch, tmp_path):
+    _stub_render_many(monkeypatch, tmp_path, [None, None, None])
+
+    result, output = _invoke(tmp_path)
+
+    assert result.exit_code == 0
+    assert output["success"] is True
+    assert "errors" not in output
+    assert len(output["output_files"]) == 3
+
+
+def test_several_formats_render_with_render_many(monkeypatch, tmp_path):
+    calls = []
+
+    def render_many(self, output_dir, filename="dashboard", formats=None, resolution="1080p", scale=2.0):
+        calls.append(formats)
+        paths = [tmp_path / f"{filename}.{fmt}" for fmt in formats]
+        for path in paths:
+            path.write_bytes(b"x")
+        return paths
+
+    monkeypatch.setattr(DashboardComposer, "render_many", render_many)
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps({"widgets": []}))
+
+    result = runner.invoke(
+        app, ["dashboard", str(spec_file), "--output-dir", str(tmp_path), "--format", "png, svg"]
+    )
+
+    assert result.exit_code == 0
+    assert calls == [["png", "svg"]]
+    output = json.loads(result.stdout)
+    assert [f["format"] for f in output["output_files"]] == ["png", "svg"]
+
+
+def test_several_formats_are_rejected_for_a_list_of_specs(tmp_path):
+    result, output = _invoke(tmp_path, "--format", "png,svg")
+
+    assert result.exit_code == 1
+    assert output == {
+        "success": False,
+        "error": "Multiple formats need a single spec without --vlm-validate",
+    }
+
+
+def test_list_without_validation_does_not_need_pydantic_ai(tmp_path):
+    # Runs in a fresh interpreter, since this one has already imported it
+    script = textwrap.dedent("""
+        import sys
+        from pathlib import Path
+
+        sys.modules["pydantic_ai"] = None  # as if the vlm extra were not installed
+
+        from typer.testing import CliRunner
+        from aech_cli_visualize.dashboard.composer import DashboardComposer
+        from aech_cli_visualize.main import app
+
+        def render(self, output_dir, filename="dashboard", format="png", **kwargs):
+            path = Path(output_dir) / f"{filename}.{format}"
+            path.write_bytes(b"png")
+            return path
+
+        DashboardComposer.render = render
+        result = CliRunner().invoke(app, ["dashboard", sys.argv[1], "--output-dir", sys.argv[2]])
+        sys.stdout.write(result.stdout)
+        sys.exit(result.exit_code)
+    """)
+    spec_file = tmp_path / "specs.json"
+    spec_file.write_text(json.dumps([{"widgets": []}] * 2))
+
+    proc = subprocess.run(
+        [sys.executable, "-c", script, str(spec_file), str(tmp_path)],
+        capture_output=True, text=True,
+    )
+
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    output = json.loads(proc.stdout)
+    assert output["success"] is True
+    assert len(output["output_files"]) == 2
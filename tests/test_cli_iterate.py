@@ -0,0 +1,59 @@
+"""Tests for early rendering while feedback interpretation streams."""
+
+import asyncio
+
+from aech_cli_visualize.iterate.modifier import SpecModification, SpecModifier
+from aech_cli_visualize.main import _interpret_and_render
+
+
+SPEC = {"layout": {"rows": 2}, "widgets": []}
+
+
+class StreamingModifier(SpecModifier):
+    """Yield fixed partial snapshots instead of calling a model."""
+
+    def __init__(self, snapshots: list[dict]):
+        super().__init__(model="test", use_cache=False)
+        self.snapshots = snapshots
+
+    async def interpret_feedback_stream(self, feedback, spec, image_bytes=None):
+        for snapshot in self.snapshots:
+            yield SpecModification.model_validate(snapshot)
+
+
+def _run(snapshots):
+    rendered: list[dict] = []
+
+    def render(spec):
+        rendered.append(spec)
+        return f"render-{len(rendered)}.png"
+
+    result = asyncio.run(_interpret_and_render(
+        StreamingModifier(snapshots), SPEC, "three rows", None, render
+    ))
+    return result, rendered
+
+
+def test_reasoning_streamed_first_does_not_start_an_early_render():
+    final = {"reasoning": "more rows", "style": None, "widget_modifications": [], "layout_changes": {"rows": 3}}
+    partial_layout = {"reasoning": "more rows", "style": None, "widget_modifications": [], "layout_changes": {}}
+
+    (_, new_spec, output_path), rendered = _run([{"reasoning": "more"}, partial_layout, final])
+
+    # Only the final modifications are rendered
+    assert rendered == [new_spec]
+    assert new_spec["layout"]["rows"] == 3
+    assert output_path == "render-1.png"
+
+
+def test_reasoning_streamed_last_reuses_the_early_render():
+    fields = {"style": None, "widget_modifications": [], "layout_changes": {"rows": 3}}
+
+    (_, new_spec, output_path), rendered = _run([
+        {**fields, "reasoning": "more"},
+        {**fields, "reasoning": "more rows"},
+    ])
+
+    assert rendered == [new_spec]
+    assert new_spec["layout"]["rows"] == 3
+    assert output_path == "render-1.png"
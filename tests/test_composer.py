@@ -0,0 +1,107 @@
+"""Tests for dashboard composition caching."""
+
+import math
+from datetime import datetime
+
+import plotly.io as pio
+import pytest
+
+from aech_cli_visualize.dashboard import composer as composer_module
+from aech_cli_visualize.dashboard.composer import DashboardComposer
+
+
+def _kpi(value, col=0):
+    return {
+        "type": "kpi",
+        "position": {"row": 0, "col": col, "colspan": 6},
+        "config": {"value": value, "label": "Revenue"},
+    }
+
+
+def _gauge(value):
+    return {
+        "type": "gauge",
+        "position": {"row": 1, "col": 0, "colspan": 12},
+        "config": {"value": value, "min": 0, "max": 100, "label": "Score"},
+    }
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    composer_module._COMPOSE_CACHE.clear()
+    yield
+    composer_module._COMPOSE_CACHE.clear()
+
+
+def _uncached(spec):
+    composer_module._COMPOSE_CACHE.clear()
+    return pio.to_json(DashboardComposer(spec).compose())
+
+
+def _line(x):
+    return {
+        "type": "chart",
+        "position": {"row": 0, "col": 0, "colspan": 12},
+        "config": {"chart_type": "line", "data": {"x": x, "y": [1, 2]}},
+    }
+
+
+def test_nan_spec_is_not_served_the_figure_of_its_null_twin():
+    # NaN and None both serialize to null, so the specs share a cache key
+    with_none = {"widgets": [_kpi(None), _gauge(None)]}
+    with_nan = {"widgets": [_kpi(math.nan), _gauge(math.nan)]}
+    DashboardComposer(with_none).compose()
+
+    composed = pio.to_json(DashboardComposer(with_nan).compose())
+
+    assert composed == _uncached(with_nan)
+    assert composed != _uncached(with_none)
+
+
+@pytest.mark.parametrize("first, second", [
+    # orjson writes datetimes as ISO strings
+    (
+        {"widgets": [_line(["2025-01-01T00:00:00", "2025-01-02T00:00:00"])]},
+        {"widgets": [_line([datetime(2025, 1, 1), datetime(2025, 1, 2)])]},
+    ),
+    # Tuples serialize as lists and int keys as strings
+    ({"widgets": [_kpi(5)], "layout": {"rows": 1}}, {"widgets": (_kpi(5),), "layout": {"rows": 1}}),
+    ({"widgets": [_kpi(5)], "meta": {"1": "a"}}, {"widgets": [_kpi(5)], "meta": {1: "a"}}),
+])
+def test_non_json_specs_compose_like_an_uncached_build(first, second):
+    DashboardComposer(first).compose()
+
+    composed = pio.to_json(DashboardComposer(second).compose())
+
+    assert composed == _uncached(second)
+
+
+def test_equal_spec_reuses_the_cached_figure(monkeypatch):
+    spec = {"widgets": [_kpi(math.nan), _gauge(40)]}
+    first = DashboardComposer(spec).compose()
+    builds = 0
+    build = DashboardComposer._build_figure
+
+    def counting_build(self):
+        nonlocal builds
+        builds += 1
+        return build(self)
+
+    monkeypatch.setattr(DashboardComposer, "_build_figure", counting_build)
+
+    second = DashboardComposer(spec).compose()
+
+    assert builds == 0
+    assert pio.to_json(second) == pio.to_json(first)
+    # Each caller gets its own figure
+    assert second is not first
+
+
+def test_widgets_with_colliding_configs_are_built_separately():
+    spec = {"widgets": [_kpi(None), _kpi(math.nan, col=6)]}
+    composer = DashboardComposer(spec)
+
+    figures = [fig for *_, fig in composer._iter_widget_figures(spec["widgets"])]
+
+    assert figures[0] == composer._create_widget_figure(spec["widgets"][0])
+    assert pio.to_json(figures[1]) == pio.to_json(composer._create_widget_figure(spec["widgets"][1]))
@@ -0,0 +1,74 @@
+"""Tests for multi-format figure export."""
+
+from types import SimpleNamespace
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytest
+
+from aech_cli_visualize.dashboard.composer import DashboardComposer
+from aech_cli_visualize.utils import export
+from aech_cli_visualize.utils.export import export_figures
+
+
+@pytest.fixture
+def write_images(monkeypatch):
+    """Record batched Kaleido exports instead of starting Chrome."""
+    calls: list[dict] = []
+
+    def fake_write_images(figs, paths, format, **kwargs):
+        calls.append({"figs": figs, "paths": paths, "format": format, **kwargs})
+        for path in paths:
+            open(path, "wb").close()
+
+    monkeypatch.setattr(pio, "write_images", fake_write_images, raising=False)
+    return calls
+
+
+def test_export_figures_uses_one_export_call(tmp_path, write_images):
+    fig = go.Figure(go.Bar(x=["a", "b"], y=[1, 2]))
+
+    paths = export_figures(fig, tmp_path / "out", "chart", ["png", "svg", "pdf"], width=800, height=600)
+
+    assert paths == [tmp_path / "out" / f"chart.{fmt}" for fmt in ("png", "svg", "pdf")]
+    assert len(write_images) == 1
+    call = write_images[0]
+    assert call["format"] == ["png", "svg", "pdf"]
+    assert call["paths"] == [str(p) for p in paths]
+    # The figure is serialized once and shared by every format
+    assert all(f is call["figs"][0] for f in call["figs"])
+    assert (call["width"], call["height"]) == (800, 600)
+
+
+def test_export_figures_falls_back_to_one_call_per_format(tmp_path, monkeypatch):
+    # plotly<6.1 has no batched write_images
+    monkeypatch.setattr(export, "pio", SimpleNamespace())
+    written: list[tuple[str, str]] = []
+
+    def fake_write_image(self, path, format, **kwargs):
+        written.append((path, format))
+
+    monkeypatch.setattr(go.Figure, "write_image", fake_write_image)
+
+    export_figures(go.Figure(), tmp_path, "chart", ["png", "svg"])
+
+    assert written == [(str(tmp_path / "chart.png"), "png"), (str(tmp_path / "chart.svg"), "svg")]
+
+
+def test_render_many_composes_once(tmp_path, write_images, monkeypatch):
+    composer = DashboardComposer({"widgets": []})
+    composed = 0
+    compose = DashboardComposer.compose
+
+    def counting_compose(self):
+        nonlocal composed
+        composed += 1
+        return compose(self)
+
+    monkeypatch.setattr(DashboardComposer, "compose", counting_compose)
+
+    paths = composer.render_many(tmp_path, formats=["png", "svg"], resolution="720p")
+
+    assert composed == 1
+    assert [p.name for p in paths] == ["dashboard.png", "dashboard.svg"]
+    assert (write_images[0]["width"], write_images[0]["height"]) == (1280, 720)
@@ -0,0 +1,28 @@
+"""Tests for field type inference and schema fingerprints."""
+
+from aech_cli_visualize.config import fingerprint
+from aech_cli_visualize.config.fingerprint import compute_schema_fingerprint, infer_field_type
+
+
+def test_unhashable_columns_are_classified():
+    assert infer_field_type([{"a": 1}, {"b": 2}]) == "object"
+    assert infer_field_type([[1], [2, 3]]) == "array"
+
+
+def test_bool_and_numeric_columns_with_equal_values_stay_distinct():
+    # True == 1, so a cache keyed on values alone would mix these up
+    assert infer_field_type([True, False]) == "boolean"
+    assert infer_field_type([1, 0]) == "numeric"
+    assert infer_field_type([True, False]) == "boolean"
+
+
+def test_known_field_types_skip_inference(monkeypatch):
+    data = {"month": ["2025-01", "2025-02"], "revenue": [1, 2]}
+    expected = compute_schema_fingerprint(data)
+    calls = []
+    monkeypatch.setattr(fingerprint, "infer_field_type", lambda values: calls.append(values))
+
+    result = compute_schema_fingerprint(data, field_types={"month": "temporal", "revenue": "numeric"})
+
+    assert calls == []
+    assert result == expected
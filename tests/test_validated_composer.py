@@ -0,0 +1,285 @@
+"""Tests for the validated composer's speculative and beam-search paths."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from aech_cli_visualize.dashboard.composer import DashboardComposer
+from aech_cli_visualize.dashboard.validated_composer import ValidatedDashboardComposer
+from aech_cli_visualize.validation import CorrectionEngine, LayoutCorrection, LayoutIssue, ValidationResult
+
+
+def _result(acceptable: bool, issue_type: str = "spacing") -> ValidationResult:
+    issues = [] if acceptable else [LayoutIssue(
+        issue_type=issue_type,
+        description="widgets too close",
+        affected_widgets=[0],
+        severity="major",
+        suggested_fix="x",
+    )]
+    return ValidationResult(is_acceptable=acceptable, confidence=0.9, reasoning="", issues=issues)
+
+
+class ScriptedValidator:
+    """Returns the scripted results in order, one per evaluation."""
+
+    def __init__(self, script: list[ValidationResult]):
+        self.script = list(script)
+
+    async def aevaluate(self, image_path, spec, batch_client=None):
+        return self.script.pop(0)
+
+
+class StepEngine:
+    """Correction engine whose only correction bumps spec["step"] by one.
+
+    The predicted and real corrections always agree, so every speculative
+    render matches the spec the loop moves on to.
+    """
+
+    def compute_corrections(self, result, spec):
+        return [LayoutCorrection(action="adjust_padding", target="layout")]
+
+    def apply_corrections(self, spec, corrections):
+        return {**spec, "step": spec.get("step", 0) + 1}
+
+    def overlap_count(self, spec):
+        return 0
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Replace the Kaleido render with one that writes the spec's step.
+
+    Speculative renders wait for the returned event, so tests can hold one
+    in flight.
+    """
+    log: list[str] = []
+    release = threading.Event()
+    release.set()
+
+    def fake_render(self, output_dir, filename="dashboard", format="png", resolution="1080p", scale=2.0):
+        if filename.endswith("_speculative"):
+            assert release.wait(5)
+        path = Path(output_dir) / f"{filename}.{format}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(str(self.spec.get("step", 0)))
+        log.append(filename)
+        return path
+
+    monkeypatch.setattr(DashboardComposer, "render", fake_render)
+    return log, release
+
+
+SPEC = {
+    "widgets": [
+        {"type": "kpi", "position": {"row": 0, "col": 0, "colspan": 6}, "config": {"value": 1, "label": "A"}},
+        {"type": "kpi", "position": {"row": 0, "col": 6, "colspan": 6}, "config": {"value": 2, "label": "B"}},
+    ],
+}
+
+
+def _composer(
+    script: list[ValidationResult],
+    max_iterations: int = 3,
+    engine: Any = None,
+    speculate: bool = True,
+) -> ValidatedDashboardComposer:
+    composer = ValidatedDashboardComposer(
+        spec=SPEC,
+        enable_vlm_validation=False,
+        max_iterations=max_iterations,
+        beam_width=1,
+        speculate=speculate,
+    )
+    composer.enable_vlm_validation = True
+    composer.validator = ScriptedValidator(script)  # type: ignore[assignment]
+    composer.correction_engine = engine or StepEngine()
+    return composer
+
+
+def _wait_for_cleanup(directory: Path, log: list[str], filename: str) -> list[str]:
+    """Wait for a discarded render to finish and its file to be removed."""
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        leftover = [p.name for p in directory.iterdir() if "_speculative" in p.name]
+        if filename in log and not leftover:
+            return []
+        time.sleep(0.01)
+    return leftover
+
+
+def test_matching_speculative_render_is_reused(tmp_path, renders):
+    log, _ = renders
+    composer = _composer([
+        _result(False, "spacing"),
+        _result(False, "readability"),
+        _result(True),
+    ])
+
+    result = composer.render(tmp_path)
+
+    # Iteration 2 was rendered speculatively during iteration 1 and not redone
+    assert log == ["dashboard", "dashboard_iter1", "dashboard_iter2_speculative"]
+    assert result.iterations == 3
+    assert result.path == tmp_path / "dashboard_iter2.png"
+    assert result.path.read_text() == "2"
+    assert not (tmp_path / "dashboard_iter2_speculative.png").exists()
+
+
+def test_unused_speculative_render_is_discarded_without_waiting(tmp_path, renders):
+    log, release = renders
+    release.clear()
+    composer = _composer([_result(False, "spacing"), _result(True)])
+
+    # The speculative render for iteration 2 is still blocked when this returns
+    result = composer.render(tmp_path)
+
+    assert result.iterations == 2
+    assert result.path == tmp_path / "dashboard_iter1.png"
+    assert "dashboard_iter2_speculative" not in log
+
+    release.set()
+    assert _wait_for_cleanup(tmp_path, log, "dashboard_iter2_speculative") == []
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["dashboard.png", "dashboard_iter1.png"]
+
+
+def test_speculation_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("AECH_VLM_SPECULATE", raising=False)
+
+    composer = ValidatedDashboardComposer(spec=SPEC, enable_vlm_validation=False)
+
+    assert composer.speculate is False
+
+
+def test_speculation_with_the_real_engine_matches_a_plain_run(tmp_path, renders):
+    log, _ = renders
+    script = [_result(False, "spacing"), _result(False, "readability"), _result(True)]
+
+    plain = _composer(script, engine=CorrectionEngine(), speculate=False).render(tmp_path / "plain")
+    assert not any(name.endswith("_speculative") for name in log)
+    log.clear()
+
+    result = _composer(script, engine=CorrectionEngine()).render(tmp_path / "speculative")
+
+    # The engine's prediction from the spacing issue misses the readability
+    # fix, so the speculative render is thrown away and iteration 2 rerendered
+    assert "dashboard_iter2" in log
+    assert result.final_spec == plain.final_spec
+    assert result.corrections_applied == plain.corrections_applied
+    assert result.path.name == plain.path.name == "dashboard_iter2.png"
+    assert _wait_for_cleanup(tmp_path / "speculative", log, "dashboard_iter2_speculative") == []
+
+
+def test_render_works_inside_a_running_event_loop(tmp_path, renders):
+    composer = _composer([_result(True)])
+
+    async def call_sync_render():
+        return composer.render(tmp_path)
+
+    result = asyncio.run(call_sync_render())
+
+    assert result.iterations == 1
+    assert result.path == tmp_path / "dashboard.png"
+
+
+def test_beam_search_keeps_the_best_candidate(tmp_path, renders):
+    composer = _composer([])
+
+    class RankingValidator:
+        async def aevaluate(self, image_path, spec, batch_client=None):
+            return _result(spec["step"] == 2)
+
+    composer.validator = RankingValidator()  # type: ignore[assignment]
+    specs = [{"step": 1}, {"step": 2}, {"step": 3}]
+
+    picked = asyncio.run(composer._beam_search(
+        DashboardComposer({"widgets": []}), specs, tmp_path, "dashboard_iter1",
+        "png", "1080p", 2.0,
+    ))
+
+    assert not isinstance(picked, Exception)
+    index, path, result = picked
+    assert index == 1
+    assert result.is_acceptable
+    # The winner takes the iteration's name; the losing renders are removed
+    assert path == tmp_path / "dashboard_iter1.png"
+    assert path.read_text() == "2"
+    assert [p.name for p in tmp_path.iterdir()] == ["dashboard_iter1.png"]
+
+
+def test_beam_search_returns_error_when_no_candidate_validates(tmp_path, renders):
+    composer = _composer([])
+    error = RuntimeError("vlm down")
+
+    class FailingValidator:
+        async def aevaluate(self, image_path, spec, batch_client=None):
+            raise error
+
+    composer.validator = FailingValidator()  # type: ignore[assignment]
+
+    picked = asyncio.run(composer._beam_search(
+        DashboardComposer({"widgets": []}), [{"step": 1}, {"step": 2}], tmp_path,
+        "dashboard_iter1", "png", "1080p", 2.0,
+    ))
+
+    assert picked is error
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture
+def flaky_renders(renders, monkeypatch):
+    """Make renders of the spec with step 2 fail."""
+    fake_render = DashboardComposer.render
+
+    def flaky_render(self, *args, **kwargs):
+        if self.spec.get("step") == 2:
+            raise RuntimeError("chrome crashed")
+        return fake_render(self, *args, **kwargs)
+
+    monkeypatch.setattr(DashboardComposer, "render", flaky_render)
+    return renders
+
+
+def test_beam_search_drops_a_candidate_whose_render_fails(tmp_path, flaky_renders):
+    composer = _composer([])
+
+    class RankingValidator:
+        async def aevaluate(self, image_path, spec, batch_client=None):
+            return _result(spec["step"] == 3)
+
+    composer.validator = RankingValidator()  # type: ignore[assignment]
+
+    picked = asyncio.run(composer._beam_search(
+        DashboardComposer({"widgets": []}), [{"step": 1}, {"step": 2}, {"step": 3}],
+        tmp_path, "dashboard_iter1", "png", "1080p", 2.0,
+    ))
+
+    assert not isinstance(picked, Exception)
+    index, path, _ = picked
+    assert index == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["dashboard_iter1.png"]
+    assert path.read_text() == "3"
+
+
+def test_beam_search_raises_the_render_error_when_nothing_validates(tmp_path, flaky_renders):
+    composer = _composer([])
+
+    class FailingValidator:
+        async def aevaluate(self, image_path, spec, batch_client=None):
+            raise RuntimeError("vlm down")
+
+    composer.validator = FailingValidator()  # type: ignore[assignment]
+
+    with pytest.raises(RuntimeError, match="chrome crashed"):
+        asyncio.run(composer._beam_search(
+            DashboardComposer({"widgets": []}), [{"step": 1}, {"step": 2}],
+            tmp_path, "dashboard_iter1", "png", "1080p", 2.0,
+        ))
+
+    # The candidate that did render is removed too
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,88 @@
+"""Tests for the persistent VLM response cache."""
+
+import asyncio
+import threading
+
+from aech_cli_visualize.iterate.modifier import SpecModifier
+from aech_cli_visualize.validation import ValidationResult, VLMCache, VLMValidator
+from aech_cli_visualize.validation import cache as cache_module
+
+
+SPEC = {"widgets": []}
+
+
+def _key(cache: VLMCache, n: int) -> bytes:
+    return cache.make_key("test", None, {"n": n})  # type: ignore[return-value]
+
+
+def test_oldest_entries_are_evicted_past_max_entries(tmp_path):
+    cache = VLMCache(tmp_path, max_entries=3)
+    for n in range(5):
+        cache.set(_key(cache, n), str(n))
+
+    assert [cache.get(_key(cache, n)) for n in range(5)] == [None, None, "2", "3", "4"]
+
+    # Rewriting an entry makes it the newest
+    cache.set(_key(cache, 2), "2")
+    cache.set(_key(cache, 5), "5")
+    assert [cache.get(_key(cache, n)) for n in range(2, 6)] == ["2", None, "4", "5"]
+
+
+def test_key_changes_with_the_cache_version(tmp_path, monkeypatch):
+    cache = VLMCache(tmp_path)
+    before = _key(cache, 0)
+
+    monkeypatch.setattr(cache_module, "CACHE_VERSION", cache_module.CACHE_VERSION + 1)
+
+    assert _key(cache, 0) != before
+
+
+def test_validator_key_changes_with_image_size_and_instructions(tmp_path, monkeypatch):
+    monkeypatch.setenv("AECH_VLM_CACHE_DIR", str(tmp_path))
+    validator = VLMValidator(model="test")
+    image = tmp_path / "d.png"
+    image.write_bytes(b"png")
+    before = validator._cache_lookup(image, SPEC)[0]
+
+    monkeypatch.setenv("AECH_VLM_IMAGE_MAX_DIM", "800")
+    smaller = validator._cache_lookup(image, SPEC)[0]
+    monkeypatch.setattr(
+        "aech_cli_visualize.validation.vlm_validator.VALIDATION_INSTRUCTIONS", "Be strict."
+    )
+    reworded = validator._cache_lookup(image, SPEC)[0]
+
+    assert len({before, smaller, reworded}) == 3
+
+
+def test_modifier_key_changes_with_thinking(tmp_path, monkeypatch):
+    monkeypatch.setenv("AECH_VLM_CACHE_DIR", str(tmp_path))
+
+    keys = {
+        SpecModifier(model="test", enable_thinking=thinking)._cache_lookup("bigger", SPEC, None)[0]
+        for thinking in (True, False)
+    }
+
+    assert len(keys) == 2
+
+
+def test_aevaluate_uses_the_cache_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setenv("AECH_VLM_CACHE_DIR", str(tmp_path))
+    validator = VLMValidator(model="test")
+    image = tmp_path / "d.png"
+    image.write_bytes(b"png")
+    stored = ValidationResult(is_acceptable=True, confidence=1.0, reasoning="cached")
+    validator._cache_store(validator._cache_lookup(image, SPEC)[0], stored)
+
+    threads = []
+    get = VLMCache.get
+
+    def recording_get(self, key):
+        threads.append(threading.current_thread())
+        return get(self, key)
+
+    monkeypatch.setattr(VLMCache, "get", recording_get)
+
+    result = asyncio.run(validator.aevaluate(image, SPEC))
+
+    assert result == stored
+    assert threads and threading.main_thread() not in threads